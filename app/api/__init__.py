@@ -1,4 +1,12 @@
-from .v1 import country_api, satellite_api, region_api, coverage_zone_api, user_api
+from .v1 import (
+    country_api,
+    satellite_api,
+    region_api,
+    coverage_zone_api,
+    user_api,
+    metrics_api,
+    orbit_api,
+)
 from .v1.auth import endpoints as auth_api
 
 __all__ = [
@@ -8,4 +16,6 @@ __all__ = [
     "coverage_zone_api",
     "user_api",
     "auth_api",
+    "metrics_api",
+    "orbit_api",
 ]
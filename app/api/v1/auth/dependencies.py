@@ -2,6 +2,7 @@ from app.schemas import AuthRequest, UserRole
 from app.service import create_token_service, create_user_service
 from app.core import (
     get_db,
+    settings,
     AccessTokenExpiredError,
     InvalidAccessToken,
 )
@@ -31,15 +32,27 @@ async def get_current_user(
 ):
     token_service = create_token_service(db)
     try:
-        user_id = await token_service.decode_access_token(token)
         user_service = create_user_service(db)
-        user_in_db = await user_service.get_user_by_id(user_id.id)
-        if user_in_db is None:
+        if settings.AUTH_TRUST_TOKEN_CLAIMS:
+            user_id, role = await token_service.decode_access_token_claims(token)
+            if role != UserRole.ADMIN:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Insufficient permissions",
+                )
+            user_status = await user_service.get_user_auth_status(user_id)
+            user_exists, user_role = user_status.exists, user_status.role
+        else:
+            user_id = await token_service.decode_access_token(token)
+            user_in_db = await user_service.get_user_by_id(user_id.id)
+            user_exists = user_in_db is not None
+            user_role = user_in_db.role if user_exists else None
+        if not user_exists:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="The access token contains a non-existent user ID",
             )
-        if user_in_db.role != UserRole.ADMIN.value:
+        if user_role != UserRole.ADMIN.value:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
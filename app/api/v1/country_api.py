@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Path, Depends, status, Query
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from app.service import CountryService
 from app.schemas import (
     CountryInDB,
     CountryCreate,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     CountryUpdate,
     SatelliteInDB,
 )
-from app.api.v1.helpers import raise_if_object_none, get_country_service
+from app.api.v1.helpers import (
+    raise_if_object_none,
+    get_country_service,
+    validated_response,
+    ORJSONResponse,
+)
 from app.api.v1.auth import get_current_user
 
 router = APIRouter()
@@ -130,6 +137,29 @@ async def get_countries(
     )
 
 
+@router.get(
+    "/list/page/",
+    response_model=CursorPage[CountryInDB],
+    summary="Get a page of countries by cursor",
+    description="Keyset pagination ordered by primary key. "
+    "Pass next_cursor from the previous page to get the next one.",
+    responses={
+        400: {"description": "Invalid cursor"},
+        200: {"description": "Countries page", "model": CursorPage[CountryInDB]},
+    },
+)
+async def get_countries_page(
+    country_service=Depends(get_country_service),
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[Optional[str], Query(max_length=200)] = None,
+) -> CursorPage[CountryInDB]:
+    page = await country_service.get_countries_page(
+        CursorPagination(limit=limit, cursor=cursor)
+    )
+    await raise_if_object_none(page, status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+    return page
+
+
 @router.put(
     "/{country_id}",
     response_model=CountryInDB,
@@ -176,10 +206,10 @@ async def update_country(
 async def get_satellites_by_country_id(
     country_id: CountryID,
     country_service=Depends(get_country_service),
-) -> List[SatelliteInDB]:
+) -> ORJSONResponse:
     satellite_list = await country_service.get_satellites_by_country_id(country_id)
     if satellite_list is None:
         await raise_if_object_none(
             satellite_list, status.HTTP_404_NOT_FOUND, "Country not found"
         )
-    return satellite_list
+    return validated_response(satellite_list)
@@ -9,20 +9,30 @@ from fastapi import (
     HTTPException,
 )
 from typing import Annotated, List, Union, Optional
-from app.api.v1.helpers import raise_if_object_none
+from app.api.v1.helpers import (
+    raise_if_object_none,
+    validated_response,
+    ORJSONResponse,
+)
 from app.schemas import (
     CoverageZoneInDB,
     ZoneRegionDetails,
     SatelliteInDB,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     NumberOfZones,
     RegionBase,
     SubregionCreate,
     SubregionBase,
     SubregionCreateByName,
+    FootprintGeometry,
+    TheoreticalFootprintRequest,
+    TheoreticalFootprint,
+    RegionAssignment,
 )
 from app.service import CoverageZoneService
-from app.api.v1.satellite_api import InternationalCode
+from app.api.v1.satellite_api import InternationalCode, Longitude
 
 router = APIRouter()
 from app.api.v1.helpers import (
@@ -71,7 +81,7 @@ async def get_coverage_zone_by_id(
 async def get_list_coverage_zone_by_satellite_international_code(
     satellite_international_code: InternationalCode,
     coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
-) -> List[CoverageZoneInDB]:
+) -> ORJSONResponse:
     coverage_zone_list = (
         await coverage_zone_service.get_coverage_zones_by_satellite_international_code(
             satellite_international_code
@@ -81,7 +91,7 @@ async def get_list_coverage_zone_by_satellite_international_code(
         await raise_if_object_none(
             coverage_zone_list, status.HTTP_404_NOT_FOUND, "Satellite not found"
         )
-    return coverage_zone_list
+    return validated_response(coverage_zone_list)
 
 
 @router.get(
@@ -146,6 +156,32 @@ async def get_coverage_zones(
     return zone_list
 
 
+@router.get(
+    "/coverage_zones/page/",
+    response_model=CursorPage[CoverageZoneInDB],
+    summary="Get a page of coverage zones by cursor",
+    description="Keyset pagination ordered by primary key. "
+    "Pass next_cursor from the previous page to get the next one.",
+    responses={
+        400: {"description": "Invalid cursor"},
+        200: {
+            "description": "Coverage zones page",
+            "model": CursorPage[CoverageZoneInDB],
+        },
+    },
+)
+async def get_coverage_zones_page(
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[Optional[str], Query(max_length=200)] = None,
+) -> CursorPage[CoverageZoneInDB]:
+    page = await coverage_zone_service.get_coverage_zones_page(
+        CursorPagination(limit=limit, cursor=cursor)
+    )
+    await raise_if_object_none(page, status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+    return page
+
+
 @router.get(
     "/coverage_zones/count/",
     response_model=NumberOfZones,
@@ -266,6 +302,32 @@ async def add_regions_by_coverage_zone_id(
         )
 
 
+@router.post(
+    path="/regions/{coverage_zone_id}/auto/",
+    response_model=RegionAssignment,
+    summary="Assign regions to the coverage zone by its footprint",
+    description="Attaches every region and subregion whose stored boundary "
+    "intersects the zone footprint; regions of the found subregions are attached "
+    "too. Already attached ones are skipped.",
+    responses={
+        404: {"description": "Coverage zone footprint not found"},
+        200: {"description": "Regions assigned", "model": RegionAssignment},
+    },
+)
+async def assign_regions_by_footprint(
+    coverage_zone_id: CoverageZoneId,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+    _auth=Depends(get_current_user),
+) -> RegionAssignment:
+    assignment = await coverage_zone_service.assign_regions_from_footprint(
+        coverage_zone_id
+    )
+    await raise_if_object_none(
+        assignment, status.HTTP_404_NOT_FOUND, "Coverage zone footprint not found"
+    )
+    return assignment
+
+
 @router.delete(
     "/{coverage_zone_id}/region_name/{region_name}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -454,3 +516,188 @@ async def update_coverage_zone(
         "(e.g., invalid data or constraints violation)",
     )
     return coverage_zone_updated
+
+
+Latitude = Annotated[float, Query(ge=-90, le=90, description="Degrees north")]
+
+
+@router.put(
+    "/footprint/{coverage_zone_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Set coverage zone footprint",
+    description="Stores the footprint polygon of the coverage zone (GeoJSON Polygon, "
+    "positions as [longitude, latitude]), replacing the previous one. Edges follow "
+    "the shorter way in longitude, so a footprint may cross the antimeridian.",
+    responses={
+        404: {"description": "Coverage zone not found"},
+        204: {"description": "Footprint has been saved"},
+    },
+)
+async def set_coverage_zone_footprint(
+    geometry: FootprintGeometry,
+    coverage_zone_id: CoverageZoneId,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+    _auth=Depends(get_current_user),
+):
+    result = await coverage_zone_service.set_footprint(coverage_zone_id, geometry)
+    await raise_if_object_none(
+        result, status.HTTP_404_NOT_FOUND, "Coverage zone not found"
+    )
+
+
+@router.post(
+    "/footprint/theoretical/{satellite_international_code}",
+    response_model=TheoreticalFootprint,
+    summary="Compute theoretical GEO footprint",
+    description="Computes the visibility footprint (minimum elevation contour) of "
+    "a geostationary satellite from its orbital longitude and, if a spot beam is "
+    "given, its EIRP contours. Results are cached by parameters.",
+    responses={
+        404: {"description": "Satellite not found or its longitude is unknown"},
+        422: {"description": "Invalid parameters or boresight is not visible"},
+        200: {"description": "Footprint computed", "model": TheoreticalFootprint},
+    },
+)
+async def get_theoretical_footprint(
+    request: TheoreticalFootprintRequest,
+    satellite_international_code: InternationalCode,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+) -> TheoreticalFootprint:
+    try:
+        footprint = await coverage_zone_service.get_theoretical_footprint(
+            satellite_international_code, request
+        )
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error)
+        )
+    await raise_if_object_none(
+        footprint,
+        status.HTTP_404_NOT_FOUND,
+        "Satellite not found or its longitude is unknown",
+    )
+    return footprint
+
+
+@router.post(
+    "/footprint/{coverage_zone_id}/generate/",
+    response_model=FootprintGeometry,
+    summary="Generate coverage zone footprint",
+    description="Computes the theoretical footprint of the zone satellite and "
+    "stores it as the zone footprint: the lowest EIRP contour if a spot beam "
+    "is given, otherwise the visibility footprint",
+    responses={
+        404: {
+            "description": "Coverage zone not found or satellite longitude is unknown"
+        },
+        422: {"description": "Invalid parameters or boresight is not visible"},
+        200: {"description": "Footprint saved", "model": FootprintGeometry},
+    },
+)
+async def generate_coverage_zone_footprint(
+    request: TheoreticalFootprintRequest,
+    coverage_zone_id: CoverageZoneId,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+    _auth=Depends(get_current_user),
+) -> FootprintGeometry:
+    try:
+        geometry = await coverage_zone_service.generate_footprint(
+            coverage_zone_id, request
+        )
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error)
+        )
+    await raise_if_object_none(
+        geometry,
+        status.HTTP_404_NOT_FOUND,
+        "Coverage zone not found or satellite longitude is unknown",
+    )
+    return geometry
+
+
+@router.get(
+    "/footprint/{coverage_zone_id}",
+    response_model=FootprintGeometry,
+    summary="Get coverage zone footprint",
+    responses={
+        404: {"description": "Footprint not found"},
+        200: {"description": "Footprint found", "model": FootprintGeometry},
+    },
+)
+async def get_coverage_zone_footprint(
+    coverage_zone_id: CoverageZoneId,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+) -> FootprintGeometry:
+    geometry = await coverage_zone_service.get_footprint(coverage_zone_id)
+    await raise_if_object_none(
+        geometry, status.HTTP_404_NOT_FOUND, "Footprint not found"
+    )
+    return geometry
+
+
+@router.delete(
+    "/footprint/{coverage_zone_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete coverage zone footprint",
+    responses={
+        404: {"description": "Footprint not found"},
+        204: {"description": "Footprint has been deleted"},
+    },
+)
+async def delete_coverage_zone_footprint(
+    coverage_zone_id: CoverageZoneId,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+    _auth=Depends(get_current_user),
+):
+    result = await coverage_zone_service.delete_footprint(coverage_zone_id)
+    await raise_if_object_none(result, status.HTTP_404_NOT_FOUND, "Footprint not found")
+
+
+@router.get(
+    "/coverage/point/",
+    response_model=List[CoverageZoneInDB],
+    summary="Get coverage zones covering a point",
+    description="Returns every coverage zone whose footprint contains the point, "
+    "with its transmitter type and satellite code, ordered by zone id",
+    responses={
+        200: {"description": "Coverage zones", "model": List[CoverageZoneInDB]},
+    },
+)
+async def get_coverage_zones_at_point(
+    latitude: Latitude,
+    longitude: Longitude,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+) -> ORJSONResponse:
+    return validated_response(
+        await coverage_zone_service.get_coverage_zones_at_point(longitude, latitude)
+    )
+
+
+@router.get(
+    "/coverage/bbox/",
+    response_model=List[CoverageZoneInDB],
+    summary="Get coverage zones intersecting a bounding box",
+    description="Returns every coverage zone whose footprint intersects the box, "
+    "ordered by zone id. If west is greater than east the box wraps across "
+    "the antimeridian (e.g. west=170, east=-170).",
+    responses={
+        200: {"description": "Coverage zones", "model": List[CoverageZoneInDB]},
+        422: {"description": "south is greater than north"},
+    },
+)
+async def get_coverage_zones_in_box(
+    west: Longitude,
+    south: Latitude,
+    east: Longitude,
+    north: Latitude,
+    coverage_zone_service: CoverageZoneService = Depends(get_coverage_zone_service),
+) -> ORJSONResponse:
+    if south > north:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="south must not be greater than north",
+        )
+    return validated_response(
+        await coverage_zone_service.get_coverage_zones_in_box(west, south, east, north)
+    )
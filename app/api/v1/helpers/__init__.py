@@ -6,7 +6,9 @@ from .helpers import (
     get_satellite_service,
     get_country_service,
     get_token_service,
+    get_orbit_service,
 )
+from .responses import ORJSONResponse, validated_response
 from .helpers_coverage_zone import (
     CoverageZoneId,
     RegionName,
@@ -30,4 +32,7 @@ __all__ = [
     "get_satellite_service",
     "get_country_service",
     "get_token_service",
+    "get_orbit_service",
+    "ORJSONResponse",
+    "validated_response",
 ]
@@ -8,6 +8,7 @@ from app.service import (
     create_satellite_service,
     create_country_service,
     create_token_service,
+    create_orbit_service,
 )
 
 
@@ -38,3 +39,7 @@ async def get_country_service(db: AsyncSession = Depends(get_db)):
 
 async def get_token_service(db: AsyncSession = Depends(get_db)):
     return create_token_service(db)
+
+
+async def get_orbit_service(db: AsyncSession = Depends(get_db)):
+    return create_orbit_service(db)
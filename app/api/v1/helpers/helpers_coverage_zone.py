@@ -53,13 +53,12 @@ async def valid_coverage_zone_create(
 ) -> CoverageZoneCreate:
     if not image.content_type.startswith("image/"):
         raise HTTPException(400, "Only image files are allowed")
-    image_data = await image.read()
     try:
         coverage_zone_create = CoverageZoneCreate(
             id=coverage_zone_id,
             transmitter_type=transmitter_type,
             satellite_code=satellite_code,
-            image_data=image_data,
+            image_data=image,
         )
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=e.errors())
@@ -75,8 +74,7 @@ async def valid_coverage_zone_update(
     if image is not None:
         if not image.content_type.startswith("image/"):
             raise HTTPException(400, "Only image files are allowed")
-        image_data = await image.read()
-        update_dict["image_data"] = image_data
+        update_dict["image_data"] = image
     if transmitter_type is not None:
         update_dict["transmitter_type"] = transmitter_type
     if satellite_code is not None:
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Any, List, Optional, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Type[BaseModel], many: bool) -> TypeAdapter:
+    return TypeAdapter(List[model] if many else model)  # type: ignore[valid-type]
+
+
+def _model_adapter(content: Any) -> Optional[TypeAdapter]:
+    """Адаптер для модели или списка моделей одного типа, для прочего None"""
+    if isinstance(content, BaseModel):
+        return _adapter(type(content), False)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        model = type(content[0])
+        if all(type(item) is model for item in content):
+            return _adapter(model, True)
+    return None
+
+
+def _encode(obj: Any) -> Any:
+    """Типы, которые orjson не сериализует сам"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON-ответ без jsonable_encoder. Модель или список моделей одного типа
+    сериализуется сразу в JSON сериализатором pydantic (алиасы, exclude,
+    field_serializer и computed_field учитываются), остальное - через orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        adapter = _model_adapter(content)
+        if adapter is not None:
+            return adapter.dump_json(content, by_alias=True)
+        return orjson.dumps(
+            content,
+            default=_encode,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def validated_response(content: Any, status_code: int = 200) -> ORJSONResponse:
+    """
+    Ответ из уже провалидированных моделей репозитория. Эндпоинт возвращает
+    Response, поэтому FastAPI не проверяет его повторно по response_model,
+    response_model остается только для схемы OpenAPI.
+    """
+    return ORJSONResponse(content, status_code=status_code)
@@ -0,0 +1,57 @@
+from fastapi import APIRouter
+from typing import Dict
+from app.core import pool_monitor
+from app.schemas import HashingPoolStats, CacheStats, DatabasePoolStats
+from app.service import (
+    password_hasher,
+    satellite_cache,
+    user_status_cache,
+    footprint_cache,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/hashing",
+    response_model=HashingPoolStats,
+    summary="Get password hashing pool statistics",
+    description="Returns the bcrypt worker pool size, current queue depth "
+    "and the maximum queue depth observed since startup",
+    responses={
+        200: {"description": "Hashing pool statistics", "model": HashingPoolStats},
+    },
+)
+async def get_hashing_pool_stats() -> HashingPoolStats:
+    return password_hasher.get_stats()
+
+
+@router.get(
+    "/caches",
+    response_model=Dict[str, CacheStats],
+    summary="Get cache statistics",
+    description="Returns size and hit/miss counters of the in-process caches",
+    responses={
+        200: {"description": "Cache statistics", "model": Dict[str, CacheStats]},
+    },
+)
+async def get_cache_stats() -> Dict[str, CacheStats]:
+    return {
+        "satellite_complete_info": satellite_cache.get_stats(),
+        "user_status": user_status_cache.get_stats(),
+        "theoretical_footprint": footprint_cache.get_stats(),
+    }
+
+
+@router.get(
+    "/db_pool",
+    response_model=DatabasePoolStats,
+    summary="Get database connection pool statistics",
+    description="Returns the connection pool size, connections in use and idle, "
+    "saturation and the peak number of connections in use since startup",
+    responses={
+        200: {"description": "Connection pool statistics", "model": DatabasePoolStats},
+    },
+)
+async def get_db_pool_stats() -> DatabasePoolStats:
+    return pool_monitor.get_stats()
@@ -0,0 +1,253 @@
+from datetime import datetime, timezone
+from fastapi import (
+    APIRouter,
+    Path,
+    Depends,
+    status,
+    Query,
+    HTTPException,
+    UploadFile,
+)
+from typing import Annotated, Optional, List
+from app.core import InvalidTLEError, InvalidElementSetFileError
+from app.schemas import (
+    OrbitalElementsBase,
+    OrbitalElementsInDB,
+    TLELines,
+    CatalogPositions,
+    ElementSetFormat,
+    ElementSetIngestReport,
+    PassPredictionRequest,
+    SatelliteVisibility,
+    ConjunctionScreeningRequest,
+    ConjunctionInDB,
+    ConjunctionScreeningStatus,
+)
+from app.orbit import ElementSetReader
+from app.service import OrbitService, screening_job
+from app.api.v1.helpers import raise_if_object_none, get_orbit_service
+from app.api.v1.auth import get_current_user
+
+router = APIRouter()
+
+InternationalCode = Annotated[
+    str,
+    Path(
+        title="The international code of the satellite",
+        description="Unique international designator (e.g. '1999-025A')",
+        examples=["1999-025A", "2023-123B"],
+        max_length=20,
+    ),
+]
+
+
+@router.get(
+    "/positions/",
+    response_model=CatalogPositions,
+    summary="Propagate the whole catalog",
+    description="Returns TEME positions (km) and velocities (km/s) at the given "
+    "epoch for every satellite with orbital elements, computed by SGP4 "
+    "for the whole catalog at once",
+    responses={
+        200: {"description": "Catalog positions", "model": CatalogPositions},
+    },
+)
+async def get_catalog_positions(
+    epoch: Annotated[
+        Optional[datetime], Query(description="Moment in UTC, now by default")
+    ] = None,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+) -> CatalogPositions:
+    if epoch is None:
+        epoch = datetime.now(timezone.utc)
+    elif epoch.tzinfo is None:
+        epoch = epoch.replace(tzinfo=timezone.utc)
+    return await orbit_service.get_catalog_positions(epoch)
+
+
+@router.post(
+    "/passes/",
+    response_model=List[SatelliteVisibility],
+    summary="Predict satellite passes over a ground station",
+    description="Computes azimuth, elevation and range on a time grid for all "
+    "requested satellites at once and returns rise, culmination and set events "
+    "above the minimum elevation. Geostationary satellites also get their "
+    "fixed look angle.",
+    responses={
+        200: {"description": "Satellite passes", "model": List[SatelliteVisibility]},
+    },
+)
+async def predict_passes(
+    request: PassPredictionRequest,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+) -> List[SatelliteVisibility]:
+    return await orbit_service.predict_passes(request)
+
+
+@router.post(
+    "/conjunctions/screen/",
+    response_model=ConjunctionScreeningStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start screening the catalog for close approaches",
+    description="Starts a background run that propagates every satellite with "
+    "orbital elements over the window, finds pairs closer than the threshold using "
+    "a spatial grid per time step and perigee/apogee filters, and replaces "
+    "previously stored results. Large catalogs are split across a process pool. "
+    "Progress and the report are available via GET on the same path; periodic "
+    "runs are better left to `python -m app.orbit.screen`.",
+    responses={
+        409: {"description": "Screening is already running"},
+        202: {"description": "Screening started", "model": ConjunctionScreeningStatus},
+    },
+)
+async def screen_conjunctions(
+    request: ConjunctionScreeningRequest,
+    _auth=Depends(get_current_user),
+) -> ConjunctionScreeningStatus:
+    if not screening_job.start(request):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Screening is already running",
+        )
+    return screening_job.get_status()
+
+
+@router.get(
+    "/conjunctions/screen/",
+    response_model=ConjunctionScreeningStatus,
+    summary="Get conjunction screening status",
+    description="Returns whether a screening run is in progress and the report "
+    "of the latest finished run",
+    responses={
+        200: {"description": "Screening status", "model": ConjunctionScreeningStatus},
+    },
+)
+async def get_screening_status() -> ConjunctionScreeningStatus:
+    return screening_job.get_status()
+
+
+@router.post(
+    "/ingest/",
+    response_model=ElementSetIngestReport,
+    summary="Upload orbital element sets",
+    description="Streams a TLE or OMM (JSON, XML, CSV) file, matches entries "
+    "to satellites by NORAD ID and stores element sets with a newer epoch "
+    "in large batches",
+    responses={
+        422: {"description": "Malformed element set file"},
+        200: {"description": "Ingestion report", "model": ElementSetIngestReport},
+    },
+)
+async def ingest_element_sets(
+    file: UploadFile,
+    file_format: Annotated[
+        ElementSetFormat, Query(alias="format", description="File format")
+    ],
+    orbit_service: OrbitService = Depends(get_orbit_service),
+    _auth=Depends(get_current_user),
+) -> ElementSetIngestReport:
+    try:
+        return await orbit_service.ingest_element_sets(
+            ElementSetReader(file.file, file_format)
+        )
+    except InvalidElementSetFileError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error)
+        )
+
+
+@router.get(
+    "/{international_code}/elements",
+    response_model=OrbitalElementsInDB,
+    summary="Get satellite orbital elements",
+    responses={
+        404: {"description": "Orbital elements not found"},
+        200: {"description": "Orbital elements found", "model": OrbitalElementsInDB},
+    },
+)
+async def get_orbital_elements(
+    international_code: InternationalCode,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+) -> OrbitalElementsInDB:
+    elements = await orbit_service.get_elements(international_code)
+    await raise_if_object_none(
+        elements, status.HTTP_404_NOT_FOUND, "Orbital elements not found"
+    )
+    return elements
+
+
+@router.get(
+    "/{international_code}/conjunctions",
+    response_model=List[ConjunctionInDB],
+    summary="Get close approaches of a satellite",
+    description="Returns close approaches found by the latest screening run "
+    "ordered by time of closest approach",
+    responses={
+        404: {"description": "Satellite not found"},
+        200: {"description": "Close approaches", "model": List[ConjunctionInDB]},
+    },
+)
+async def get_conjunctions(
+    international_code: InternationalCode,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+) -> List[ConjunctionInDB]:
+    conjunctions = await orbit_service.get_conjunctions(international_code)
+    # Пустой список - корректный ответ, raise_if_object_none здесь не подходит
+    if conjunctions is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Satellite not found"
+        )
+    return conjunctions
+
+
+@router.put(
+    "/{international_code}/elements",
+    response_model=OrbitalElementsInDB,
+    summary="Set satellite orbital elements (OMM)",
+    description="Stores OMM mean elements of the satellite, replacing the previous set",
+    responses={
+        404: {"description": "Satellite not found"},
+        200: {"description": "Orbital elements saved", "model": OrbitalElementsInDB},
+    },
+)
+async def set_orbital_elements(
+    international_code: InternationalCode,
+    elements: OrbitalElementsBase,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+    _auth=Depends(get_current_user),
+) -> OrbitalElementsInDB:
+    elements = await orbit_service.set_elements(international_code, elements)
+    await raise_if_object_none(
+        elements, status.HTTP_404_NOT_FOUND, "Satellite not found"
+    )
+    return elements
+
+
+@router.put(
+    "/{international_code}/tle",
+    response_model=OrbitalElementsInDB,
+    summary="Set satellite orbital elements from TLE",
+    description="Parses a two-line element set of the satellite "
+    "and stores its mean elements, replacing the previous set",
+    responses={
+        404: {"description": "Satellite not found"},
+        422: {"description": "Invalid TLE or NORAD ID mismatch"},
+        200: {"description": "Orbital elements saved", "model": OrbitalElementsInDB},
+    },
+)
+async def set_orbital_elements_from_tle(
+    international_code: InternationalCode,
+    tle: TLELines,
+    orbit_service: OrbitService = Depends(get_orbit_service),
+    _auth=Depends(get_current_user),
+) -> OrbitalElementsInDB:
+    try:
+        elements = await orbit_service.set_elements_from_tle(international_code, tle)
+    except InvalidTLEError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error)
+        )
+    await raise_if_object_none(
+        elements, status.HTTP_404_NOT_FOUND, "Satellite not found"
+    )
+    return elements
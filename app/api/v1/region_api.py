@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Path, Depends, status, Query
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from app.api.v1.helpers import raise_if_object_none, get_region_service
 from app.api.v1.auth import get_current_user
 from app.schemas import (
     RegionInDB,
     SubregionInDB,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     RegionCreate,
     SubregionCreate,
     RegionUpdate,
     SubregionUpdate,
+    FootprintGeometry,
 )
 from app.service import RegionService
 
@@ -131,6 +134,29 @@ async def get_regions(
     return await region_service.get_regions(PaginationBase(limit=limit, offset=offset))
 
 
+@router.get(
+    "/regions/page/",
+    response_model=CursorPage[RegionInDB],
+    summary="Get a page of regions by cursor",
+    description="Keyset pagination ordered by primary key. "
+    "Pass next_cursor from the previous page to get the next one.",
+    responses={
+        400: {"description": "Invalid cursor"},
+        200: {"description": "Regions page", "model": CursorPage[RegionInDB]},
+    },
+)
+async def get_regions_page(
+    region_service: RegionService = Depends(get_region_service),
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[Optional[str], Query(max_length=200)] = None,
+) -> CursorPage[RegionInDB]:
+    page = await region_service.get_regions_page(
+        CursorPagination(limit=limit, cursor=cursor)
+    )
+    await raise_if_object_none(page, status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+    return page
+
+
 @router.get(
     "/subregions/",
     response_model=List[SubregionInDB],
@@ -313,3 +339,86 @@ async def update_subregion(
         "A subregion with such data cannot be updated",
     )
     return subregion
+
+
+@router.put(
+    "/{region_id}/boundary",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Set region boundary",
+    description="Stores the boundary polygon of the region (GeoJSON Polygon, "
+    "positions as [longitude, latitude]), replacing the previous one. "
+    "Boundaries are used to assign regions to coverage zones by footprint.",
+    responses={
+        404: {"description": "Region not found"},
+        204: {"description": "Boundary has been saved"},
+    },
+)
+async def set_region_boundary(
+    geometry: FootprintGeometry,
+    region_id: RegionID,
+    region_service: RegionService = Depends(get_region_service),
+    _auth=Depends(get_current_user),
+):
+    result = await region_service.set_region_boundary(region_id, geometry)
+    await raise_if_object_none(result, status.HTTP_404_NOT_FOUND, "Region not found")
+
+
+@router.get(
+    "/{region_id}/boundary",
+    response_model=FootprintGeometry,
+    summary="Get region boundary",
+    responses={
+        404: {"description": "Boundary not found"},
+        200: {"description": "Boundary found", "model": FootprintGeometry},
+    },
+)
+async def get_region_boundary(
+    region_id: RegionID,
+    region_service: RegionService = Depends(get_region_service),
+) -> FootprintGeometry:
+    geometry = await region_service.get_region_boundary(region_id)
+    await raise_if_object_none(
+        geometry, status.HTTP_404_NOT_FOUND, "Boundary not found"
+    )
+    return geometry
+
+
+@router.put(
+    "/subregion/{subregion_id}/boundary",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Set subregion boundary",
+    description="Stores the boundary polygon of the subregion (GeoJSON Polygon, "
+    "positions as [longitude, latitude]), replacing the previous one.",
+    responses={
+        404: {"description": "Subregion not found"},
+        204: {"description": "Boundary has been saved"},
+    },
+)
+async def set_subregion_boundary(
+    geometry: FootprintGeometry,
+    subregion_id: SubregionID,
+    region_service: RegionService = Depends(get_region_service),
+    _auth=Depends(get_current_user),
+):
+    result = await region_service.set_subregion_boundary(subregion_id, geometry)
+    await raise_if_object_none(result, status.HTTP_404_NOT_FOUND, "Subregion not found")
+
+
+@router.get(
+    "/subregion/{subregion_id}/boundary",
+    response_model=FootprintGeometry,
+    summary="Get subregion boundary",
+    responses={
+        404: {"description": "Boundary not found"},
+        200: {"description": "Boundary found", "model": FootprintGeometry},
+    },
+)
+async def get_subregion_boundary(
+    subregion_id: SubregionID,
+    region_service: RegionService = Depends(get_region_service),
+) -> FootprintGeometry:
+    geometry = await region_service.get_subregion_boundary(subregion_id)
+    await raise_if_object_none(
+        geometry, status.HTTP_404_NOT_FOUND, "Boundary not found"
+    )
+    return geometry
@@ -1,15 +1,27 @@
 from fastapi import APIRouter, Path, Depends, status, Query
-from typing import Annotated, List
-from app.service import SatelliteService
+from fastapi.responses import StreamingResponse, Response
+from typing import Annotated, List, Optional, AsyncIterator
+from app.core import async_session_maker
+from app.service import SatelliteService, create_satellite_service
 from app.schemas import (
     SatelliteInDB,
     SatelliteCharacteristicInDB,
     SatelliteCompleteInfo,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     SatelliteCreate,
     SatelliteCharacteristicCreate,
     SatelliteUpdate,
     SatelliteCharacteristicUpdate,
+    ExportFormat,
+    SatelliteBulkCreate,
+    SatelliteBulkResult,
+    SatelliteCodes,
+    SatelliteCompleteInfoResult,
+    GeoSlot,
+    TerminalLookAngleRequest,
+    TerminalLookAngles,
 )
 from app.api.v1.helpers import raise_if_object_none, get_satellite_service
 from app.api.v1.auth import get_current_user
@@ -130,6 +142,132 @@ async def get_satellites(
     )
 
 
+@router.get(
+    "/list/page/",
+    response_model=CursorPage[SatelliteInDB],
+    summary="Get a page of satellites by cursor",
+    description="Keyset pagination ordered by primary key. "
+    "Pass next_cursor from the previous page to get the next one.",
+    responses={
+        400: {"description": "Invalid cursor"},
+        200: {"description": "Satellites page", "model": CursorPage[SatelliteInDB]},
+    },
+)
+async def get_satellites_page(
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    cursor: Annotated[Optional[str], Query(max_length=200)] = None,
+) -> CursorPage[SatelliteInDB]:
+    page = await satellite_service.get_satellites_page(
+        CursorPagination(limit=limit, cursor=cursor)
+    )
+    await raise_if_object_none(page, status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+    return page
+
+
+Longitude = Annotated[float, Query(ge=-180, le=180, description="Degrees east")]
+
+
+@router.get(
+    "/geo/range/",
+    response_model=List[GeoSlot],
+    summary="Get GEO satellites in a longitude range",
+    description="Returns satellites whose orbital longitude lies eastward from "
+    "west to east inclusive, sorted by longitude. If west is greater than east "
+    "the range wraps across the antimeridian (e.g. west=170, east=-170).",
+    responses={
+        200: {"description": "Satellites in the range", "model": List[GeoSlot]},
+    },
+)
+async def get_satellites_in_longitude_range(
+    west: Longitude,
+    east: Longitude,
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+) -> List[GeoSlot]:
+    return await satellite_service.get_satellites_in_longitude_range(west, east)
+
+
+@router.get(
+    "/geo/nearest/",
+    response_model=List[GeoSlot],
+    summary="Get GEO satellites nearest to a longitude slot",
+    description="Returns up to limit satellites ordered by angular distance "
+    "to the given longitude, across the antimeridian as well",
+    responses={
+        200: {"description": "Nearest satellites", "model": List[GeoSlot]},
+    },
+)
+async def get_nearest_satellites(
+    longitude: Longitude,
+    limit: Annotated[int, Query(ge=1, le=100)] = 5,
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+) -> List[GeoSlot]:
+    return await satellite_service.get_nearest_satellites(longitude, limit)
+
+
+@router.post(
+    "/geo/look_angles/",
+    response_model=TerminalLookAngles,
+    summary="Compute look angles from ground terminals to GEO satellites",
+    description="Returns azimuth, elevation and slant range from every terminal "
+    "to every requested satellite using its orbital longitude. Terminal "
+    "coordinates are passed as parallel arrays; result arrays are indexed "
+    "[satellite][terminal]. Satellites without a longitude are listed in not_found.",
+    responses={
+        200: {"description": "Look angles", "model": TerminalLookAngles},
+        422: {"description": "Invalid coordinates or array lengths differ"},
+    },
+)
+async def get_terminal_look_angles(
+    request: TerminalLookAngleRequest,
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+) -> Response:
+    look_angles = await satellite_service.get_terminal_look_angles(request)
+    # Массивы на десятки тысяч чисел: сериализуем сразу в JSON средствами
+    # pydantic, без повторной валидации по response_model
+    return Response(look_angles.model_dump_json(), media_type="application/json")
+
+
+export_media_types = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def stream_catalog(export_format: ExportFormat) -> AsyncIterator[str]:
+    # Сессия из Depends закрывается до отправки тела ответа,
+    # поэтому поток экспорта открывает свою на всё время передачи
+    async with async_session_maker() as session:
+        satellite_service = create_satellite_service(session)
+        async for chunk in satellite_service.export_catalog(export_format):
+            yield chunk
+
+
+@router.get(
+    "/export/",
+    summary="Export the full satellite catalog",
+    description="Streams satellites with characteristics and coverage zone ids "
+    "as NDJSON or CSV, reading the database with a server-side cursor",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Satellite catalog",
+            "content": {media_type: {} for media_type in export_media_types.values()},
+        },
+    },
+)
+async def export_satellites(
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_catalog(export_format),
+        media_type=export_media_types[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=satellites.{export_format.value}"
+        },
+    )
+
+
 @router.post(
     path="/",
     response_model=SatelliteInDB,
@@ -173,6 +311,47 @@ async def create_satellite_complete(
     return satellite
 
 
+@router.post(
+    path="/complete/batch",
+    response_model=List[SatelliteCompleteInfoResult],
+    summary="Get complete information for many satellites",
+    description="Returns complete information for up to 200 international codes "
+    "in input order, marking codes that were not found",
+    responses={
+        200: {
+            "description": "Complete information per requested code",
+            "model": List[SatelliteCompleteInfoResult],
+        },
+    },
+)
+async def get_satellites_complete_information(
+    satellite_codes: SatelliteCodes,
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+) -> List[SatelliteCompleteInfoResult]:
+    return await satellite_service.get_satellites_complete_info(satellite_codes)
+
+
+@router.post(
+    path="/bulk",
+    response_model=List[SatelliteBulkResult],
+    summary="Create satellites in bulk",
+    description="Creates a batch of satellites with characteristics in one "
+    "transaction and returns a per-item report in input order",
+    responses={
+        200: {
+            "description": "Per-item creation report",
+            "model": List[SatelliteBulkResult],
+        },
+    },
+)
+async def create_satellites_bulk(
+    satellites: SatelliteBulkCreate,
+    satellite_service: SatelliteService = Depends(get_satellite_service),
+    _auth=Depends(get_current_user),
+) -> List[SatelliteBulkResult]:
+    return await satellite_service.create_satellites_bulk(satellites)
+
+
 @router.post(
     path="/characteristic",
     response_model=SatelliteCharacteristicInDB,
@@ -1,5 +1,13 @@
 from .config import settings
-from .database import get_db, async_engine
+from .database import (
+    get_db,
+    async_engine,
+    async_session_maker,
+    pool_monitor,
+    warm_up_pool,
+)
+from .cache import TTLCache, CacheBackend, InMemoryCacheBackend
+from .counters import EntityCounters, entity_counters
 from .exceptions import (
     AccessDeniedError,
     AdminPasswordRequiredError,
@@ -13,12 +21,22 @@ from .exceptions import (
     UserNotFoundError,
     AccessTokenExpiredError,
     RefreshTokenExpiredError,
+    InvalidTLEError,
+    InvalidElementSetFileError,
 )
 
 __all__ = [
     "settings",
     "get_db",
     "async_engine",
+    "async_session_maker",
+    "pool_monitor",
+    "warm_up_pool",
+    "TTLCache",
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "EntityCounters",
+    "entity_counters",
     "AccessDeniedError",
     "AdminPasswordRequiredError",
     "UserPasswordRequiredError",
@@ -31,4 +49,6 @@ __all__ = [
     "UserNotFoundError",
     "AccessTokenExpiredError",
     "RefreshTokenExpiredError",
+    "InvalidTLEError",
+    "InvalidElementSetFileError",
 ]
@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.schemas import CacheStats
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Небольшой кеш в памяти процесса: записи живут ttl_seconds,
+    при переполнении вытесняются давно не использованные.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        item = self._data.get(key)
+        if item is None or item[0] < monotonic():
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: K, value: V) -> None:
+        self._data[key] = (monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._data),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+class CacheBackend(ABC, Generic[V]):
+    """
+    Асинхронный интерфейс кеша со строковыми ключами. Сервисы работают
+    только с ним, поэтому процессный кеш можно заменить общим (например, Redis).
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[V]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: V) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    def get_stats(self) -> CacheStats: ...
+
+
+class InMemoryCacheBackend(CacheBackend[V]):
+    """Кеш в памяти процесса (LRU + TTL)"""
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self._cache: TTLCache[str, V] = TTLCache(ttl_seconds, max_size)
+
+    async def get(self, key: str) -> Optional[V]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: V) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.invalidate(key)
+
+    def get_stats(self) -> CacheStats:
+        return self._cache.get_stats()
@@ -1,4 +1,5 @@
 import os
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +14,25 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ENDPOINT_URL: str
     BUCKET_NAME: str
+    # Пул соединений с БД: размер (открывается при запуске), сверх пула, ожидание
+    # свободного соединения (с), пересоздание соединения (с), проверка перед выдачей
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Кеш подготовленных запросов asyncpg на соединение, таймаут запроса (0 - без него)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    S3_MAX_POOL_CONNECTIONS: int = 20
+    S3_CONNECT_TIMEOUT: float = 5
+    S3_READ_TIMEOUT: float = 60
+    S3_KEEPALIVE_TIMEOUT: float = 30
+    S3_MAX_ATTEMPTS: int = 3
+    # Порог multipart upload и размер части, байт: S3 требует от всех частей,
+    # кроме последней, не меньше 5 МиБ
+    S3_MULTIPART_THRESHOLD: int = Field(8 * 1024 * 1024, ge=5 * 1024 * 1024)
+    S3_MULTIPART_PART_SIZE: int = Field(8 * 1024 * 1024, ge=5 * 1024 * 1024)
     ADMIN_SECRET_KEY: str
     ACCESS_TOKEN_SECRET_KEY: str
     REFRESH_TOKEN_SECRET_KEY: str
@@ -20,6 +40,38 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_SECONDS: int
     REFRESH_TOKEN_EXPIRE_SECONDS: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
+    PASSWORD_HASH_WORKERS: int = 4
+    # Авторизация по подписанным claims access-токена без загрузки пользователя из БД.
+    # Статус пользователя кешируется в памяти процесса на AUTH_USER_CACHE_TTL_SECONDS.
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30
+    AUTH_USER_CACHE_MAX_SIZE: int = 10000
+    SATELLITE_CACHE_TTL_SECONDS: float = 300
+    SATELLITE_CACHE_MAX_SIZE: int = 10000
+    # Количество инициализированных моделей SGP4, переиспользуемых между запросами
+    ORBIT_SATREC_CACHE_SIZE: int = 50000
+    # Количество записей файла элементов орбит, сохраняемых одним запросом
+    ORBIT_INGEST_BATCH_SIZE: int = 5000
+    # Период перечитывания из БД индекса точек стояния GEO-спутников
+    GEO_SLOT_INDEX_TTL_SECONDS: float = 60
+    # Период перечитывания из БД индекса контуров зон покрытия
+    COVERAGE_INDEX_TTL_SECONDS: float = 300
+    # Период перечитывания из БД индекса границ регионов и подрегионов
+    REGION_INDEX_TTL_SECONDS: float = 300
+    # Расчетные контуры GEO-спутников: угол места по умолчанию, число вершин
+    # контура и количество кешируемых наборов параметров
+    FOOTPRINT_MIN_ELEVATION: float = 5
+    FOOTPRINT_POINTS: int = 360
+    FOOTPRINT_CACHE_SIZE: int = 1000
+    # Скрининг сближений: число процессов, окно, шаг сетки и порог расстояния
+    CONJUNCTION_SCREENING_WORKERS: int = 4
+    CONJUNCTION_SCREENING_DAYS: float = 7
+    CONJUNCTION_STEP_SECONDS: float = 60
+    CONJUNCTION_THRESHOLD_KM: float = 10
+    # Период сверки счетчиков строк в памяти с COUNT(*) в БД
+    COUNTER_TTL_SECONDS: float = 60
+    # Количество строк, которое серверный курсор экспорта каталога читает за раз
+    EXPORT_BATCH_SIZE: int = 1000
 
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
@@ -0,0 +1,119 @@
+from collections import Counter
+from time import monotonic
+from typing import Dict, Optional, Set, Tuple, Union
+
+from sqlalchemy import Table, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+_PENDING_KEY = "entity_counter_deltas"
+_EXPIRED_KEY = "entity_counter_expired"
+
+
+class EntityCounters:
+    """
+    Количество строк по таблицам в памяти процесса. Добавленные и удаленные
+    через ORM объекты учитываются при flush, изменения Core-запросами INSERT/DELETE
+    репозитории записывают сами; к счетчикам они применяются только после
+    commit (при rollback отбрасываются). Счетчики таблиц, строки которых удалены
+    каскадом ON DELETE CASCADE, после commit сбрасываются. Раз в ttl_seconds
+    счетчик сверяется с COUNT(*), это исправляет изменения в обход репозиториев
+    и из других процессов.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._counts: Dict[str, Tuple[float, int]] = dict()
+        self._versions: Counter = Counter()
+
+    def get(self, name: str) -> Optional[int]:
+        item = self._counts.get(name)
+        if item is None or item[0] < monotonic():
+            return None
+        return item[1]
+
+    def version(self, name: str) -> int:
+        return self._versions[name]
+
+    def load(self, name: str, count: int, version: int) -> None:
+        """Значение COUNT(*), прочитанное при версии version; устаревшее не сохраняется"""
+        if version == self._versions[name]:
+            self._counts[name] = (monotonic() + self.ttl_seconds, count)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        if name is None:
+            self._counts.clear()
+        else:
+            self._counts.pop(name, None)
+
+    @staticmethod
+    def record(session: Union[AsyncSession, Session], name: str, delta: int) -> None:
+        """Изменение количества строк в текущей транзакции сессии"""
+        if delta:
+            session.info.setdefault(_PENDING_KEY, Counter())[name] += delta
+
+    @classmethod
+    def record_delete(
+        cls, session: Union[AsyncSession, Session], table: Table, deleted: int
+    ) -> None:
+        """Удаление строк таблицы вместе с каскадом ON DELETE CASCADE в БД"""
+        cls.record(session, table.name, -deleted)
+        if deleted:
+            cls._expire_cascade(session, table)
+
+    @staticmethod
+    def expire(session: Union[AsyncSession, Session], name: str) -> None:
+        """Число строк изменено на неизвестную величину, счетчик сбросится после commit"""
+        session.info.setdefault(_EXPIRED_KEY, set()).add(name)
+
+    @staticmethod
+    def _expire_cascade(session: Union[AsyncSession, Session], table: Table) -> None:
+        expired: Set[str] = session.info.setdefault(_EXPIRED_KEY, set())
+        parents = [table]
+        while parents:
+            parent = parents.pop()
+            for child in parent.metadata.tables.values():
+                if child.name not in expired and any(
+                    fk.ondelete == "CASCADE" and fk.column.table is parent
+                    for fk in child.foreign_keys
+                ):
+                    expired.add(child.name)
+                    parents.append(child)
+
+    @staticmethod
+    def pending(session: AsyncSession, name: str) -> int:
+        return session.info.get(_PENDING_KEY, Counter())[name]
+
+    @classmethod
+    def _record_flush(cls, session: Session, _flush_context) -> None:
+        for instance in session.new:
+            cls.record(session, instance.__tablename__, 1)
+        for instance in session.deleted:
+            cls.record_delete(session, instance.__table__, 1)
+
+    def _apply(self, session: Session) -> None:
+        for name, delta in session.info.pop(_PENDING_KEY, Counter()).items():
+            self._versions[name] += 1
+            item = self._counts.get(name)
+            if item is not None:
+                self._counts[name] = (item[0], item[1] + delta)
+        for name in session.info.pop(_EXPIRED_KEY, set()):
+            self._versions[name] += 1
+            self._counts.pop(name, None)
+
+    @staticmethod
+    def _discard(session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_EXPIRED_KEY, None)
+
+    def listen(self) -> None:
+        """Подписка на flush, commit и rollback всех сессий"""
+        event.listen(Session, "after_flush", self._record_flush)
+        event.listen(Session, "after_commit", self._apply)
+        event.listen(Session, "after_rollback", self._discard)
+
+
+entity_counters = EntityCounters(settings.COUNTER_TTL_SECONDS)
+entity_counters.listen()
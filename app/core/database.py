@@ -1,18 +1,108 @@
+import asyncio
 from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    create_async_engine,
+    async_sessionmaker,
+    AsyncSession,
+)
 from app.core import settings
+from app.schemas import DatabasePoolStats
 
 DATABASE_URL = settings.get_db_url()
 
+
+def _connect_args() -> dict:
+    """Параметры соединения asyncpg: кеш подготовленных запросов и таймаут запроса"""
+    connect_args: dict = {
+        # Кеш SQLAlchemy и собственный кеш asyncpg (0 - для pgbouncer в режиме transaction)
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+        }
+    return connect_args
+
+
 async_engine = create_async_engine(
     DATABASE_URL,
     future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args(),
 )
 
 async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
+class PoolMonitor:
+    """Счетчики пула соединений по событиям connect/checkout/checkin"""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self._checked_out = 0
+        self._max_checked_out = 0
+        self._connects = 0
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, *_args) -> None:
+        self._connects += 1
+
+    def _on_checkout(self, *_args) -> None:
+        self._checked_out += 1
+        self._max_checked_out = max(self._max_checked_out, self._checked_out)
+
+    def _on_checkin(self, *_args) -> None:
+        self._checked_out -= 1
+
+    def get_stats(self) -> DatabasePoolStats:
+        pool = self.engine.pool
+        capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+        checked_out = pool.checkedout()  # type: ignore[attr-defined]
+        return DatabasePoolStats(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            checked_out=checked_out,
+            checked_in=pool.checkedin(),  # type: ignore[attr-defined]
+            overflow=max(pool.overflow(), 0),  # type: ignore[attr-defined]
+            saturation=checked_out / capacity if capacity else 0.0,
+            max_checked_out=self._max_checked_out,
+            connects=self._connects,
+        )
+
+
+pool_monitor = PoolMonitor(async_engine)
+
+
+async def warm_up_pool(engine: AsyncEngine = async_engine) -> int:
+    """
+    Открывает DB_POOL_SIZE соединений одновременно и возвращает их в пул,
+    чтобы первые запросы после запуска не ждали установки соединения.
+    Ошибки не прерывают запуск: недостающие соединения откроются по запросу.
+    :return: количество открытых соединений
+    """
+    connections = [engine.connect() for _ in range(settings.DB_POOL_SIZE)]
+    results = await asyncio.gather(
+        *(connection.start() for connection in connections), return_exceptions=True
+    )
+    opened = [
+        connection
+        for connection, result in zip(connections, results)
+        if not isinstance(result, BaseException)
+    ]
+    await asyncio.gather(*(connection.close() for connection in opened))
+    return len(opened)
+
+
 # Генератор для Dependency Injection в FastAPI
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
     async with async_session_maker() as session:
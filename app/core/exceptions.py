@@ -83,3 +83,17 @@ class UserNotFoundError(Exception):
 
     def __init__(self):
         super().__init__("User by this id not found in db")
+
+
+class InvalidTLEError(Exception):
+    """TLE не удалось разобрать или он относится к другому спутнику."""
+
+    def __init__(self, detail: str = "Invalid TLE"):
+        super().__init__(detail)
+
+
+class InvalidElementSetFileError(Exception):
+    """Файл с элементами орбит поврежден или не соответствует формату."""
+
+    def __init__(self, detail: str = "Invalid element set file"):
+        super().__init__(detail)
@@ -2,12 +2,19 @@ from .models import (
     Base,
     Country,
     CoverageZone,
+    CoverageZoneFootprint,
+    coverage_zone_association,
+    coverage_zone_association_subregion,
     Region,
+    RegionBoundary,
     Satellite,
     SatelliteCharacteristic,
     Subregion,
+    SubregionBoundary,
     User,
     RefreshToken,
+    OrbitalElements,
+    Conjunction,
 )
 from .repositories import (
     CountryRepository,
@@ -18,16 +25,23 @@ from .repositories import (
     SatelliteCharacteristicRepository,
     UserRepository,
     TokenRepository,
+    OrbitalElementsRepository,
+    ConjunctionRepository,
 )
 
 __all__ = [
     "Base",
     "Country",
     "CoverageZone",
+    "CoverageZoneFootprint",
+    "coverage_zone_association",
+    "coverage_zone_association_subregion",
     "Region",
+    "RegionBoundary",
     "Satellite",
     "SatelliteCharacteristic",
     "Subregion",
+    "SubregionBoundary",
     "CountryRepository",
     "RegionRepository",
     "SubregionRepository",
@@ -38,4 +52,8 @@ __all__ = [
     "User",
     "RefreshToken",
     "TokenRepository",
+    "OrbitalElements",
+    "OrbitalElementsRepository",
+    "Conjunction",
+    "ConjunctionRepository",
 ]
@@ -1,20 +1,34 @@
 from .base import Base
 from .country_abbreviations import Country
-from .coverage_zone import CoverageZone
-from .region import Region, Subregion
+from .coverage_zone import (
+    CoverageZone,
+    CoverageZoneFootprint,
+    coverage_zone_association,
+    coverage_zone_association_subregion,
+)
+from .region import Region, Subregion, RegionBoundary, SubregionBoundary
 from .satellite import Satellite
 from .satellite_characteristic import SatelliteCharacteristic
 from .user import User
 from .token import RefreshToken
+from .orbital_elements import OrbitalElements
+from .conjunction import Conjunction
 
 __all__ = [
     "Base",
     "Country",
     "CoverageZone",
+    "CoverageZoneFootprint",
+    "coverage_zone_association",
+    "coverage_zone_association_subregion",
     "Region",
+    "RegionBoundary",
     "Satellite",
     "SatelliteCharacteristic",
     "Subregion",
+    "SubregionBoundary",
     "User",
     "RefreshToken",
+    "OrbitalElements",
+    "Conjunction",
 ]
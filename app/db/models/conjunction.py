@@ -0,0 +1,39 @@
+from .base import Base
+from datetime import datetime
+from sqlalchemy import String, Float, ForeignKey, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Conjunction(Base):
+    """
+    Сближение пары спутников по результатам последнего скрининга каталога.
+    Пара хранится один раз: international_code < other_international_code.
+    """
+
+    __tablename__ = "conjunctions"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    international_code: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("satellites.international_code", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    other_international_code: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("satellites.international_code", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    tca: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    miss_distance_km: Mapped[float] = mapped_column(Float, nullable=False)
+    relative_speed_kms: Mapped[float] = mapped_column(Float, nullable=False)
+    screened_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    def __repr__(self):
+        return (
+            f"<Conjunction(international_code='{self.international_code}', "
+            f"other_international_code='{self.other_international_code}', "
+            f"tca={self.tca}, miss_distance_km={self.miss_distance_km})>"
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, Integer, Table, Column
+from sqlalchemy import String, ForeignKey, Integer, Table, Column, JSON
 from .base import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List
@@ -12,15 +12,25 @@ if TYPE_CHECKING:
 coverage_zone_association = Table(
     "coverage_zone_association",
     Base.metadata,
-    Column("coverage_zone_id", String(60), ForeignKey("coverage_zones.id")),
-    Column("region_id", Integer, ForeignKey("regions.id")),
+    Column(
+        "coverage_zone_id",
+        String(60),
+        ForeignKey("coverage_zones.id"),
+        primary_key=True,
+    ),
+    Column("region_id", Integer, ForeignKey("regions.id"), primary_key=True),
 )
 
 coverage_zone_association_subregion = Table(
     "coverage_zone_association_subregion",
     Base.metadata,
-    Column("coverage_zone_id", String(60), ForeignKey("coverage_zones.id")),
-    Column("subregion_id", Integer, ForeignKey("subregions.id")),
+    Column(
+        "coverage_zone_id",
+        String(60),
+        ForeignKey("coverage_zones.id"),
+        primary_key=True,
+    ),
+    Column("subregion_id", Integer, ForeignKey("subregions.id"), primary_key=True),
 )
 
 
@@ -34,12 +44,12 @@ class CoverageZone(Base):
     image_data: Mapped[str] = mapped_column(String(90), unique=True, nullable=False)
 
     satellite: Mapped["Satellite"] = relationship(
-        "Satellite", lazy="joined", back_populates="coverage_zones"
+        "Satellite", lazy="raise", back_populates="coverage_zones"
     )
     regions: Mapped[List["Region"]] = relationship(
         "Region",
         secondary=coverage_zone_association,
-        lazy="selectin",
+        lazy="raise",
         back_populates="coverage_zone",
         cascade="save-update, merge",
         passive_deletes=True,
@@ -47,7 +57,7 @@ class CoverageZone(Base):
     subregions: Mapped[List["Subregion"]] = relationship(
         "Subregion",
         secondary=coverage_zone_association_subregion,
-        lazy="selectin",
+        lazy="raise",
         back_populates="coverage_zone",
         cascade="save-update, merge",
         passive_deletes=True,
@@ -58,3 +68,18 @@ class CoverageZone(Base):
             f"<CoverageZone(id='{self.id}', satellite_code='{self.satellite_code}', "
             f"transmitter_type='{self.transmitter_type}')>"
         )
+
+
+class CoverageZoneFootprint(Base):
+    """Контур зоны покрытия: полигон GeoJSON с координатами [долгота, широта]"""
+
+    __tablename__ = "coverage_zone_footprints"
+    coverage_zone_id: Mapped[str] = mapped_column(
+        String(60),
+        ForeignKey("coverage_zones.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    geometry: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<CoverageZoneFootprint(coverage_zone_id='{self.coverage_zone_id}')>"
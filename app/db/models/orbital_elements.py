@@ -0,0 +1,31 @@
+from .base import Base
+from datetime import datetime
+from sqlalchemy import String, Float, ForeignKey, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class OrbitalElements(Base):
+    """Средние элементы орбиты SGP4 (TLE/OMM), один актуальный набор на спутник"""
+
+    __tablename__ = "orbital_elements"
+    international_code: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("satellites.international_code", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    mean_motion: Mapped[float] = mapped_column(Float, nullable=False)
+    eccentricity: Mapped[float] = mapped_column(Float, nullable=False)
+    inclination: Mapped[float] = mapped_column(Float, nullable=False)
+    ra_of_asc_node: Mapped[float] = mapped_column(Float, nullable=False)
+    arg_of_pericenter: Mapped[float] = mapped_column(Float, nullable=False)
+    mean_anomaly: Mapped[float] = mapped_column(Float, nullable=False)
+    bstar: Mapped[float] = mapped_column(Float, nullable=False)
+    mean_motion_dot: Mapped[float] = mapped_column(Float, nullable=False)
+    mean_motion_ddot: Mapped[float] = mapped_column(Float, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<OrbitalElements(international_code='{self.international_code}', "
+            f"epoch={self.epoch}, mean_motion={self.mean_motion})>"
+        )
@@ -1,6 +1,6 @@
 from .base import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, ForeignKey, Integer
+from sqlalchemy import String, ForeignKey, Integer, JSON
 from typing import List
 from typing import TYPE_CHECKING
 
@@ -13,12 +13,12 @@ class Region(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name_region: Mapped[str] = mapped_column(String(60), unique=True, nullable=False)
     subregions: Mapped[List["Subregion"]] = relationship(
-        "Subregion", lazy="selectin", back_populates="region"
+        "Subregion", lazy="raise", back_populates="region"
     )
     coverage_zone: Mapped[List["CoverageZone"]] = relationship(
         "CoverageZone",
         secondary="coverage_zone_association",
-        lazy="selectin",
+        lazy="raise",
         back_populates="regions",
     )
 
@@ -32,14 +32,40 @@ class Subregion(Base):
     name_subregion: Mapped[str] = mapped_column(String(60), unique=True, nullable=False)
     id_region: Mapped[int] = mapped_column(ForeignKey("regions.id"), nullable=False)
     region: Mapped["Region"] = relationship(
-        "Region", lazy="joined", back_populates="subregions"
+        "Region", lazy="raise", back_populates="subregions"
     )
     coverage_zone: Mapped[List["CoverageZone"]] = relationship(
         "CoverageZone",
         secondary="coverage_zone_association_subregion",
-        lazy="selectin",
+        lazy="raise",
         back_populates="subregions",
     )
 
     def __repr__(self):
         return f"<Subregion(id={self.id}, name_subregion='{self.name_subregion}', id_region={self.id_region})>"
+
+
+class RegionBoundary(Base):
+    """Граница региона: полигон GeoJSON с координатами [долгота, широта]"""
+
+    __tablename__ = "region_boundaries"
+    region_id: Mapped[int] = mapped_column(
+        ForeignKey("regions.id", ondelete="CASCADE"), primary_key=True
+    )
+    geometry: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<RegionBoundary(region_id={self.region_id})>"
+
+
+class SubregionBoundary(Base):
+    """Граница подрегиона: полигон GeoJSON с координатами [долгота, широта]"""
+
+    __tablename__ = "subregion_boundaries"
+    subregion_id: Mapped[int] = mapped_column(
+        ForeignKey("subregions.id", ondelete="CASCADE"), primary_key=True
+    )
+    geometry: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    def __repr__(self):
+        return f"<SubregionBoundary(subregion_id={self.subregion_id})>"
@@ -21,17 +21,17 @@ class Satellite(Base):
     launch_date: Mapped[date] = mapped_column(Date, nullable=False)
     country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"), nullable=False)
     country: Mapped["Country"] = relationship(
-        "Country", lazy="joined", back_populates="satellites"
+        "Country", lazy="raise", back_populates="satellites"
     )
     characteristics: Mapped["SatelliteCharacteristic"] = relationship(
         "SatelliteCharacteristic",
-        lazy="joined",
+        lazy="raise",
         back_populates="satellite",
         cascade="all, delete-orphan",
         uselist=False,
     )
     coverage_zones: Mapped[List["CoverageZone"]] = relationship(
-        "CoverageZone", lazy="selectin", back_populates="satellite"
+        "CoverageZone", lazy="raise", back_populates="satellite"
     )
 
     def __repr__(self):
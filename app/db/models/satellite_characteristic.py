@@ -1,6 +1,6 @@
 from .base import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, Float, ForeignKey, Text
+from sqlalchemy import String, Integer, Float, ForeignKey, Text, Index
 from typing import Optional
 from typing import TYPE_CHECKING
 
@@ -10,6 +10,13 @@ if TYPE_CHECKING:
 
 class SatelliteCharacteristic(Base):
     __tablename__ = "satellite_characteristic"
+    # Поиск по точке стояния: диапазон долгот и упорядоченное чтение
+    # индекса точек стояния без обращения к таблице
+    __table_args__ = (
+        Index(
+            "ix_satellite_characteristic_longitude", "longitude", "international_code"
+        ),
+    )
     international_code: Mapped[str] = mapped_column(
         String(50), ForeignKey("satellites.international_code"), primary_key=True
     )
@@ -25,7 +32,7 @@ class SatelliteCharacteristic(Base):
     details: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     satellite: Mapped["Satellite"] = relationship(
         "Satellite",
-        lazy="joined",
+        lazy="raise",
         back_populates="characteristics",
         uselist=False,
     )
@@ -4,6 +4,8 @@ from .covereage_zone_repository import CoverageZoneRepository
 from .satellite_repository import SatelliteRepository, SatelliteCharacteristicRepository
 from .user_repository import UserRepository
 from .token_repository import TokenRepository
+from .orbital_elements_repository import OrbitalElementsRepository
+from .conjunction_repository import ConjunctionRepository
 
 __all__ = [
     "CountryRepository",
@@ -14,4 +16,6 @@ __all__ = [
     "SatelliteCharacteristicRepository",
     "UserRepository",
     "TokenRepository",
+    "OrbitalElementsRepository",
+    "ConjunctionRepository",
 ]
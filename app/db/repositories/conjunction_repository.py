@@ -0,0 +1,62 @@
+from .repository import BaseRepository
+from app.db import Conjunction, Satellite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, or_
+from app.schemas import ConjunctionInDB, Object_str_ID
+from typing import List, Dict, Any
+
+
+class ConjunctionRepository(BaseRepository[Conjunction]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Conjunction, session)
+        self.in_db_type = ConjunctionInDB
+
+    async def replace_all(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Заменяет результаты предыдущего скрининга новыми одним INSERT.
+        Сближения спутников, удаленных за время скрининга, пропускаются,
+        остальные спутники блокируются от удаления до конца транзакции.
+        :return: количество сохраненных сближений
+        """
+        codes = {
+            code
+            for row in rows
+            for code in (row["international_code"], row["other_international_code"])
+        }
+        existing = set()
+        if codes:
+            query = (
+                select(Satellite.international_code)
+                .where(Satellite.international_code.in_(codes))
+                .with_for_update(key_share=True)
+            )
+            existing = set((await self.session.execute(query)).scalars())
+        rows = [
+            row
+            for row in rows
+            if row["international_code"] in existing
+            and row["other_international_code"] in existing
+        ]
+        result = await self.session.execute(delete(Conjunction))
+        if rows:
+            await self.session.execute(insert(Conjunction), rows)
+        self.record_delete(result.rowcount)
+        self.record_count(len(rows))
+        return len(rows)
+
+    async def get_by_satellite(
+        self, international_code: Object_str_ID
+    ) -> List[ConjunctionInDB]:
+        """Сближения спутника с любым другим по возрастанию момента сближения"""
+        query = (
+            select(Conjunction)
+            .where(
+                or_(
+                    Conjunction.international_code == international_code.id,
+                    Conjunction.other_international_code == international_code.id,
+                )
+            )
+            .order_by(Conjunction.tca)
+        )
+        result = await self.session.execute(query)
+        return await self._convert_to_list_model(result.scalars().all())
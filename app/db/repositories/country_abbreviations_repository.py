@@ -4,8 +4,12 @@ from app.schemas import CountryInDB, CountryFind, SatelliteInDB, Object_ID
 
 from .repository import BaseRepository
 from typing import Optional, List
+from sqlalchemy.orm import selectinload
 from app.db import Country
 
+# Профиль загрузки: спутники страны
+COUNTRY_SATELLITES = (selectinload(Country.satellites),)
+
 
 class CountryRepository(BaseRepository[Country]):
 
@@ -23,7 +27,9 @@ class CountryRepository(BaseRepository[Country]):
     async def get_satellite_list(
         self, country_id: Object_ID
     ) -> Optional[List[SatelliteInDB]]:
-        country: Optional[Country] = await self.get_by_id(country_id.id)
+        country: Optional[Country] = await self.get_by_id(
+            country_id.id, *COUNTRY_SATELLITES
+        )
         if country is None:
             return None
         sat_list = [
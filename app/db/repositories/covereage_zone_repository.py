@@ -1,7 +1,16 @@
 from sqlalchemy.exc import SQLAlchemyError
 from .repository import BaseRepository
-from typing import Optional, List
-from app.db import CoverageZone, Region, Satellite, Subregion as Subregion_DB
+from typing import Optional, List, Union, Tuple, Dict, Set, Iterable
+from fastapi import UploadFile
+from app.db import (
+    CoverageZone,
+    CoverageZoneFootprint,
+    Region,
+    Satellite,
+    Subregion as Subregion_DB,
+    coverage_zone_association,
+    coverage_zone_association_subregion,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import (
     CoverageZoneInDB,
@@ -14,11 +23,36 @@ from app.schemas import (
     SubregionBase,
     SatelliteInDB,
     CoverageZoneUpdate,
+    FootprintGeometry,
 )
 from app.s3_service.s3_service import S3Service
-from sqlalchemy import select
+from sqlalchemy import (
+    select,
+    delete,
+    any_,
+    bindparam,
+    literal,
+    union,
+    String,
+    Integer,
+    Table,
+)
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.dialects.postgresql import insert, ARRAY
 from pydantic import BaseModel
 
+# Профили загрузки связей зоны: остальные связи не загружаются (lazy="raise")
+ZONE_REGIONS = (
+    selectinload(CoverageZone.regions),
+    selectinload(CoverageZone.subregions),
+)
+ZONE_REGIONS_WITH_SUBREGIONS = (
+    selectinload(CoverageZone.regions).selectinload(Region.subregions),
+    selectinload(CoverageZone.subregions),
+)
+ZONE_SATELLITE = (joinedload(CoverageZone.satellite),)
+
 
 def all_fields_none(obj: BaseModel) -> bool:
     return all(v is None for v in obj.model_dump().values())
@@ -37,13 +71,16 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
     async def get_s3_file_key(self, object_id: str) -> str:
         return f"{self.S3_PREFIX}{object_id}.jpg"
 
+    async def _upload_image(self, image_data: Union[bytes, UploadFile], file_key: str):
+        if isinstance(image_data, bytes):
+            return await self.s3.upload_file(file_data=image_data, file_key=file_key)
+        return await self.s3.upload_fileobj(file_obj=image_data, file_key=file_key)
+
     async def create_entity(
         self, entity_create: CoverageZoneCreate
     ) -> Optional[CoverageZoneInDB]:
         file_key = await self.get_s3_file_key(entity_create.id)
-        if not await self.s3.upload_file(
-            file_data=entity_create.image_data, file_key=file_key
-        ):
+        if not await self._upload_image(entity_create.image_data, file_key):
             return None
         coverage_zone = CoverageZoneInDB(
             id=entity_create.id,
@@ -62,9 +99,7 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
             update = True
             file_key = await self.get_s3_file_key(object_id.id)
             await self.s3.delete_file(file_key)
-            if not await self.s3.upload_file(
-                file_data=coverage_zone_update.image_data, file_key=file_key
-            ):
+            if not await self._upload_image(coverage_zone_update.image_data, file_key):
                 return None
             coverage_zone_update.image_data = None
             coverage_zone_update.model_fields_set.discard("image_data")
@@ -84,7 +119,7 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
     async def get_region_list(
         self, object_id: Object_str_ID
     ) -> Optional[List[ZoneRegionDetails]]:
-        db_obj = await self.get_by_id(object_id.id)
+        db_obj = await self.get_by_id(object_id.id, *ZONE_REGIONS)
         if db_obj is None:
             return None
 
@@ -126,24 +161,91 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
         return True
 
     async def add_region(self, region: RegionBase, zone_id: Object_str_ID) -> bool:
-        zone_db = await self.get_by_id(zone_id.id)
+        zone_db = await self.get_by_id(zone_id.id, *ZONE_REGIONS)
         if zone_db is None:
             return False
         return await self._add_region(region, zone_db)
 
+    async def _zone_exists(self, zone_id: Object_str_ID) -> bool:
+        return (
+            await self.session.execute(
+                select(CoverageZone.id).where(CoverageZone.id == zone_id.id)
+            )
+        ).scalar_one_or_none() is not None
+
+    def _expire_zone_links(self, zone_id: Object_str_ID) -> None:
+        # Связи записаны в обход ORM: загруженные списки зоны устарели
+        zone_db = self.session.identity_map.get(identity_key(CoverageZone, zone_id.id))
+        if zone_db is not None:
+            self.session.expire(zone_db, ["regions", "subregions"])
+
+    async def _get_region_ids(self, names: List[str]) -> Dict[str, int]:
+        """Регионы по именам, недостающие создаются одним многострочным INSERT"""
+        query = select(Region.name_region, Region.id).where(
+            Region.name_region == any_(bindparam("names", type_=ARRAY(String)))
+        )
+        found = dict((await self.session.execute(query, {"names": names})).all())
+        missing = [name for name in dict.fromkeys(names) if name not in found]
+        if missing:
+            result = await self.session.execute(
+                insert(Region)
+                .values([{"name_region": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=[Region.name_region])
+            )
+            self.record_count(result.rowcount, Region)
+            # Повторное чтение видит и строки, вставленные параллельно
+            found.update((await self.session.execute(query, {"names": missing})).all())
+        return found
+
+    async def _link(
+        self, table: Table, column: str, zone_id: Object_str_ID, ids: Iterable[int]
+    ) -> Set[int]:
+        """Связи зоны одним INSERT ... ON CONFLICT DO NOTHING, возвращает новые"""
+        rows = [{"coverage_zone_id": zone_id.id, column: i} for i in dict.fromkeys(ids)]
+        if not rows:
+            return set()
+        result = await self.session.execute(
+            insert(table)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(table.c[column])
+        )
+        return set(result.scalars().all())
+
+    @staticmethod
+    def _first_added(ids: List[Optional[int]], added: Set[int]) -> List[bool]:
+        """Итог по элементам: True у первого вхождения каждой новой связи"""
+        result = list()
+        for object_id in ids:
+            result.append(object_id in added)
+            added.discard(object_id)
+        return result
+
     async def add_region_list(
         self, regions: List[RegionBase], zone_id: Object_str_ID
     ) -> Optional[List[bool]]:
-        zone_db = await self.get_by_id(zone_id.id)
-        if zone_db is None:
+        """
+        Привязывает регионы по именам за постоянное число запросов: имена
+        разрешаются одним SELECT, недостающие регионы создаются одним INSERT,
+        связи пишутся одним INSERT ... ON CONFLICT DO NOTHING.
+        False у уже привязанных регионов и повторов в списке.
+        """
+        if not await self._zone_exists(zone_id):
             return None
-        res_list = list()
-        for region in regions:
-            res_list.append(await self._add_region(region, zone_db))
-        return res_list
+        names = [region.name_region for region in regions]
+        region_ids = await self._get_region_ids(names)
+        ids = [region_ids.get(name) for name in names]
+        added = await self._link(
+            coverage_zone_association,
+            "region_id",
+            zone_id,
+            (i for i in ids if i is not None),
+        )
+        self._expire_zone_links(zone_id)
+        return self._first_added(ids, added)
 
     async def delete_region(self, region: RegionBase, zone_id: Object_str_ID) -> bool:
-        zone_db = await self.get_by_id(zone_id.id)
+        zone_db = await self.get_by_id(zone_id.id, *ZONE_REGIONS)
         if not zone_db:
             return False
         region_to_remove = next(
@@ -201,7 +303,7 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
     async def add_subregion(
         self, subregion: SubregionCreate, zone_id: Object_str_ID
     ) -> bool:
-        zone_db = await self.get_by_id(zone_id.id)
+        zone_db = await self.get_by_id(zone_id.id, *ZONE_REGIONS_WITH_SUBREGIONS)
         if not zone_db:
             return False
         return await self._add_subregion(subregion, zone_db)
@@ -209,18 +311,88 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
     async def add_subregion_list(
         self, subregions: List[SubregionCreate], zone_id: Object_str_ID
     ) -> Optional[List[bool]]:
-        zone_db = await self.get_by_id(zone_id.id)
-        if not zone_db:
+        """
+        Привязывает подрегионы и их регионы за постоянное число запросов, как
+        add_region_list. False у уже привязанных подрегионов, повторов,
+        подрегионов несуществующего региона и имен, занятых в другом регионе.
+        """
+        if not await self._zone_exists(zone_id):
             return None
-        res = list()
+        names = [subregion.name_subregion for subregion in subregions]
+        region_query = select(Region.id).where(
+            Region.id == any_(bindparam("region_ids", type_=ARRAY(Integer)))
+        )
+        region_ids = list({subregion.id_region for subregion in subregions})
+        existing_regions = set(
+            (await self.session.execute(region_query, {"region_ids": region_ids}))
+            .scalars()
+            .all()
+        )
+        query = select(
+            Subregion_DB.name_subregion, Subregion_DB.id, Subregion_DB.id_region
+        ).where(
+            Subregion_DB.name_subregion == any_(bindparam("names", type_=ARRAY(String)))
+        )
+        found = {
+            name: (subregion_id, region_id)
+            for name, subregion_id, region_id in (
+                await self.session.execute(query, {"names": names})
+            ).all()
+        }
+        missing: Dict[str, int] = dict()
         for subregion in subregions:
-            res.append(await self._add_subregion(subregion, zone_db))
-        return res
+            if (
+                subregion.name_subregion not in found
+                and subregion.id_region in existing_regions
+            ):
+                missing.setdefault(subregion.name_subregion, subregion.id_region)
+        if missing:
+            result = await self.session.execute(
+                insert(Subregion_DB)
+                .values(
+                    [
+                        {"name_subregion": name, "id_region": region_id}
+                        for name, region_id in missing.items()
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Subregion_DB.name_subregion])
+            )
+            self.record_count(result.rowcount, Subregion_DB)
+            rows = await self.session.execute(query, {"names": list(missing)})
+            found.update(
+                {
+                    name: (subregion_id, region_id)
+                    for name, subregion_id, region_id in rows.all()
+                }
+            )
+        ids = list()
+        for subregion in subregions:
+            subregion_id, region_id = found.get(subregion.name_subregion, (None, None))
+            ids.append(subregion_id if region_id == subregion.id_region else None)
+        valid = [
+            (subregion_id, subregion.id_region)
+            for subregion_id, subregion in zip(ids, subregions)
+            if subregion_id is not None
+        ]
+        await self._link(
+            coverage_zone_association,
+            "region_id",
+            zone_id,
+            (region_id for _, region_id in valid),
+        )
+        added = await self._link(
+            coverage_zone_association_subregion,
+            "subregion_id",
+            zone_id,
+            (subregion_id for subregion_id, _ in valid),
+        )
+        self._expire_zone_links(zone_id)
+        return self._first_added(ids, added)
 
     async def delete_subregion(
         self, subregion: SubregionBase, zone_id: Object_str_ID
     ) -> bool:
-        zone_db = await self.get_by_id(zone_id.id)
+        zone_db = await self.get_by_id(zone_id.id, *ZONE_REGIONS)
         if not zone_db:
             return False
         subregion_to_remove = next(
@@ -254,7 +426,7 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
             return False
 
     async def get_satellite(self, zone_id: Object_str_ID) -> Optional[SatelliteInDB]:
-        zone_db = await self.get_by_id(zone_id.id)
+        zone_db = await self.get_by_id(zone_id.id, *ZONE_SATELLITE)
         if not zone_db:
             return None
         return SatelliteInDB(**zone_db.satellite.__dict__)
@@ -264,7 +436,9 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
     ) -> Optional[List[CoverageZoneInDB]]:
         db_satellite: Optional[Satellite] = (
             await self.session.execute(
-                select(Satellite).where(Satellite.international_code == satellite_id.id)
+                select(Satellite)
+                .where(Satellite.international_code == satellite_id.id)
+                .options(selectinload(Satellite.coverage_zones))
             )
         ).scalar_one_or_none()
         if db_satellite is None:
@@ -274,3 +448,115 @@ class CoverageZoneRepository(BaseRepository[CoverageZone]):
         for coverage_zone in coverage_zones_list:
             Coverage_Zone_In_DB_List.append(CoverageZoneInDB(**coverage_zone.__dict__))
         return Coverage_Zone_In_DB_List
+
+    async def set_footprint(
+        self, zone_id: Object_str_ID, geometry: FootprintGeometry
+    ) -> bool:
+        """Сохраняет контур зоны, заменяя предыдущий"""
+        exists = (
+            await self.session.execute(
+                select(CoverageZone.id).where(CoverageZone.id == zone_id.id)
+            )
+        ).scalar_one_or_none()
+        if exists is None:
+            return False
+        values = geometry.model_dump()
+        query = (
+            insert(CoverageZoneFootprint)
+            .values(coverage_zone_id=zone_id.id, geometry=values)
+            .on_conflict_do_update(
+                index_elements=[CoverageZoneFootprint.coverage_zone_id],
+                set_={"geometry": values},
+            )
+        )
+        await self.session.execute(query)
+        self.expire_count(CoverageZoneFootprint)
+        return True
+
+    async def get_footprint(
+        self, zone_id: Object_str_ID
+    ) -> Optional[FootprintGeometry]:
+        geometry = (
+            await self.session.execute(
+                select(CoverageZoneFootprint.geometry).where(
+                    CoverageZoneFootprint.coverage_zone_id == zone_id.id
+                )
+            )
+        ).scalar_one_or_none()
+        return FootprintGeometry.model_validate(geometry) if geometry else None
+
+    async def delete_footprint(self, zone_id: Object_str_ID) -> bool:
+        result = await self.session.execute(
+            delete(CoverageZoneFootprint).where(
+                CoverageZoneFootprint.coverage_zone_id == zone_id.id
+            )
+        )
+        self.record_delete(result.rowcount, CoverageZoneFootprint)
+        return result.rowcount > 0
+
+    async def get_footprints(self) -> List[Tuple[str, dict]]:
+        """Контуры всех зон (идентификатор зоны, полигон GeoJSON)"""
+        result = await self.session.execute(
+            select(
+                CoverageZoneFootprint.coverage_zone_id, CoverageZoneFootprint.geometry
+            )
+        )
+        return [(zone_id, geometry) for zone_id, geometry in result.all()]
+
+    async def get_models_by_ids(self, zone_ids: List[str]) -> List[CoverageZoneInDB]:
+        """Зоны по списку идентификаторов одним запросом, без загрузки связей"""
+        if not zone_ids:
+            return list()
+        query = (
+            select(*CoverageZone.__table__.c)
+            .where(
+                CoverageZone.id
+                == any_(bindparam("zone_ids", zone_ids, type_=ARRAY(String)))
+            )
+            .order_by(CoverageZone.id)
+        )
+        result = await self.session.execute(query)
+        return [CoverageZoneInDB(**row._mapping) for row in result.all()]
+
+    async def attach_regions(
+        self, zone_id: Object_str_ID, region_ids: List[int], subregion_ids: List[int]
+    ) -> Tuple[int, int]:
+        """
+        Привязывает к зоне регионы и подрегионы по идентификаторам: по одному
+        INSERT ... SELECT на таблицу связей, уже привязанные пропускаются.
+        Регионы найденных подрегионов привязываются вместе с ними.
+        :return: число добавленных связей (регионов, подрегионов)
+        """
+        zone = literal(zone_id.id, String)
+        subregions = select(zone, Subregion_DB.id).where(
+            Subregion_DB.id
+            == any_(bindparam("subregion_ids", subregion_ids, type_=ARRAY(Integer)))
+        )
+        regions = union(
+            select(Region.id.label("region_id")).where(
+                Region.id
+                == any_(bindparam("region_ids", region_ids, type_=ARRAY(Integer)))
+            ),
+            select(Subregion_DB.id_region).where(
+                Subregion_DB.id
+                == any_(
+                    bindparam(
+                        "region_subregion_ids", subregion_ids, type_=ARRAY(Integer)
+                    )
+                )
+            ),
+        ).subquery()
+        regions_added = await self.session.execute(
+            insert(coverage_zone_association)
+            .from_select(
+                ["coverage_zone_id", "region_id"], select(zone, regions.c.region_id)
+            )
+            .on_conflict_do_nothing()
+        )
+        subregions_added = await self.session.execute(
+            insert(coverage_zone_association_subregion)
+            .from_select(["coverage_zone_id", "subregion_id"], subregions)
+            .on_conflict_do_nothing()
+        )
+        self._expire_zone_links(zone_id)
+        return regions_added.rowcount, subregions_added.rowcount
@@ -0,0 +1,104 @@
+from .repository import BaseRepository
+from app.db import OrbitalElements, Satellite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from sqlalchemy import select, Row, Integer, String, any_, bindparam
+from app.schemas import OrbitalElementsBase, OrbitalElementsInDB, Object_str_ID
+from datetime import datetime
+from typing import Optional, Sequence, List, Dict, Tuple, Any
+
+
+class OrbitalElementsRepository(BaseRepository[OrbitalElements]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(OrbitalElements, session)
+        self.in_db_type = OrbitalElementsInDB
+
+    async def upsert_elements(
+        self, international_code: Object_str_ID, elements: OrbitalElementsBase
+    ) -> OrbitalElementsInDB:
+        """Сохраняет элементы орбиты спутника, заменяя предыдущий набор"""
+        values = elements.model_dump()
+        query = (
+            insert(OrbitalElements)
+            .values(international_code=international_code.id, **values)
+            .on_conflict_do_update(
+                index_elements=[OrbitalElements.international_code], set_=values
+            )
+        )
+        await self.session.execute(query)
+        self.expire_count()
+        return OrbitalElementsInDB(international_code=international_code.id, **values)
+
+    async def get_elements(
+        self, international_code: Object_str_ID
+    ) -> Optional[OrbitalElementsInDB]:
+        return await self.get_by_field(
+            field_name="international_code", field_value=international_code.id
+        )
+
+    async def get_all_elements(self) -> Sequence[Row]:
+        """
+        Элементы орбит всего каталога строками с полями OrbitalElementsInDB,
+        без создания ORM-объектов и Pydantic-моделей
+        """
+        query = select(*OrbitalElements.__table__.c).order_by(
+            OrbitalElements.international_code
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_elements_many(self, international_codes: List[str]) -> Sequence[Row]:
+        """Элементы орбит нескольких спутников строками, как get_all_elements"""
+        query = (
+            select(*OrbitalElements.__table__.c)
+            .where(
+                OrbitalElements.international_code
+                == any_(bindparam("codes", international_codes, type_=ARRAY(String)))
+            )
+            .order_by(OrbitalElements.international_code)
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_ingest_state(
+        self, norad_ids: List[int]
+    ) -> Dict[int, Tuple[str, Optional[datetime]]]:
+        """
+        Спутники с указанными NORAD ID одним запросом:
+        norad_id -> (международный код, эпоха сохраненных элементов или None)
+        """
+        query = (
+            select(
+                Satellite.norad_id,
+                Satellite.international_code,
+                OrbitalElements.epoch,
+            )
+            .outerjoin(
+                OrbitalElements,
+                OrbitalElements.international_code == Satellite.international_code,
+            )
+            .where(
+                Satellite.norad_id
+                == any_(bindparam("norad_ids", norad_ids, type_=ARRAY(Integer)))
+            )
+        )
+        result = await self.session.execute(query)
+        return {norad_id: (code, epoch) for norad_id, code, epoch in result.all()}
+
+    async def upsert_elements_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Сохраняет пачку наборов элементов одним INSERT ... ON CONFLICT.
+        Набор заменяется, только если его эпоха новее сохраненной.
+        """
+        query = insert(OrbitalElements)
+        query = query.on_conflict_do_update(
+            index_elements=[OrbitalElements.international_code],
+            set_={
+                column.name: query.excluded[column.name]
+                for column in OrbitalElements.__table__.c
+                if column.name != "international_code"
+            },
+            where=OrbitalElements.epoch < query.excluded.epoch,
+        )
+        await self.session.execute(query, rows)
+        self.expire_count()
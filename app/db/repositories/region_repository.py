@@ -1,12 +1,71 @@
-from .repository import BaseRepository
-from app.db import Region, Subregion
+from .repository import BaseRepository, T
+from app.db import Region, Subregion, RegionBoundary, SubregionBoundary
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas import RegionInDB, RegionBase, SubregionInDB, SubregionBase, Object_ID
-from typing import Optional, List
+from app.schemas import (
+    RegionInDB,
+    RegionBase,
+    SubregionInDB,
+    SubregionBase,
+    Object_ID,
+    FootprintGeometry,
+)
+from typing import Optional, List, Tuple, Type, Union
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 
+# Профили загрузки связей: остальные связи не загружаются (lazy="raise")
+REGION_SUBREGIONS = (selectinload(Region.subregions),)
+SUBREGION_REGION = (joinedload(Subregion.region),)
+
+
+class _BoundaryRepository(BaseRepository[T]):
+    """Границы (полигоны GeoJSON) регионов или подрегионов"""
+
+    boundary_model: Type[Union[RegionBoundary, SubregionBoundary]]
+
+    def _boundary_key(self):
+        return self.boundary_model.__table__.primary_key.columns[0]
+
+    async def set_boundary(
+        self, object_id: Object_ID, geometry: FootprintGeometry
+    ) -> bool:
+        """Сохраняет границу, заменяя предыдущую"""
+        if await self.get_by_id(object_id.id) is None:
+            return False
+        key = self._boundary_key()
+        values = geometry.model_dump()
+        query = (
+            insert(self.boundary_model)
+            .values({key: object_id.id, "geometry": values})
+            .on_conflict_do_update(index_elements=[key], set_={"geometry": values})
+        )
+        await self.session.execute(query)
+        self.expire_count(self.boundary_model)
+        return True
+
+    async def get_boundary(self, object_id: Object_ID) -> Optional[FootprintGeometry]:
+        geometry = (
+            await self.session.execute(
+                select(self.boundary_model.geometry).where(
+                    self._boundary_key() == object_id.id
+                )
+            )
+        ).scalar_one_or_none()
+        return FootprintGeometry.model_validate(geometry) if geometry else None
+
+    async def get_boundaries(self) -> List[Tuple[int, dict]]:
+        """Все границы (идентификатор, полигон GeoJSON)"""
+        result = await self.session.execute(
+            select(self._boundary_key(), self.boundary_model.geometry)
+        )
+        return [(object_id, geometry) for object_id, geometry in result.all()]
+
+
+class RegionRepository(_BoundaryRepository[Region]):
+    boundary_model = RegionBoundary
 
-class RegionRepository(BaseRepository[Region]):
     def __init__(self, session: AsyncSession):
         super().__init__(Region, session)
         self.in_db_type = RegionInDB
@@ -19,7 +78,7 @@ class RegionRepository(BaseRepository[Region]):
     async def get_subregions(
         self, region_id: Object_ID
     ) -> Optional[List[SubregionInDB]]:
-        db_region = await self.get_by_id(region_id.id)
+        db_region = await self.get_by_id(region_id.id, *REGION_SUBREGIONS)
         if db_region is None:
             return None
         db_subregions: List[Subregion] = db_region.subregions
@@ -29,7 +88,9 @@ class RegionRepository(BaseRepository[Region]):
         return subregions
 
 
-class SubregionRepository(BaseRepository[Subregion]):
+class SubregionRepository(_BoundaryRepository[Subregion]):
+    boundary_model = SubregionBoundary
+
     def __init__(self, session: AsyncSession):
         super().__init__(Subregion, session)
         self.in_db_type = SubregionInDB
@@ -42,7 +103,7 @@ class SubregionRepository(BaseRepository[Subregion]):
         )
 
     async def get_region(self, subregion_id: Object_ID) -> Optional[RegionInDB]:
-        db_subregion = await self.get_by_id(subregion_id.id)
+        db_subregion = await self.get_by_id(subregion_id.id, *SUBREGION_REGION)
         if db_subregion is None:
             return None
         db_region: Region = db_subregion.region
@@ -50,7 +111,9 @@ class SubregionRepository(BaseRepository[Subregion]):
 
     async def delete_model(self, object_id: Object_ID) -> bool:
         try:
-            subregion = await self.session.get(Subregion, object_id.id)
+            subregion = await self.session.get(
+                Subregion, object_id.id, options=SUBREGION_REGION
+            )
             if subregion:
                 await self.session.delete(subregion)
                 await self.session.flush()
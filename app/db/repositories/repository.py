@@ -1,15 +1,71 @@
-from typing import Generic, Type, TypeVar, Any, Optional, Sequence, cast, List, Union
-from pydantic import BaseModel
+import base64
+import binascii
+import json
+from functools import lru_cache
+from typing import (
+    Generic,
+    Type,
+    TypeVar,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+    List,
+    Union,
+)
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, Column, update, func
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy import select, delete, Column, update, func, inspect
 
-from app.schemas import Object_ID, PaginationBase, Object_str_ID
+from app.core import entity_counters
+from app.schemas import (
+    Object_ID,
+    PaginationBase,
+    Object_str_ID,
+    CursorPagination,
+    CursorPage,
+)
 
 T = TypeVar("T", bound="Base")
 
 
+def encode_cursor(key: Any) -> str:
+    """Кодирует значение первичного ключа в непрозрачный курсор"""
+    raw = json.dumps([key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: type) -> Any:
+    """Раскодирует курсор, ValueError если курсор поврежден или другого типа"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        (key,) = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if type(key) is not key_type:
+        raise ValueError("Invalid cursor")
+    return key
+
+
+@lru_cache(maxsize=None)
+def projection_columns(model: type, model_type: Type[BaseModel]) -> Tuple:
+    """Колонки таблицы модели, объявленные полями выходной схемы"""
+    attributes = inspect(model).column_attrs
+    return tuple(
+        getattr(model, name) for name in model_type.model_fields if name in attributes
+    )
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model_type: Type[BaseModel]) -> TypeAdapter:
+    """Валидатор списка выходных моделей за один вызов"""
+    return TypeAdapter(List[model_type])  # type: ignore[valid-type]
+
+
 class Repository(Generic[T]):
 
     def __init__(self, model: Type[T], session: AsyncSession):
@@ -28,9 +84,15 @@ class Repository(Generic[T]):
             await self.session.rollback()
             return None
 
-    async def get_by_id(self, object_id: Any) -> Optional[T]:
+    async def get_by_id(
+        self, object_id: Any, *options: ExecutableOption
+    ) -> Optional[T]:
+        """
+        Сущность по первичному ключу. Связи моделей не загружаются (lazy="raise"),
+        нужные методу передаются профилем загрузки в options.
+        """
         id_column = cast(Column, self.model.id)
-        query = select(self.model).where(id_column == object_id)
+        query = select(self.model).where(id_column == object_id).options(*options)
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
@@ -39,6 +101,7 @@ class Repository(Generic[T]):
         query = delete(self.model).where(id_column == object_id)
         result = await self.session.execute(query)
         number_lines_removed: int = result.rowcount  # type: ignore[attr-defined]
+        self.record_delete(number_lines_removed)
         return number_lines_removed > 0
 
     async def get_multi(self, limit: int = 10, offset: int = 0) -> Sequence[T]:
@@ -46,6 +109,17 @@ class Repository(Generic[T]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    def get_key_column(self) -> Column:
+        return inspect(self.model).primary_key[0]
+
+    async def get_multi_after(self, limit: int, after: Any = None) -> Sequence[T]:
+        key_column = self.get_key_column()
+        query = select(self.model).order_by(key_column).limit(limit)
+        if after is not None:
+            query = query.where(key_column > after)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
     async def update(self, object_id: Any, **kwargs) -> Optional[T]:
         try:
             id_column = cast(Column, self.model.id)
@@ -57,13 +131,44 @@ class Repository(Generic[T]):
                 await self.session.rollback()
             return None
 
+    def record_count(self, delta: int, model: Optional[type] = None) -> None:
+        """Изменение числа строк Core-запросом INSERT/DELETE (ORM учитывается сам)"""
+        table_name = (self.model if model is None else model).__tablename__
+        entity_counters.record(self.session, table_name, delta)
+
+    def record_delete(self, deleted: int, model: Optional[type] = None) -> None:
+        """Удаление строк Core-запросом DELETE с учетом каскада ON DELETE CASCADE"""
+        table = (self.model if model is None else model).__table__
+        entity_counters.record_delete(self.session, table, deleted)
+
+    def expire_count(self, model: Optional[type] = None) -> None:
+        """INSERT ... ON CONFLICT DO UPDATE: число вставленных строк неизвестно"""
+        table_name = (self.model if model is None else model).__tablename__
+        entity_counters.expire(self.session, table_name)
+
     async def get_count(self) -> Optional[int]:
+        """
+        Количество строк из счетчика в памяти с учетом изменений текущей
+        транзакции, COUNT(*) выполняется только при сверке счетчика
+        """
+        table_name = self.model.__tablename__
+        # Несохраненные объекты попадают в изменения транзакции только при flush
+        await self.session.flush()
+        pending = entity_counters.pending(self.session, table_name)
+        count = entity_counters.get(table_name)
+        if count is not None:
+            return count + pending
+        version = entity_counters.version(table_name)
         try:
             query = select(func.count(self.model.id))
             result = await self.session.execute(query)
-            return result.scalar()
+            count = result.scalar()
         except SQLAlchemyError:
             return None
+        # COUNT(*) видит незафиксированные строки сессии, такое значение не сохраняется
+        if not pending:
+            entity_counters.load(table_name, count, version)
+        return count
 
 
 class BaseRepository(Repository[T]):
@@ -89,6 +194,48 @@ class BaseRepository(Repository[T]):
         db_objects = await self.get_multi(**pagination.model_dump())
         return await self._convert_to_list_model(db_objects)
 
+    async def get_projected(
+        self, pagination: PaginationBase, as_dict: bool = False
+    ) -> List:
+        """
+        Получение сущностей без создания ORM-объектов: выбираются только колонки
+        полей in_db_type, строки валидируются сразу в выходные модели.
+        :param as_dict: вернуть словари строк без валидации (для сериализации)
+        """
+        if self.in_db_type is None:
+            return list()
+        columns = projection_columns(self.model, self.in_db_type)
+        query = select(*columns).offset(pagination.offset).limit(pagination.limit)
+        result = await self.session.execute(query)
+        keys = result.keys()
+        rows = [dict(zip(keys, row)) for row in result.all()]
+        if as_dict:
+            return rows
+        return list_adapter(self.in_db_type).validate_python(rows)
+
+    async def get_page(self, pagination: CursorPagination) -> Optional[CursorPage]:
+        """
+        Keyset-пагинация по первичному ключу: страница выбирается по индексу
+        начиная с ключа из курсора, поэтому её стоимость не зависит от глубины.
+        Возвращает None, если курсор невалиден.
+        """
+        key_column = self.get_key_column()
+        after = None
+        if pagination.cursor is not None:
+            try:
+                after = decode_cursor(pagination.cursor, key_column.type.python_type)
+            except ValueError:
+                return None
+        db_objects = await self.get_multi_after(pagination.limit + 1, after)
+        next_cursor = None
+        if len(db_objects) > pagination.limit:
+            db_objects = db_objects[: pagination.limit]
+            next_cursor = encode_cursor(getattr(db_objects[-1], key_column.key))
+        return CursorPage(
+            items=await self._convert_to_list_model(db_objects),
+            next_cursor=next_cursor,
+        )
+
     async def delete_model(self, object_id: Union[Object_ID, Object_str_ID]) -> bool:
         try:
             result = await self.delete_by_id(object_id.id)
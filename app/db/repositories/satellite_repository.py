@@ -1,6 +1,7 @@
 from .repository import BaseRepository
-from app.db import Satellite, SatelliteCharacteristic
+from app.db import Satellite, SatelliteCharacteristic, CoverageZone, Country
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core import entity_counters
 from app.schemas import (
     SatelliteCreate,
     SatelliteInDB,
@@ -9,16 +10,34 @@ from app.schemas import (
     SatelliteCompleteInfo,
     SatelliteUpdate,
     SatelliteCharacteristicUpdate,
+    SatelliteBulkItem,
+    SatelliteBulkResult,
+    BulkItemStatus,
 )
-from typing import Optional
+from typing import Optional, AsyncIterator, Sequence, List, Dict, Tuple
 from app.schemas import Object_str_ID
-from sqlalchemy import select, delete, Column, update
+from sqlalchemy import (
+    select,
+    delete,
+    Column,
+    update,
+    func,
+    RowMapping,
+    any_,
+    bindparam,
+    String,
+)
+from sqlalchemy.orm import joinedload
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert, ARRAY
 from typing import Type, TypeVar, cast
 from sqlalchemy.exc import SQLAlchemyError
 
 
 T = TypeVar("T", bound="Base")
 
+# Профиль загрузки: спутник с характеристиками одним JOIN
+SATELLITE_CHARACTERISTICS = (joinedload(Satellite.characteristics),)
+
 
 async def update_model_by_international_code(
     session: AsyncSession, model_object: Type[T], object_id: str, **kwargs
@@ -44,6 +63,7 @@ async def delete_model_by_international_code(
     query = delete(model).where(international_code_column == object_id.id)
     result = await session.execute(query)
     number_lines_removed: int = result.rowcount  # type: ignore[attr-defined]
+    entity_counters.record_delete(session, model.__table__, number_lines_removed)
     return number_lines_removed > 0
 
 
@@ -73,6 +93,22 @@ class SatelliteCharacteristicRepository(BaseRepository[SatelliteCharacteristic])
             field_name="international_code", field_value=object_id.id
         )
 
+    async def get_longitude_slots(self) -> List[Tuple[str, float]]:
+        """Точки стояния (международный код, долгота), отсортированные по долготе"""
+        query = (
+            select(
+                SatelliteCharacteristic.international_code,
+                SatelliteCharacteristic.longitude,
+            )
+            .where(SatelliteCharacteristic.longitude.is_not(None))
+            .order_by(
+                SatelliteCharacteristic.longitude,
+                SatelliteCharacteristic.international_code,
+            )
+        )
+        result = await self.session.execute(query)
+        return [(code, longitude) for code, longitude in result.all()]
+
 
 class SatelliteRepository(BaseRepository[Satellite]):
     def __init__(self, session: AsyncSession):
@@ -114,13 +150,122 @@ class SatelliteRepository(BaseRepository[Satellite]):
             **characteristic.model_dump(exclude={"international_code"})
         )
 
+    async def create_satellites_bulk(
+        self, items: List[SatelliteBulkItem]
+    ) -> List[SatelliteBulkResult]:
+        """
+        Пакетное создание спутников с характеристиками многострочными
+        INSERT ... ON CONFLICT DO NOTHING. Строки, конфликтующие с БД или
+        с предыдущими строками пакета, пропускаются и помечаются в отчете.
+        """
+        country_ids = {item.satellite.country_id for item in items}
+        existing_country_ids = set(
+            (
+                await self.session.execute(
+                    select(Country.id).where(Country.id.in_(country_ids))
+                )
+            ).scalars()
+        )
+        rejected: Dict[int, Tuple[BulkItemStatus, str]] = dict()
+        candidates: Dict[str, int] = dict()
+        seen_names, seen_norad_ids = set(), set()
+        for index, item in enumerate(items):
+            satellite = item.satellite
+            if item.characteristic.international_code != satellite.international_code:
+                rejected[index] = (
+                    BulkItemStatus.INVALID,
+                    "Characteristic belongs to another international code",
+                )
+            elif satellite.country_id not in existing_country_ids:
+                rejected[index] = (BulkItemStatus.INVALID, "Country not found")
+            elif (
+                satellite.international_code in candidates
+                or satellite.name_satellite in seen_names
+                or satellite.norad_id in seen_norad_ids
+            ):
+                rejected[index] = (BulkItemStatus.CONFLICT, "Duplicate in batch")
+            else:
+                candidates[satellite.international_code] = index
+                seen_names.add(satellite.name_satellite)
+                seen_norad_ids.add(satellite.norad_id)
+
+        created_codes = set()
+        if candidates:
+            query = (
+                insert(Satellite)
+                .on_conflict_do_nothing()
+                .returning(Satellite.international_code)
+            )
+            rows = [
+                items[index].satellite.model_dump() for index in candidates.values()
+            ]
+            created_codes = set((await self.session.execute(query, rows)).scalars())
+        if created_codes:
+            await self.session.execute(
+                insert(SatelliteCharacteristic),
+                [
+                    items[candidates[code]].characteristic.model_dump()
+                    for code in created_codes
+                ],
+            )
+            self.record_count(len(created_codes))
+            self.record_count(len(created_codes), SatelliteCharacteristic)
+        for code, index in candidates.items():
+            if code not in created_codes:
+                rejected[index] = (
+                    BulkItemStatus.CONFLICT,
+                    "Satellite with such data already exists",
+                )
+
+        results = list()
+        for index, item in enumerate(items):
+            status, detail = rejected.get(index, (BulkItemStatus.CREATED, None))
+            results.append(
+                SatelliteBulkResult(
+                    international_code=item.satellite.international_code,
+                    status=status,
+                    detail=detail,
+                )
+            )
+        return results
+
     async def get_complete_info(
         self, satellite_id: Object_str_ID
     ) -> Optional[SatelliteCompleteInfo]:
-        query = select(Satellite).where(Satellite.international_code == satellite_id.id)
+        query = (
+            select(Satellite)
+            .where(Satellite.international_code == satellite_id.id)
+            .options(*SATELLITE_CHARACTERISTICS)
+        )
         satellite: Optional[Satellite] = (
             await self.session.execute(query)
         ).scalar_one_or_none()
+        return self._to_complete_info(satellite)
+
+    async def get_complete_info_many(
+        self, international_codes: List[str]
+    ) -> Dict[str, SatelliteCompleteInfo]:
+        """Полная информация о нескольких спутниках одним запросом с = ANY(...)"""
+        query = (
+            select(Satellite)
+            .where(
+                Satellite.international_code
+                == any_(bindparam("codes", international_codes, type_=ARRAY(String)))
+            )
+            .options(*SATELLITE_CHARACTERISTICS)
+        )
+        satellites = (await self.session.execute(query)).scalars().all()
+        complete_info = dict()
+        for satellite in satellites:
+            satellite_info = self._to_complete_info(satellite)
+            if satellite_info is not None:
+                complete_info[satellite.international_code] = satellite_info
+        return complete_info
+
+    @staticmethod
+    def _to_complete_info(
+        satellite: Optional[Satellite],
+    ) -> Optional[SatelliteCompleteInfo]:
         if satellite is None:
             return None
         satellite_data = SatelliteInDB(**satellite.__dict__)
@@ -134,3 +279,36 @@ class SatelliteRepository(BaseRepository[Satellite]):
                 **satellite_data.model_dump(), **dict_satellite_characteristic
             )
         return None
+
+    async def stream_catalog(
+        self, batch_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Построчное чтение всего каталога серверным курсором: спутник,
+        его характеристики и id зон покрытия одной плоской строкой.
+        Строки отдаются пачками по batch_size без создания ORM-объектов.
+        """
+        characteristic_columns = [
+            column
+            for column in SatelliteCharacteristic.__table__.c
+            if column.key != "international_code"
+        ]
+        coverage_zone_ids = (
+            select(func.array_agg(aggregate_order_by(CoverageZone.id, CoverageZone.id)))
+            .where(CoverageZone.satellite_code == Satellite.international_code)
+            .scalar_subquery()
+            .label("coverage_zone_ids")
+        )
+        query = (
+            select(*Satellite.__table__.c, *characteristic_columns, coverage_zone_ids)
+            .outerjoin(
+                SatelliteCharacteristic,
+                SatelliteCharacteristic.international_code
+                == Satellite.international_code,
+            )
+            .order_by(Satellite.international_code)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for rows in result.mappings().partitions():
+            yield rows
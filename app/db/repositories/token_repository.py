@@ -2,7 +2,7 @@ from .repository import BaseRepository
 from app.db import RefreshToken
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import RefreshTokenInDB, Object_ID
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select, delete
 from datetime import datetime, timezone
 
@@ -30,6 +30,17 @@ class TokenRepository(BaseRepository[RefreshToken]):
             await self.session.flush()
         return tokens_list
 
+    async def get_refresh_token_by_jti(self, jti: str) -> Optional[RefreshTokenInDB]:
+        query = select(RefreshToken).where(RefreshToken.jti == jti)
+        token = (await self.session.execute(query)).scalar_one_or_none()
+        if token is None:
+            return None
+        if token.expires_at < datetime.now(timezone.utc):
+            await self.delete_refresh_token(Object_ID(id=token.id))
+            await self.session.flush()
+            return None
+        return RefreshTokenInDB(**token.__dict__)
+
     async def delete_refresh_token(self, refresh_token_id: Object_ID) -> bool:
         return await self.delete_model(refresh_token_id)
 
@@ -37,4 +48,5 @@ class TokenRepository(BaseRepository[RefreshToken]):
         query = delete(RefreshToken).where(RefreshToken.user_id == user_id.id)
         result = await self.session.execute(query)
         number_lines_removed: int = result.rowcount  # type: ignore[attr-defined]
+        self.record_delete(number_lines_removed)
         return number_lines_removed > 0
@@ -1,7 +1,7 @@
 from .repository import BaseRepository
 from app.db import User
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas import UserInDB, UserEmail
+from app.schemas import UserInDB, UserEmail, Object_ID
 from typing import Optional
 from sqlalchemy import select, delete
 
@@ -21,8 +21,14 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_role_by_id(self, user_id: Object_ID) -> Optional[str]:
+        query = select(User.role).where(User.id == user_id.id)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def delete_model_by_email(self, email: UserEmail) -> bool:
         query = delete(User).where(User.email == email.email)
         result = await self.session.execute(query)
         number_lines_removed: int = result.rowcount  # type: ignore[attr-defined]
+        self.record_delete(number_lines_removed)
         return number_lines_removed > 0
@@ -1,3 +1,4 @@
+from contextlib import AsyncExitStack, asynccontextmanager
 from fastapi import FastAPI
 from app.api import (
     country_api,
@@ -6,9 +7,31 @@ from app.api import (
     coverage_zone_api,
     user_api,
     auth_api,
+    metrics_api,
+    orbit_api,
 )
+from app.api.v1.helpers import ORJSONResponse
+from app.core import async_engine, warm_up_pool
+from app.s3_service import S3Service
+from app.service import password_hasher, conjunction_screener, screening_job
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Ресурсы освобождаются в обратном порядке регистрации,
+    # ошибка одного шага не прерывает остальные
+    async with AsyncExitStack() as stack:
+        stack.push_async_callback(async_engine.dispose)
+        stack.callback(conjunction_screener.shutdown)
+        stack.push_async_callback(screening_job.cancel)
+        stack.callback(password_hasher.shutdown)
+        await S3Service.start()
+        stack.push_async_callback(S3Service.close)
+        await warm_up_pool()
+        yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Подключаем роутеры из разных файлов
 app.include_router(country_api.router, prefix="/country", tags=["country"])
@@ -19,3 +42,5 @@ app.include_router(
 )
 app.include_router(user_api.router, prefix="/user", tags=["user"])
 app.include_router(auth_api.router, prefix="/auth", tags=["auth"])
+app.include_router(metrics_api.router, prefix="/metrics", tags=["metrics"])
+app.include_router(orbit_api.router, prefix="/orbit", tags=["orbit"])
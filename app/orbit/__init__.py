@@ -0,0 +1,104 @@
+from .propagation import (
+    PropagationResult,
+    satrec_from_elements,
+    elements_from_tle,
+    to_datetime64,
+    from_datetime64,
+    julian_dates,
+    propagate,
+    sgp4_error_message,
+)
+from .geometry import (
+    LookAngles,
+    gmst,
+    teme_to_ecef,
+    geodetic_to_ecef,
+    geostationary_ecef,
+    look_angles,
+    geostationary_look_angles,
+    is_geostationary,
+)
+from .visibility import (
+    GroundPoint,
+    PassEvent,
+    PassWindow,
+    SatelliteTrack,
+    predict_passes,
+)
+from .conjunctions import (
+    CloseApproach,
+    orbit_shells,
+    shell_overlap_mask,
+    close_pairs,
+    screen_window,
+    screen_elements,
+    merge_approaches,
+)
+from .coverage import (
+    Rings,
+    PolygonIndex,
+    PackedRTree,
+    normalize_ring,
+    normalize_polygon,
+    polygon_bounds,
+    points_in_polygon,
+    polygon_intersects_box,
+    polygons_intersect,
+)
+from .footprints import (
+    coverage_angle,
+    destination_points,
+    visibility_contours,
+    beam_contours,
+)
+from .slots import LongitudeSlotIndex, longitude_distance
+from .element_sets import ElementSetRecord, ElementSetReader, omm_to_record
+
+__all__ = [
+    "PropagationResult",
+    "satrec_from_elements",
+    "elements_from_tle",
+    "to_datetime64",
+    "from_datetime64",
+    "julian_dates",
+    "propagate",
+    "sgp4_error_message",
+    "ElementSetRecord",
+    "ElementSetReader",
+    "omm_to_record",
+    "LongitudeSlotIndex",
+    "longitude_distance",
+    "Rings",
+    "PolygonIndex",
+    "PackedRTree",
+    "normalize_ring",
+    "normalize_polygon",
+    "polygon_bounds",
+    "points_in_polygon",
+    "polygon_intersects_box",
+    "polygons_intersect",
+    "coverage_angle",
+    "destination_points",
+    "visibility_contours",
+    "beam_contours",
+    "LookAngles",
+    "gmst",
+    "teme_to_ecef",
+    "geodetic_to_ecef",
+    "geostationary_ecef",
+    "look_angles",
+    "geostationary_look_angles",
+    "is_geostationary",
+    "GroundPoint",
+    "PassEvent",
+    "PassWindow",
+    "SatelliteTrack",
+    "predict_passes",
+    "CloseApproach",
+    "orbit_shells",
+    "shell_overlap_mask",
+    "close_pairs",
+    "screen_window",
+    "screen_elements",
+    "merge_approaches",
+]
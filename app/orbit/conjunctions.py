@@ -0,0 +1,327 @@
+from collections import defaultdict
+from itertools import product
+from math import sqrt
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sgp4.api import Satrec
+
+from app.schemas import OrbitalElementsBase
+from .propagation import julian_dates, propagate, satrec_from_elements
+from .visibility import MAX_GRID_POINTS
+
+# Радиус Земли модели SGP4 (WGS72), км
+SGP4_EARTH_RADIUS_KM = 6378.135
+# Запас к радиусам перигея/апогея по средним элементам: короткопериодические
+# возмущения и торможение в атмосфере за окно расчета
+SHELL_MARGIN_KM = 50.0
+# Оценка сверху градиента притяжения Земли (3μ/R³), 1/с²: относительное ускорение
+# двух спутников не больше произведения градиента на расстояние между ними
+GRAVITY_GRADIENT = 3 * 398600.4418 / SGP4_EARTH_RADIUS_KM**3
+# Точность момента наибольшего сближения, с
+TCA_TOLERANCE_SECONDS = 0.001
+TCA_MAX_ITERATIONS = 20
+# Ключ ячейки сетки: по 21 бит на координату
+_CELL_BITS = 21
+_CELL_OFFSET = 1 << (_CELL_BITS - 1)
+# Половина окрестности 3x3x3 вместе с самой ячейкой: каждая пара соседних
+# ячеек просматривается ровно один раз
+_NEIGHBOR_OFFSETS = [
+    offset for offset in product((-1, 0, 1), repeat=3) if offset >= (0, 0, 0)
+]
+
+
+class CloseApproach(NamedTuple):
+    """
+    Сближение пары спутников: first < second - индексы во входном списке,
+    tca - момент наибольшего сближения
+    """
+
+    first: int
+    second: int
+    tca: np.datetime64
+    miss_distance_km: float
+    relative_speed_kms: float
+
+
+def orbit_shells(satrecs: Sequence[Satrec]) -> Tuple[np.ndarray, np.ndarray]:
+    """Геоцентрические радиусы перигея и апогея по средним элементам, км"""
+    semi_major_axis = np.array([satrec.a for satrec in satrecs]) * SGP4_EARTH_RADIUS_KM
+    eccentricity = np.array([satrec.ecco for satrec in satrecs])
+    return semi_major_axis * (1 - eccentricity), semi_major_axis * (1 + eccentricity)
+
+
+def shell_overlap_mask(
+    perigee: np.ndarray, apogee: np.ndarray, margin_km: float
+) -> np.ndarray:
+    """
+    Спутники, диапазон высот которых пересекается хотя бы с одним другим.
+    Остальные ни с кем сблизиться не могут и в расчет не берутся.
+    """
+    order = np.argsort(perigee)
+    sorted_perigee, sorted_apogee = perigee[order], apogee[order]
+    # Пересечение с предыдущим по перигею: наибольший апогей среди предыдущих
+    previous_apogee = np.concatenate(
+        ([-np.inf], np.maximum.accumulate(sorted_apogee)[:-1])
+    )
+    # Пересечение с последующим достаточно проверить для ближайшего по перигею
+    next_perigee = np.concatenate((sorted_perigee[1:], [np.inf]))
+    overlaps = (previous_apogee + margin_km >= sorted_perigee) | (
+        next_perigee <= sorted_apogee + margin_km
+    )
+    mask = np.empty_like(overlaps)
+    mask[order] = overlaps
+    return mask
+
+
+def _cell_keys(cells: np.ndarray) -> np.ndarray:
+    shifted = cells + _CELL_OFFSET
+    return (
+        (shifted[:, 0] << (2 * _CELL_BITS))
+        | (shifted[:, 1] << _CELL_BITS)
+        | shifted[:, 2]
+    )
+
+
+def close_pairs(positions: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Все пары точек (i < j) на расстоянии не больше radius.
+    Точки раскладываются по кубической сетке с ребром radius, расстояния
+    считаются только до точек соседних ячеек - O(n) вместо O(n²).
+    """
+    count = len(positions)
+    if count < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # Ребро ячейки не меньше, чем нужно, чтобы номера ячеек уместились в ключ
+    cell_size = max(radius, float(np.abs(positions).max()) / (_CELL_OFFSET - 2))
+    cells = np.floor(positions / cell_size).astype(np.int64)
+    order = np.argsort(_cell_keys(cells))
+    sorted_keys = _cell_keys(cells[order])
+    firsts, seconds = list(), list()
+    for offset in _NEIGHBOR_OFFSETS:
+        # Ключ линеен по номерам ячеек: ключи соседей тоже отсортированы,
+        # и бинарный поиск идет по возрастающим значениям
+        dx, dy, dz = offset
+        neighbor_keys = sorted_keys + ((dx << 2 * _CELL_BITS) + (dy << _CELL_BITS) + dz)
+        low = np.searchsorted(sorted_keys, neighbor_keys, "left")
+        counts = np.searchsorted(sorted_keys, neighbor_keys, "right") - low
+        total = int(counts.sum())
+        if not total:
+            continue
+        first = np.repeat(order, counts)
+        # Номер каждой пары внутри диапазона ее ячейки
+        shift = np.repeat(low - (np.cumsum(counts) - counts), counts)
+        second = order[shift + np.arange(total)]
+        if offset == (0, 0, 0):
+            keep = first < second
+            first, second = first[keep], second[keep]
+        firsts.append(first)
+        seconds.append(second)
+    if not firsts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    first, second = np.concatenate(firsts), np.concatenate(seconds)
+    distance = np.linalg.norm(positions[first] - positions[second], axis=-1)
+    keep = distance <= radius
+    first, second = first[keep], second[keep]
+    return np.minimum(first, second), np.maximum(first, second)
+
+
+def _relative_state(first: Satrec, second: Satrec, jd: float, fr: float):
+    """Относительные положение и скорость пары; None при ошибке SGP4"""
+    first_error, first_position, first_velocity = first.sgp4(jd, fr)
+    second_error, second_position, second_velocity = second.sgp4(jd, fr)
+    if first_error or second_error:
+        return None
+    return (
+        [a - b for a, b in zip(first_position, second_position)],
+        [a - b for a, b in zip(first_velocity, second_velocity)],
+    )
+
+
+def _closest_approach(
+    first: Satrec,
+    second: Satrec,
+    jd: float,
+    fr: float,
+    offset: float,
+    low: float,
+    high: float,
+) -> Optional[Tuple[float, float, float]]:
+    """
+    Момент наибольшего сближения пары на интервале [low, high] секунд от jd + fr.
+    Начиная с offset, момент сдвигается к минимуму расстояния при линейном
+    относительном движении, пока сдвиг не станет меньше TCA_TOLERANCE_SECONDS.
+    :return: смещение момента сближения, расстояние и относительная скорость;
+    None, если минимум не внутри интервала
+    """
+    for _ in range(TCA_MAX_ITERATIONS):
+        state = _relative_state(first, second, jd, fr + offset / 86400.0)
+        if state is None:
+            return None
+        position, velocity = state
+        speed_squared = sum(v * v for v in velocity)
+        if speed_squared == 0:
+            break
+        shift = -sum(r * v for r, v in zip(position, velocity)) / speed_squared
+        offset = min(max(offset + shift, low), high)
+        if abs(shift) < TCA_TOLERANCE_SECONDS:
+            break
+    if offset in (low, high):
+        return None
+    state = _relative_state(first, second, jd, fr + offset / 86400.0)
+    if state is None:
+        return None
+    position, velocity = state
+    return (
+        offset,
+        sqrt(sum(r * r for r in position)),
+        sqrt(sum(v * v for v in velocity)),
+    )
+
+
+def _local_minima(steps: List[Tuple[int, float]]) -> List[int]:
+    """
+    Шаги сетки, на которых оценка расстояния пары не больше, чем на соседних.
+    Соседние шаги, не попавшие в кандидаты, заведомо дальше.
+    """
+    distances = dict(steps)
+    return [
+        k
+        for k, distance in steps
+        if distance <= distances.get(k - 1, float("inf"))
+        and distance < distances.get(k + 1, float("inf"))
+    ]
+
+
+def screen_window(
+    satrecs: Sequence[Satrec],
+    start: np.datetime64,
+    offsets: np.ndarray,
+    step_seconds: float,
+    threshold_km: float,
+) -> List[CloseApproach]:
+    """
+    Поиск сближений ближе threshold_km в моменты start + offsets (с) с шагом
+    step_seconds. На каждом шаге пары-кандидаты отбираются по пространственной
+    сетке, диапазонам высот и оценке сближения при равномерном относительном
+    движении, затем момент сближения уточняется для каждой пары.
+    """
+    count = len(satrecs)
+    if count < 2 or not len(offsets):
+        return list()
+    perigee, apogee = orbit_shells(satrecs)
+    moments = start + np.round(offsets * 1e6).astype("timedelta64[us]")
+    # Наибольшее сближение не дальше половины шага от ближайшего момента сетки:
+    # за это время пара смещается на скорость x полшага, а отклонение от
+    # равномерного движения ограничено градиентом притяжения
+    half_step = step_seconds / 2
+    gradient_margin = GRAVITY_GRADIENT * half_step**2 / 2
+    shell_margin = SHELL_MARGIN_KM + threshold_km
+    # Пара -> шаги сетки, на которых она попала в кандидаты, и оценка расстояния
+    candidates: Dict[Tuple[int, int], List[Tuple[int, float]]] = defaultdict(list)
+    chunk_size = max(1, MAX_GRID_POINTS // count)
+    for chunk_start in range(0, len(moments), chunk_size):
+        result = propagate(satrecs, moments[chunk_start : chunk_start + chunk_size])
+        for k in range(result.errors.shape[1]):
+            valid = np.flatnonzero(result.errors[:, k] == 0)
+            if len(valid) < 2:
+                continue
+            positions = result.positions[valid, k]
+            velocities = result.velocities[valid, k]
+            max_speed = float(np.linalg.norm(velocities, axis=-1).max())
+            radius = (threshold_km + 2 * max_speed * half_step) * (
+                1 + 2 * gradient_margin
+            )
+            first, second = close_pairs(positions, radius)
+            if not len(first):
+                continue
+            relative_position = positions[first] - positions[second]
+            relative_velocity = velocities[first] - velocities[second]
+            first, second = valid[first], valid[second]
+            # Расстояние при равномерном относительном движении в пределах полшага
+            speed_squared = np.einsum("ij,ij->i", relative_velocity, relative_velocity)
+            shift = np.clip(
+                -np.einsum("ij,ij->i", relative_position, relative_velocity)
+                / np.maximum(speed_squared, 1e-12),
+                -half_step,
+                half_step,
+            )
+            estimate = np.linalg.norm(
+                relative_position + relative_velocity * shift[:, np.newaxis], axis=-1
+            )
+            separation = (
+                np.linalg.norm(relative_position, axis=-1)
+                + np.sqrt(speed_squared) * half_step
+            )
+            keep = (estimate <= threshold_km + gradient_margin * separation) & (
+                (perigee[first] <= apogee[second] + shell_margin)
+                & (perigee[second] <= apogee[first] + shell_margin)
+            )
+            for i, j, pair_estimate in zip(
+                first[keep].tolist(), second[keep].tolist(), estimate[keep].tolist()
+            ):
+                candidates[i, j].append((chunk_start + k, pair_estimate))
+
+    (jd,), (fr,) = julian_dates(np.array([start]))
+    approaches = list()
+    for (i, j), steps in candidates.items():
+        for k in _local_minima(steps):
+            offset = float(offsets[k])
+            # Минимум на краю интервала - сближение за пределами окна расчета
+            closest = _closest_approach(
+                satrecs[i],
+                satrecs[j],
+                jd,
+                fr,
+                offset,
+                offset - step_seconds,
+                offset + step_seconds,
+            )
+            if closest is None or closest[1] > threshold_km:
+                continue
+            tca, miss_distance, relative_speed = closest
+            approaches.append(
+                CloseApproach(
+                    i,
+                    j,
+                    start + np.timedelta64(round(tca * 1e6), "us"),
+                    miss_distance,
+                    relative_speed,
+                )
+            )
+    return merge_approaches(approaches, step_seconds)
+
+
+def screen_elements(
+    elements: Sequence[OrbitalElementsBase],
+    start: np.datetime64,
+    offsets: np.ndarray,
+    step_seconds: float,
+    threshold_km: float,
+) -> List[CloseApproach]:
+    """screen_window по элементам орбит - для запуска в отдельном процессе"""
+    satrecs = [satrec_from_elements(item) for item in elements]
+    return screen_window(satrecs, start, offsets, step_seconds, threshold_km)
+
+
+def merge_approaches(
+    approaches: Sequence[CloseApproach], step_seconds: float
+) -> List[CloseApproach]:
+    """
+    Одно сближение вместо нескольких найденных с соседних шагов сетки
+    (или из соседних частей окна): у пары оставляется ближайшее из сближений,
+    разделенных меньше чем шагом сетки
+    """
+    window = np.timedelta64(round(step_seconds * 1e6), "us")
+    merged = list()
+    for approach in sorted(approaches, key=lambda item: item[:3]):
+        if (
+            merged
+            and merged[-1][:2] == approach[:2]
+            and approach.tca - merged[-1].tca < window
+        ):
+            if approach.miss_distance_km < merged[-1].miss_distance_km:
+                merged[-1] = approach
+            continue
+        merged.append(approach)
+    return merged
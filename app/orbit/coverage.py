@@ -0,0 +1,358 @@
+from math import ceil, sqrt
+from time import monotonic
+from typing import Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+# Полигон: список колец (внешнее и дыры), каждое - массив (k, 2) долгот и широт
+Rings = List[np.ndarray]
+# Сдвиги долготы запроса: полигоны, пересекающие антимеридиан, хранятся
+# с непрерывной долготой и могут выходить за ±180
+_LONGITUDE_SHIFTS = (-360.0, 0.0, 360.0)
+# Пар ребер за один шаг проверки пересечения колец
+_EDGE_PAIRS_CHUNK = 1 << 20
+# Ключ полигона в индексе: идентификатор зоны, региона или подрегиона
+K = TypeVar("K", str, int)
+
+
+def normalize_ring(coordinates: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Кольцо GeoJSON [[долгота, широта], ...] в замкнутый массив (k, 2) с непрерывной
+    долготой: ребро всегда идет по кратчайшему пути, поэтому переход через
+    антимеридиан (179 -> -179) дает долготу 181. Первая вершина - в [-180, 180).
+    """
+    ring = np.asarray(coordinates, dtype=np.float64)[:, :2]
+    if not np.array_equal(ring[0], ring[-1]):
+        ring = np.vstack((ring, ring[:1]))
+    longitudes = np.unwrap(ring[:, 0], period=360.0)
+    longitudes -= 360.0 * np.floor((longitudes[0] + 180.0) / 360.0)
+    return np.column_stack((longitudes, ring[:, 1]))
+
+
+def normalize_polygon(coordinates: Sequence[Sequence[Sequence[float]]]) -> Rings:
+    """
+    Кольца полигона в одной развертке долготы: дыра сдвигается на кратное 360
+    так, чтобы ее первая вершина попала в диапазон долгот внешнего кольца
+    """
+    exterior = normalize_ring(coordinates[0])
+    west = exterior[:, 0].min()
+    rings = [exterior]
+    for coordinates_hole in coordinates[1:]:
+        hole = normalize_ring(coordinates_hole)
+        hole[:, 0] -= 360.0 * np.floor((hole[0, 0] - west) / 360.0)
+        rings.append(hole)
+    return rings
+
+
+def polygon_bounds(rings: Rings) -> Tuple[float, float, float, float]:
+    """Ограничивающий прямоугольник (запад, юг, восток, север) по всем кольцам"""
+    vertices = np.concatenate(rings)
+    west, south = vertices.min(axis=0)
+    east, north = vertices.max(axis=0)
+    return float(west), float(south), float(east), float(north)
+
+
+def points_in_polygon(
+    rings: Rings, longitudes: np.ndarray, latitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Принадлежность точек полигону по правилу чет-нечет (дыры учитываются
+    автоматически). Точки и вершины сравниваются в одной развертке долготы.
+    """
+    x = np.asarray(longitudes, dtype=np.float64)[..., np.newaxis]
+    y = np.asarray(latitudes, dtype=np.float64)[..., np.newaxis]
+    inside = np.zeros(np.broadcast(x, y).shape[:-1], dtype=bool)
+    for ring in rings:
+        x0, y0 = ring[:-1, 0], ring[:-1, 1]
+        x1, y1 = ring[1:, 0], ring[1:, 1]
+        spans = (y0 > y) != (y1 > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_x = x0 + (x1 - x0) * (y - y0) / (y1 - y0)
+        crossings = np.count_nonzero(spans & (x < crossing_x), axis=-1)
+        inside ^= crossings % 2 == 1
+    return inside
+
+
+def _segments_hit_box(
+    ring: np.ndarray, west: float, south: float, east: float, north: float
+) -> bool:
+    """Отсечение Лианга-Барски сразу для всех ребер кольца"""
+    x0, y0 = ring[:-1, 0], ring[:-1, 1]
+    dx, dy = ring[1:, 0] - x0, ring[1:, 1] - y0
+    enter, leave = np.zeros_like(x0), np.ones_like(x0)
+    rejected = np.zeros(len(x0), dtype=bool)
+    for p, q in (
+        (-dx, x0 - west),
+        (dx, east - x0),
+        (-dy, y0 - south),
+        (dy, north - y0),
+    ):
+        parallel = p == 0
+        rejected |= parallel & (q < 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = q / p
+        enter = np.where(~parallel & (p < 0), np.maximum(enter, ratio), enter)
+        leave = np.where(~parallel & (p > 0), np.minimum(leave, ratio), leave)
+    return bool(np.any(~rejected & (enter <= leave)))
+
+
+def polygon_intersects_box(
+    rings: Rings, west: float, south: float, east: float, north: float
+) -> bool:
+    """Полигон и прямоугольник пересекаются: общее ребро или один внутри другого"""
+    if any(_segments_hit_box(ring, west, south, east, north) for ring in rings):
+        return True
+    # Ребра не пересекают прямоугольник: он целиком внутри полигона или снаружи
+    return bool(points_in_polygon(rings, west, south))
+
+
+def _box_edges(
+    ring: np.ndarray, west: float, south: float, east: float, north: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Начала и концы ребер кольца, чей прямоугольник задевает заданный"""
+    start, end = ring[:-1], ring[1:]
+    keep = (
+        (np.minimum(start[:, 0], end[:, 0]) <= east)
+        & (np.maximum(start[:, 0], end[:, 0]) >= west)
+        & (np.minimum(start[:, 1], end[:, 1]) <= north)
+        & (np.maximum(start[:, 1], end[:, 1]) >= south)
+    )
+    return start[keep], end[keep]
+
+
+def _orientation(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    return (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1]) - (
+        q[..., 1] - p[..., 1]
+    ) * (r[..., 0] - p[..., 0])
+
+
+def _rings_cross(first: np.ndarray, second: np.ndarray) -> bool:
+    """Хотя бы одна пара ребер двух колец пересекается или касается"""
+    first_bounds = (*first.min(axis=0), *first.max(axis=0))
+    second_bounds = (*second.min(axis=0), *second.max(axis=0))
+    a, b = _box_edges(first, *second_bounds)
+    c, d = _box_edges(second, *first_bounds)
+    if len(a) == 0 or len(c) == 0:
+        return False
+    c, d = c[np.newaxis], d[np.newaxis]
+    step = max(1, _EDGE_PAIRS_CHUNK // len(c[0]))
+    for i in range(0, len(a), step):
+        p, q = a[i : i + step, np.newaxis], b[i : i + step, np.newaxis]
+        straddle = (_orientation(c, d, p) * _orientation(c, d, q) <= 0) & (
+            _orientation(p, q, c) * _orientation(p, q, d) <= 0
+        )
+        # Коллинеарные ребра на одной прямой дают нули - проверяем и их проекции
+        overlap = (
+            (np.minimum(p[..., 0], q[..., 0]) <= np.maximum(c[..., 0], d[..., 0]))
+            & (np.maximum(p[..., 0], q[..., 0]) >= np.minimum(c[..., 0], d[..., 0]))
+            & (np.minimum(p[..., 1], q[..., 1]) <= np.maximum(c[..., 1], d[..., 1]))
+            & (np.maximum(p[..., 1], q[..., 1]) >= np.minimum(c[..., 1], d[..., 1]))
+        )
+        if np.any(straddle & overlap):
+            return True
+    return False
+
+
+def polygons_intersect(first: Rings, second: Rings) -> bool:
+    """
+    Полигоны пересекаются: общее ребро или один внутри другого.
+    Без пересечения ребер каждое кольцо целиком внутри или снаружи другого
+    полигона, поэтому достаточно проверить по одной вершине каждого кольца.
+    """
+    west, south, east, north = polygon_bounds(first)
+    other_west, other_south, other_east, other_north = polygon_bounds(second)
+    if west > other_east or east < other_west:
+        return False
+    if south > other_north or north < other_south:
+        return False
+    if any(_rings_cross(ring, other) for ring in first for other in second):
+        return True
+    first_vertices = np.array([ring[0] for ring in first])
+    second_vertices = np.array([ring[0] for ring in second])
+    return bool(
+        points_in_polygon(second, *first_vertices.T).any()
+        or points_in_polygon(first, *second_vertices.T).any()
+    )
+
+
+class PackedRTree:
+    """
+    Статическое R-дерево, упакованное методом Sort-Tile-Recursive.
+    Уровни хранятся массивами NumPy, поиск спускается по уровню за раз.
+    """
+
+    def __init__(self, boxes: np.ndarray, node_size: int = 16):
+        """:param boxes: (n, 4) прямоугольники (запад, юг, восток, север)"""
+        self.node_size = node_size
+        self.order = self._tile_order(boxes)
+        # Уровни от листьев к корню: прямоугольники узлов и диапазоны их потомков
+        # на уровне ниже; у листьев потомков нет
+        entries = boxes[self.order]
+        starts = stops = np.zeros(len(entries), dtype=np.intp)
+        self.levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = list()
+        while True:
+            self.levels.append((entries, starts, stops))
+            if len(entries) <= node_size:
+                break
+            starts = np.arange(0, len(entries), node_size)
+            stops = np.minimum(starts + node_size, len(entries))
+            entries = np.column_stack(
+                (
+                    np.minimum.reduceat(entries[:, 0], starts),
+                    np.minimum.reduceat(entries[:, 1], starts),
+                    np.maximum.reduceat(entries[:, 2], starts),
+                    np.maximum.reduceat(entries[:, 3], starts),
+                )
+            )
+            order = self._tile_order(entries)
+            entries, starts, stops = entries[order], starts[order], stops[order]
+
+    def _tile_order(self, boxes: np.ndarray) -> np.ndarray:
+        """Порядок STR: полосы по центру x, внутри полосы - по центру y"""
+        if len(boxes) == 0:
+            return np.zeros(0, dtype=np.intp)
+        centers_x = boxes[:, 0] + boxes[:, 2]
+        centers_y = boxes[:, 1] + boxes[:, 3]
+        slices = ceil(sqrt(ceil(len(boxes) / self.node_size)))
+        slice_size = slices * self.node_size
+        by_x = np.argsort(centers_x, kind="stable")
+        strip = np.empty(len(boxes), dtype=np.intp)
+        strip[by_x] = np.arange(len(boxes)) // slice_size
+        return np.lexsort((centers_y, strip))
+
+    def query(self, west: float, south: float, east: float, north: float) -> np.ndarray:
+        """Индексы прямоугольников, пересекающихся с заданным"""
+        entries, starts, stops = self.levels[-1]
+        candidates = np.arange(len(entries))
+        for level in range(len(self.levels) - 1, -1, -1):
+            if level < len(self.levels) - 1:
+                # Потомки узлов-кандидатов: склеенные диапазоны [start, stop)
+                lengths = stops[candidates] - starts[candidates]
+                first = np.repeat(starts[candidates], lengths)
+                position = np.arange(lengths.sum()) - np.repeat(
+                    np.cumsum(lengths) - lengths, lengths
+                )
+                entries, starts, stops = self.levels[level]
+                candidates = first + position
+            boxes = entries[candidates]
+            candidates = candidates[
+                (boxes[:, 0] <= east)
+                & (boxes[:, 2] >= west)
+                & (boxes[:, 1] <= north)
+                & (boxes[:, 3] >= south)
+            ]
+        return self.order[candidates]
+
+
+class PolygonIndex(Generic[K]):
+    """
+    Полигоны (зон покрытия, границ регионов) в памяти процесса с R-деревом
+    по их прямоугольникам. Кандидаты из дерева проверяются точно по вершинам.
+    Содержимое перечитывается из БД раз в ttl_seconds, как индекс точек стояния.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._polygons: Dict[K, Rings] = dict()
+        self._bounds: Dict[K, Tuple[float, float, float, float]] = dict()
+        self._keys: List[K] = list()
+        self._tree: Optional[PackedRTree] = None
+        self._expires_at: Optional[float] = None
+        # Номер изменения: загрузка, начатая до записи, не считается свежей
+        self.version = 0
+
+    def is_stale(self) -> bool:
+        return self._expires_at is None or self._expires_at < monotonic()
+
+    def load(self, polygons: Iterable[Tuple[K, Rings]], version: int) -> None:
+        """
+        Заменяет содержимое индекса.
+        :param version: значение version на момент начала чтения из БД
+        """
+        self._polygons, self._bounds = dict(), dict()
+        for key, rings in polygons:
+            self._polygons[key] = rings
+            self._bounds[key] = polygon_bounds(rings)
+        self._tree = None
+        if version == self.version:
+            self._expires_at = monotonic() + self.ttl_seconds
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._expires_at = None
+
+    def get(self, key: K) -> Optional[Rings]:
+        return self._polygons.get(key)
+
+    def set(self, key: K, rings: Rings) -> None:
+        self.version += 1
+        self._polygons[key] = rings
+        self._bounds[key] = polygon_bounds(rings)
+        self._tree = None
+
+    def remove(self, key: K) -> None:
+        self.version += 1
+        if self._polygons.pop(key, None) is not None:
+            del self._bounds[key]
+            self._tree = None
+
+    def _get_tree(self) -> PackedRTree:
+        # Дерево статическое: после изменений перестраивается при первом запросе
+        if self._tree is None:
+            self._keys = list(self._bounds)
+            boxes = np.array(
+                [self._bounds[key] for key in self._keys], dtype=np.float64
+            ).reshape(-1, 4)
+            self._tree = PackedRTree(boxes)
+        return self._tree
+
+    def covering(self, longitude: float, latitude: float) -> List[K]:
+        """Полигоны, содержащие точку, в порядке ключей"""
+        tree = self._get_tree()
+        result = set()
+        for shift in _LONGITUDE_SHIFTS:
+            x = longitude + shift
+            for i in tree.query(x, latitude, x, latitude).tolist():
+                key = self._keys[i]
+                if points_in_polygon(self._polygons[key], x, latitude):
+                    result.add(key)
+        return sorted(result)
+
+    def intersecting(
+        self, west: float, south: float, east: float, north: float
+    ) -> List[K]:
+        """
+        Полигоны, пересекающие прямоугольник, в порядке ключей.
+        Если west > east, прямоугольник проходит через антимеридиан.
+        """
+        tree = self._get_tree()
+        boxes = [(west, east)] if west <= east else [(west, 180.0), (-180.0, east)]
+        result = set()
+        for box_west, box_east in boxes:
+            for shift in _LONGITUDE_SHIFTS:
+                x0, x1 = box_west + shift, box_east + shift
+                for i in tree.query(x0, south, x1, north).tolist():
+                    key = self._keys[i]
+                    if key not in result and polygon_intersects_box(
+                        self._polygons[key], x0, south, x1, north
+                    ):
+                        result.add(key)
+        return sorted(result)
+
+    def intersecting_polygon(self, rings: Rings) -> List[K]:
+        """Полигоны, пересекающие заданный, в порядке ключей"""
+        tree = self._get_tree()
+        west, south, east, north = polygon_bounds(rings)
+        result = set()
+        for shift in _LONGITUDE_SHIFTS:
+            shifted = [ring + (shift, 0.0) for ring in rings]
+            for i in tree.query(west + shift, south, east + shift, north).tolist():
+                key = self._keys[i]
+                if key not in result and polygons_intersect(
+                    shifted, self._polygons[key]
+                ):
+                    result.add(key)
+        return sorted(result)
+
+    def __len__(self) -> int:
+        return len(self._polygons)
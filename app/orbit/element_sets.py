@@ -0,0 +1,164 @@
+import codecs
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, NamedTuple
+from xml.etree.ElementTree import iterparse, ParseError
+
+from app.schemas import OrbitalElementsBase, ElementSetFormat
+from .propagation import elements_from_tle
+
+JSON_CHUNK_SIZE = 64 * 1024
+# Элементы OMM, из которых собирается запись в XML (CCSDS NDM/XML)
+OMM_XML_RECORD_TAG = "omm"
+
+
+class ElementSetRecord(NamedTuple):
+    norad_id: int
+    elements: OrbitalElementsBase
+
+
+def omm_to_record(fields: Mapping[str, Any]) -> ElementSetRecord:
+    """
+    Запись OMM (ключи в верхнем регистре, как у CelesTrak) в элементы орбиты.
+    :raises ValueError: отсутствуют обязательные поля или значения некорректны
+    """
+    try:
+        epoch = fields["EPOCH"]
+        elements = OrbitalElementsBase(
+            epoch=datetime.fromisoformat(epoch) if isinstance(epoch, str) else epoch,
+            mean_motion=float(fields["MEAN_MOTION"]),
+            eccentricity=float(fields["ECCENTRICITY"]),
+            inclination=float(fields["INCLINATION"]),
+            ra_of_asc_node=float(fields["RA_OF_ASC_NODE"]),
+            arg_of_pericenter=float(fields["ARG_OF_PERICENTER"]),
+            mean_anomaly=float(fields["MEAN_ANOMALY"]),
+            bstar=float(fields.get("BSTAR") or 0.0),
+            mean_motion_dot=float(fields.get("MEAN_MOTION_DOT") or 0.0),
+            mean_motion_ddot=float(fields.get("MEAN_MOTION_DDOT") or 0.0),
+        )
+        return ElementSetRecord(int(fields["NORAD_CAT_ID"]), elements)
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Invalid OMM record: {error}") from error
+
+
+class ElementSetReader:
+    """
+    Потоковое чтение файла с наборами элементов орбит (TLE или OMM в JSON, XML,
+    CSV). Файл читается по частям, в памяти держится только текущая запись.
+    Записи, которые не удалось разобрать, пропускаются и считаются в invalid.
+    Ошибка структуры файла (битый JSON или XML) поднимает ValueError.
+    """
+
+    def __init__(self, stream: BinaryIO, file_format: ElementSetFormat):
+        self.stream = stream
+        self.format = file_format
+        self.invalid = 0
+
+    def __iter__(self) -> Iterator[ElementSetRecord]:
+        if self.format == ElementSetFormat.TLE:
+            yield from self._read_tle()
+            return
+        readers = {
+            ElementSetFormat.OMM_JSON: self._read_json,
+            ElementSetFormat.OMM_XML: self._read_xml,
+            ElementSetFormat.OMM_CSV: self._read_csv,
+        }
+        for fields in readers[self.format]():
+            try:
+                yield omm_to_record(fields)
+            except ValueError:
+                self.invalid += 1
+
+    def batches(self, size: int) -> Iterator[List[ElementSetRecord]]:
+        records = iter(self)
+        while batch := list(islice(records, size)):
+            yield batch
+
+    def _lines(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        for line in self.stream:
+            yield decoder.decode(line)
+
+    def _read_tle(self) -> Iterator[ElementSetRecord]:
+        """Двух- и трехстрочные TLE, строка с названием необязательна"""
+        line1 = None
+        for line in self._lines():
+            line = line.rstrip()
+            if line.startswith("1 "):
+                if line1 is not None:
+                    self.invalid += 1
+                line1 = line
+            elif line.startswith("2 ") and line1 is not None:
+                try:
+                    yield ElementSetRecord(*elements_from_tle(line1, line))
+                except ValueError:
+                    self.invalid += 1
+                line1 = None
+            elif line.startswith("2 "):
+                self.invalid += 1
+            elif line1 is not None:
+                self.invalid += 1
+                line1 = None
+        if line1 is not None:
+            self.invalid += 1
+
+    def _read_csv(self) -> Iterator[Dict[str, Any]]:
+        for row in csv.DictReader(self._lines()):
+            yield {key.strip().upper(): value for key, value in row.items() if key}
+
+    def _read_json(self) -> Iterator[Dict[str, Any]]:
+        """Элементы JSON-массива по одному, без загрузки файла целиком"""
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        buffer, position, started = "", 0, False
+        while True:
+            chunk = self.stream.read(JSON_CHUNK_SIZE)
+            buffer = buffer[position:] + text_decoder.decode(chunk, final=not chunk)
+            position = 0
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position == len(buffer):
+                    break
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValueError("OMM JSON must be an array")
+                    started = True
+                    position += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if not chunk:
+                        raise ValueError("Invalid OMM JSON")
+                    break
+                if isinstance(item, dict):
+                    yield item
+                else:
+                    self.invalid += 1
+            if not chunk:
+                raise ValueError("Unexpected end of OMM JSON")
+
+    def _read_xml(self) -> Iterator[Dict[str, Any]]:
+        """Сегменты OMM из NDM/XML, разобранные элементы сразу освобождаются"""
+        root, fields = None, dict()
+        try:
+            for event, element in iterparse(self.stream, events=("start", "end")):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    if root is None:
+                        root = element
+                    elif tag == OMM_XML_RECORD_TAG:
+                        fields = dict()
+                    continue
+                if len(element) == 0 and element.text is not None:
+                    fields[tag] = element.text.strip()
+                elif tag == OMM_XML_RECORD_TAG:
+                    yield fields
+                    root.clear()
+        except ParseError as error:
+            raise ValueError(f"Invalid OMM XML: {error}") from error
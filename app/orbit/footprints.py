@@ -0,0 +1,106 @@
+from typing import Sequence
+
+import numpy as np
+
+from .geometry import EARTH_RADIUS_KM, GEO_RADIUS_KM, geostationary_ecef
+
+# Диаграмма луча: ослабление в главном лепестке 12 * (угол / ширина луча)^2 дБ
+# (ITU-R S.672), модель справедлива до 20 дБ ниже максимума
+
+
+def coverage_angle(min_elevation: np.ndarray) -> np.ndarray:
+    """
+    Центральный угол (рад) от подспутниковой точки до изолинии угла места
+    min_elevation (град) для геостационарного спутника над сферической Землей
+    """
+    elevation = np.radians(min_elevation)
+    return np.arccos(EARTH_RADIUS_KM / GEO_RADIUS_KM * np.cos(elevation)) - elevation
+
+
+def destination_points(
+    latitude: float, longitude: float, distance: np.ndarray, bearing: np.ndarray
+) -> np.ndarray:
+    """
+    Точки на сфере на угловом расстоянии distance (рад) от заданной точки
+    по азимутам bearing (рад); distance и bearing приводятся по broadcasting.
+    :return: массив (..., 2) долгот и широт в градусах, долгота в [-180, 180)
+    """
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    sin_distance, cos_distance = np.sin(distance), np.cos(distance)
+    sin_lat = np.sin(lat) * cos_distance + np.cos(lat) * sin_distance * np.cos(bearing)
+    lon_shift = np.arctan2(
+        np.sin(bearing) * sin_distance * np.cos(lat),
+        cos_distance - np.sin(lat) * sin_lat,
+    )
+    longitudes = (np.degrees(lon + lon_shift) + 180.0) % 360.0 - 180.0
+    return np.stack((longitudes, np.degrees(np.arcsin(sin_lat))), axis=-1)
+
+
+def _close_rings(points: np.ndarray) -> np.ndarray:
+    return np.concatenate((points, points[..., :1, :]), axis=-2)
+
+
+def visibility_contours(
+    satellite_longitude: float, min_elevations: Sequence[float], points: int
+) -> np.ndarray:
+    """
+    Изолинии угла места геостационарного спутника сразу для нескольких уровней.
+    :return: замкнутые кольца (уровни, points + 1, 2) [долгота, широта]
+    """
+    distance = coverage_angle(np.asarray(min_elevations, dtype=np.float64))
+    bearing = np.linspace(0.0, 2 * np.pi, points, endpoint=False)
+    return _close_rings(
+        destination_points(0.0, satellite_longitude, distance[:, None], bearing)
+    )
+
+
+def beam_contours(
+    satellite_longitude: float,
+    boresight_latitude: float,
+    boresight_longitude: float,
+    beamwidth: float,
+    peak_eirp_dbw: float,
+    eirp_levels_dbw: Sequence[float],
+    points: int,
+) -> np.ndarray:
+    """
+    Изолинии ЭИИМ парциального луча геостационарного спутника.
+    Направления на уровне ослабления строятся конусом вокруг оси луча
+    и пересекаются со сферической Землей; лучи мимо Земли заменяются точкой
+    касания, то есть изолиния обрезается по краю видимого диска.
+    :param beamwidth: ширина луча по уровню -3 дБ, град
+    :return: замкнутые кольца (уровни, points + 1, 2) [долгота, широта]
+    """
+    satellite = geostationary_ecef(satellite_longitude)
+    lat, lon = np.radians(boresight_latitude), np.radians(boresight_longitude)
+    target = EARTH_RADIUS_KM * np.array(
+        (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat))
+    )
+    if np.dot(satellite - target, target) <= 0:
+        raise ValueError("Boresight is not visible from the satellite")
+    axis = (target - satellite) / np.linalg.norm(target - satellite)
+    first = np.cross(axis, (0.0, 0.0, 1.0))
+    first /= np.linalg.norm(first)
+    second = np.cross(axis, first)
+
+    rolloff = peak_eirp_dbw - np.asarray(eirp_levels_dbw, dtype=np.float64)
+    off_axis = np.radians(beamwidth * np.sqrt(rolloff / 12.0))[:, None, None]
+    phase = np.linspace(0.0, 2 * np.pi, points, endpoint=False)[:, None]
+    directions = np.cos(off_axis) * axis + np.sin(off_axis) * (
+        np.cos(phase) * first + np.sin(phase) * second
+    )
+    # Пересечение луча satellite + t * direction со сферой радиуса Земли
+    along = directions @ satellite
+    discriminant = along**2 - (GEO_RADIUS_KM**2 - EARTH_RADIUS_KM**2)
+    distance = -along - np.sqrt(np.maximum(discriminant, 0.0))
+    ground = satellite + distance[..., None] * directions
+    ground /= np.linalg.norm(ground, axis=-1, keepdims=True)
+    return _close_rings(
+        np.stack(
+            (
+                np.degrees(np.arctan2(ground[..., 1], ground[..., 0])),
+                np.degrees(np.arcsin(ground[..., 2])),
+            ),
+            axis=-1,
+        )
+    )
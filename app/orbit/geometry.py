@@ -0,0 +1,129 @@
+from math import pi
+from typing import NamedTuple
+
+import numpy as np
+
+# Эллипсоид WGS84 для координат наземных станций
+EARTH_RADIUS_KM = 6378.137
+EARTH_FLATTENING = 1 / 298.257223563
+EARTH_E2 = EARTH_FLATTENING * (2 - EARTH_FLATTENING)
+# Радиус геостационарной орбиты
+GEO_RADIUS_KM = 42164.17
+TWO_PI = 2 * pi
+
+
+class LookAngles(NamedTuple):
+    """Азимут и угол места в градусах, наклонная дальность в км"""
+
+    azimuth: np.ndarray
+    elevation: np.ndarray
+    range_km: np.ndarray
+
+
+def gmst(jd: np.ndarray, fr: np.ndarray) -> np.ndarray:
+    """Гринвичское среднее звездное время (IAU-82), рад"""
+    tut1 = (jd - 2451545.0 + fr) / 36525.0
+    seconds = (
+        -6.2e-6 * tut1**3
+        + 0.093104 * tut1**2
+        + (876600.0 * 3600 + 8640184.812866) * tut1
+        + 67310.54841
+    )
+    return np.radians(seconds / 240.0) % TWO_PI
+
+
+def teme_to_ecef(positions: np.ndarray, jd: np.ndarray, fr: np.ndarray) -> np.ndarray:
+    """
+    Поворот положений из TEME в земную систему на угол GMST
+    (без учета движения полюсов).
+    :param positions: (..., m, 3) для m моментов jd + fr
+    """
+    theta = gmst(jd, fr)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    x, y, z = positions[..., 0], positions[..., 1], positions[..., 2]
+    return np.stack(
+        (cos_theta * x + sin_theta * y, cos_theta * y - sin_theta * x, z), axis=-1
+    )
+
+
+def geodetic_to_ecef(
+    latitude: np.ndarray, longitude: np.ndarray, altitude_km: np.ndarray
+) -> np.ndarray:
+    """Геодезические координаты WGS84 (градусы, км) в земные декартовы, км"""
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    normal = EARTH_RADIUS_KM / np.sqrt(1 - EARTH_E2 * sin_lat**2)
+    return np.stack(
+        (
+            (normal + altitude_km) * cos_lat * np.cos(lon),
+            (normal + altitude_km) * cos_lat * np.sin(lon),
+            (normal * (1 - EARTH_E2) + altitude_km) * sin_lat,
+        ),
+        axis=-1,
+    )
+
+
+def geostationary_ecef(longitude: np.ndarray) -> np.ndarray:
+    """Положение идеального геостационарного спутника над долготой, км"""
+    lon = np.radians(longitude)
+    return np.stack(
+        (GEO_RADIUS_KM * np.cos(lon), GEO_RADIUS_KM * np.sin(lon), np.zeros_like(lon)),
+        axis=-1,
+    )
+
+
+def look_angles(
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    station_ecef: np.ndarray,
+    satellite_ecef: np.ndarray,
+) -> LookAngles:
+    """
+    Азимут, угол места и дальность спутника из точки наблюдения.
+    Все аргументы приводятся друг к другу по правилам broadcasting NumPy:
+    latitude и longitude формы (...), station_ecef и satellite_ecef - (..., 3).
+    """
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+    # Разности по компонентам: без промежуточного массива (..., 3)
+    dx = satellite_ecef[..., 0] - station_ecef[..., 0]
+    dy = satellite_ecef[..., 1] - station_ecef[..., 1]
+    dz = satellite_ecef[..., 2] - station_ecef[..., 2]
+    east = -sin_lon * dx + cos_lon * dy
+    north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
+    up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+    horizontal_squared = east * east + north * north
+    azimuth = np.degrees(np.arctan2(east, north))
+    return LookAngles(
+        np.where(azimuth < 0, azimuth + 360.0, azimuth),
+        np.degrees(np.arctan2(up, np.sqrt(horizontal_squared))),
+        np.sqrt(horizontal_squared + up * up),
+    )
+
+
+def geostationary_look_angles(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    altitudes_km: np.ndarray,
+    satellite_longitudes: np.ndarray,
+) -> LookAngles:
+    """
+    Углы на геостационарные спутники для набора наземных терминалов за один
+    векторный расчет.
+    :param latitudes, longitudes, altitudes_km: координаты N терминалов
+    :param satellite_longitudes: долготы стояния M спутников
+    :return: массивы формы (M, N)
+    """
+    stations = geodetic_to_ecef(latitudes, longitudes, altitudes_km)
+    satellites = geostationary_ecef(satellite_longitudes)
+    return look_angles(
+        latitudes, longitudes, stations[np.newaxis], satellites[:, np.newaxis]
+    )
+
+
+def is_geostationary(
+    mean_motion: float, eccentricity: float, inclination: float
+) -> bool:
+    """Почти круговая экваториальная орбита с периодом в звездные сутки"""
+    return abs(mean_motion - 1.0027) < 0.01 and eccentricity < 0.01 and inclination < 5
@@ -0,0 +1,78 @@
+"""
+Загрузка файлов с элементами орбит в БД.
+
+Запуск: python -m app.orbit.ingest active.tle gp.json [--format omm_json]
+Формат определяется по расширению файла, если не указан явно.
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+from app.core import async_session_maker, InvalidElementSetFileError
+from app.orbit import ElementSetReader
+from app.schemas import ElementSetFormat, ElementSetIngestReport
+from app.service import create_orbit_service
+
+FORMAT_BY_SUFFIX = {
+    ".tle": ElementSetFormat.TLE,
+    ".txt": ElementSetFormat.TLE,
+    ".3le": ElementSetFormat.TLE,
+    ".json": ElementSetFormat.OMM_JSON,
+    ".xml": ElementSetFormat.OMM_XML,
+    ".csv": ElementSetFormat.OMM_CSV,
+}
+
+
+def detect_format(path: Path) -> Optional[ElementSetFormat]:
+    return FORMAT_BY_SUFFIX.get(path.suffix.lower())
+
+
+def format_report(path: Path, report: ElementSetIngestReport) -> str:
+    return (
+        f"{path}: received={report.received} invalid={report.invalid} "
+        f"unmatched={report.unmatched} skipped={report.skipped} "
+        f"upserted={report.upserted} in {report.elapsed_seconds:.2f}s "
+        f"({report.records_per_second:.0f} records/s)"
+    )
+
+
+async def ingest_file(
+    path: Path, file_format: ElementSetFormat
+) -> ElementSetIngestReport:
+    async with async_session_maker() as session:
+        service = create_orbit_service(session)
+        with path.open("rb") as stream:
+            return await service.ingest_element_sets(
+                ElementSetReader(stream, file_format)
+            )
+
+
+async def main(paths: List[Path], file_format: Optional[ElementSetFormat]) -> int:
+    exit_code = 0
+    for path in paths:
+        path_format = file_format or detect_format(path)
+        if path_format is None:
+            print(f"{path}: unknown format, use --format")
+            exit_code = 1
+            continue
+        try:
+            report = await ingest_file(path, path_format)
+        except (OSError, InvalidElementSetFileError) as error:
+            print(f"{path}: {error}")
+            exit_code = 1
+            continue
+        print(format_report(path, report))
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load TLE/OMM element sets")
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument(
+        "--format", choices=[file_format.value for file_format in ElementSetFormat]
+    )
+    args = parser.parse_args()
+    file_format = ElementSetFormat(args.format) if args.format else None
+    raise SystemExit(asyncio.run(main(args.paths, file_format)))
@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+from math import degrees, pi
+from typing import NamedTuple, Sequence, Tuple
+
+import numpy as np
+from sgp4.api import Satrec, SatrecArray, WGS72, SGP4_ERRORS
+
+from app.schemas import OrbitalElementsBase
+
+SGP4_EPOCH = datetime(1949, 12, 31, tzinfo=timezone.utc)
+UNIX_EPOCH = np.datetime64("1970-01-01T00:00:00", "us")
+JD_UNIX_EPOCH = 2440587.5
+SECONDS_PER_DAY = 86400.0
+MINUTES_PER_DAY = 1440.0
+# Перевод единиц OMM (об/сут и производные) во внутренние единицы SGP4 (рад/мин)
+RAD_PER_MIN = 2 * pi / MINUTES_PER_DAY
+NDOT_UNITS = MINUTES_PER_DAY**2 / (2 * pi)
+NDDOT_UNITS = MINUTES_PER_DAY**3 / (2 * pi)
+
+
+class PropagationResult(NamedTuple):
+    """
+    Результат пакетного расчета SGP4 для n спутников и m моментов:
+    errors (n, m) - коды ошибок SGP4, positions и velocities (n, m, 3) -
+    положение в км и скорость в км/с в системе TEME
+    """
+
+    errors: np.ndarray
+    positions: np.ndarray
+    velocities: np.ndarray
+
+
+def satrec_from_elements(elements: OrbitalElementsBase) -> Satrec:
+    """
+    Инициализация SGP4 по средним элементам OMM.
+    Принимает модель или строку БД с теми же полями.
+    """
+    satrec = Satrec()
+    satrec.sgp4init(
+        WGS72,
+        "i",
+        0,
+        (elements.epoch - SGP4_EPOCH).total_seconds() / SECONDS_PER_DAY,
+        elements.bstar,
+        elements.mean_motion_dot / NDOT_UNITS,
+        elements.mean_motion_ddot / NDDOT_UNITS,
+        elements.eccentricity,
+        np.radians(elements.arg_of_pericenter),
+        np.radians(elements.inclination),
+        np.radians(elements.mean_anomaly),
+        elements.mean_motion * RAD_PER_MIN,
+        np.radians(elements.ra_of_asc_node),
+    )
+    return satrec
+
+
+def tle_checksum_is_valid(line: str) -> bool:
+    # str.count вместо посимвольного цикла: проверка стоит на горячем пути загрузки
+    body = line[:68]
+    checksum = body.count("-") + sum(
+        digit * body.count(str(digit)) for digit in range(1, 10)
+    )
+    return line[68].isdigit() and checksum % 10 == int(line[68])
+
+
+def elements_from_tle(line1: str, line2: str) -> Tuple[int, OrbitalElementsBase]:
+    """
+    Разбор TLE в средние элементы OMM.
+    :return: NORAD ID из TLE и элементы орбиты
+    :raises ValueError: строки не являются корректным TLE
+    """
+    if (
+        len(line1) != 69
+        or len(line2) != 69
+        or not line1.startswith("1 ")
+        or not line2.startswith("2 ")
+        or line1[2:7] != line2[2:7]
+        or not tle_checksum_is_valid(line1)
+        or not tle_checksum_is_valid(line2)
+    ):
+        raise ValueError("Invalid TLE")
+    satrec = Satrec.twoline2rv(line1, line2)
+    if satrec.error:
+        raise ValueError(f"Invalid TLE: {SGP4_ERRORS[satrec.error]}")
+    epoch_seconds = (
+        (satrec.jdsatepoch - JD_UNIX_EPOCH) + satrec.jdsatepochF
+    ) * SECONDS_PER_DAY
+    elements = OrbitalElementsBase(
+        epoch=datetime.fromtimestamp(round(epoch_seconds, 6), tz=timezone.utc),
+        mean_motion=satrec.no_kozai / RAD_PER_MIN,
+        eccentricity=satrec.ecco,
+        inclination=degrees(satrec.inclo),
+        ra_of_asc_node=degrees(satrec.nodeo) % 360.0,
+        arg_of_pericenter=degrees(satrec.argpo) % 360.0,
+        mean_anomaly=degrees(satrec.mo) % 360.0,
+        bstar=satrec.bstar,
+        mean_motion_dot=satrec.ndot * NDOT_UNITS,
+        mean_motion_ddot=satrec.nddot * NDDOT_UNITS,
+    )
+    return satrec.satnum, elements
+
+
+def to_datetime64(moment: datetime) -> np.datetime64:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(moment, "us")
+
+
+def from_datetime64(moment: np.datetime64) -> datetime:
+    return moment.astype("datetime64[us]").item().replace(tzinfo=timezone.utc)
+
+
+def julian_dates(moments: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Юлианские даты моментов UTC, разбитые на целую часть и долю суток"""
+    seconds = (moments.astype("datetime64[us]") - UNIX_EPOCH) / np.timedelta64(1, "s")
+    days, seconds_of_day = np.divmod(seconds, SECONDS_PER_DAY)
+    return JD_UNIX_EPOCH + days, seconds_of_day / SECONDS_PER_DAY
+
+
+def propagate(satrecs: Sequence[Satrec], moments: np.ndarray) -> PropagationResult:
+    """Расчет SGP4 сразу для всех спутников и моментов одним вызовом SatrecArray"""
+    jd, fr = julian_dates(moments)
+    errors, positions, velocities = SatrecArray(list(satrecs)).sgp4(jd, fr)
+    return PropagationResult(errors, positions, velocities)
+
+
+def sgp4_error_message(error_code: int) -> str:
+    return SGP4_ERRORS.get(int(error_code), f"SGP4 error {error_code}")
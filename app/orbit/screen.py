@@ -0,0 +1,46 @@
+"""
+Скрининг сближений всего каталога с сохранением результатов в БД.
+Предназначен для периодического запуска (cron, systemd timer).
+
+Запуск: python -m app.orbit.screen [--days 7] [--threshold 10] [--step 60]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.core import async_session_maker
+from app.schemas import ConjunctionScreeningRequest, ConjunctionScreeningReport
+from app.service import create_orbit_service, conjunction_screener
+
+
+def format_report(report: ConjunctionScreeningReport) -> str:
+    return (
+        f"{report.start:%Y-%m-%d %H:%M} - {report.end:%Y-%m-%d %H:%M}: "
+        f"satellites={report.satellites} screened={report.screened} "
+        f"conjunctions={report.conjunctions} in {report.elapsed_seconds:.2f}s"
+    )
+
+
+async def main(
+    days: Optional[float], threshold_km: Optional[float], step_seconds: Optional[float]
+) -> int:
+    request = ConjunctionScreeningRequest(
+        days=days, threshold_km=threshold_km, step_seconds=step_seconds
+    )
+    try:
+        async with async_session_maker() as session:
+            report = await create_orbit_service(session).screen_conjunctions(request)
+    finally:
+        conjunction_screener.shutdown()
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Screen the catalog for conjunctions")
+    parser.add_argument("--days", type=float, help="Window length, days")
+    parser.add_argument("--threshold", type=float, help="Miss distance threshold, km")
+    parser.add_argument("--step", type=float, help="Grid step, seconds")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.days, args.threshold, args.step)))
@@ -0,0 +1,116 @@
+from bisect import bisect_left, bisect_right, insort
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def longitude_distance(first: float, second: float) -> float:
+    """Угловое расстояние между долготами по кратчайшей дуге, 0..180"""
+    delta = abs(first - second) % 360.0
+    return min(delta, 360.0 - delta)
+
+
+class LongitudeSlotIndex:
+    """
+    Отсортированный по долготе индекс точек стояния спутников в памяти процесса.
+    Диапазон и ближайшие позиции ищутся бинарным поиском за O(log n + k).
+    Содержимое перечитывается из БД раз в ttl_seconds, чтобы подхватить
+    изменения, сделанные другими процессами.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._longitudes: List[float] = list()
+        self._codes: List[str] = list()
+        self._by_code: Dict[str, float] = dict()
+        self._expires_at: Optional[float] = None
+        # Номер изменения: загрузка, начатая до записи, не считается свежей
+        self.version = 0
+
+    def is_stale(self) -> bool:
+        return self._expires_at is None or self._expires_at < monotonic()
+
+    def load(self, slots: Iterable[Tuple[str, float]], version: int) -> None:
+        """
+        Заменяет содержимое индекса. slots должны быть отсортированы по долготе.
+        :param version: значение version на момент начала чтения из БД
+        """
+        self._codes, self._longitudes, self._by_code = list(), list(), dict()
+        for code, longitude in slots:
+            self._codes.append(code)
+            self._longitudes.append(longitude)
+            self._by_code[code] = longitude
+        if version == self.version:
+            self._expires_at = monotonic() + self.ttl_seconds
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._expires_at = None
+
+    def get(self, code: str) -> Optional[float]:
+        return self._by_code.get(code)
+
+    def set(self, code: str, longitude: Optional[float]) -> None:
+        self.remove(code)
+        if longitude is None:
+            return
+        position = bisect_right(self._longitudes, longitude)
+        self._longitudes.insert(position, longitude)
+        self._codes.insert(position, code)
+        self._by_code[code] = longitude
+
+    def remove(self, code: str) -> None:
+        self.version += 1
+        longitude = self._by_code.pop(code, None)
+        if longitude is None:
+            return
+        position = bisect_left(self._longitudes, longitude)
+        while self._codes[position] != code:
+            position += 1
+        del self._longitudes[position]
+        del self._codes[position]
+
+    def range(self, west: float, east: float) -> List[Tuple[str, float]]:
+        """
+        Спутники от west до east включительно в направлении на восток.
+        Если west > east, диапазон проходит через антимеридиан.
+        """
+        start = bisect_left(self._longitudes, west)
+        stop = bisect_right(self._longitudes, east)
+        if west <= east:
+            positions = range(start, stop)
+        else:
+            positions = [*range(start, len(self._longitudes)), *range(stop)]
+        return [(self._codes[i], self._longitudes[i]) for i in positions]
+
+    def nearest(self, longitude: float, limit: int) -> List[Tuple[str, float, float]]:
+        """
+        limit ближайших к долготе спутников с учетом перехода через антимеридиан.
+        :return: (международный код, долгота, угловое расстояние) по возрастанию
+        расстояния
+        """
+        size = len(self._longitudes)
+        east = bisect_left(self._longitudes, longitude)
+        west = east - 1
+        result = list()
+        # Ближайшие точки образуют дугу вокруг longitude: расширяем ее
+        # в сторону более близкого соседа, пока не наберем limit
+        while len(result) < min(limit, size):
+            east_longitude = self._longitudes[east % size]
+            west_longitude = self._longitudes[west % size]
+            if (east_longitude - longitude) % 360.0 <= (
+                longitude - west_longitude
+            ) % 360.0:
+                position, east = east % size, east + 1
+            else:
+                position, west = west % size, west - 1
+            result.append(
+                (
+                    self._codes[position],
+                    self._longitudes[position],
+                    longitude_distance(self._longitudes[position], longitude),
+                )
+            )
+        return result
+
+    def __len__(self) -> int:
+        return len(self._longitudes)
@@ -0,0 +1,231 @@
+from datetime import datetime
+from math import ceil, log, log2, sqrt
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sgp4.api import Satrec
+
+from .geometry import LookAngles, geodetic_to_ecef, look_angles, teme_to_ecef
+from .propagation import julian_dates, propagate, to_datetime64
+
+# Точность уточнения моментов восхода и захода, с
+EVENT_TOLERANCE_SECONDS = 1.0
+# Ограничение числа точек спутник x момент, рассчитываемых за один вызов SGP4
+MAX_GRID_POINTS = 2_000_000
+
+
+class GroundPoint(NamedTuple):
+    """Точка наблюдения: широта и долгота в градусах, высота в км"""
+
+    latitude: float
+    longitude: float
+    altitude_km: float
+
+
+class PassEvent(NamedTuple):
+    time: np.datetime64
+    azimuth: float
+    elevation: float
+    range_km: float
+
+
+class PassWindow(NamedTuple):
+    """Пролет; rise/set = None, если спутник виден на границе окна расчета"""
+
+    rise: Optional[PassEvent]
+    culmination: PassEvent
+    set: Optional[PassEvent]
+
+
+class SatelliteTrack(NamedTuple):
+    """Начальные углы, пролеты и первая ошибка SGP4 (0 - без ошибок)"""
+
+    start: PassEvent
+    passes: List[PassWindow]
+    error: int
+
+
+def time_grid(start: datetime, end: datetime, step_seconds: float) -> np.ndarray:
+    """Смещения от start в секундах с шагом step_seconds, включая end"""
+    duration = (end - start).total_seconds()
+    offsets = np.arange(0.0, duration, step_seconds)
+    return np.append(offsets, duration)
+
+
+class _Observer:
+    """Расчет углов спутников из одной точки наблюдения для моментов start + offsets"""
+
+    def __init__(self, point: GroundPoint, start: datetime):
+        self.point = point
+        self.station_ecef = geodetic_to_ecef(
+            point.latitude, point.longitude, point.altitude_km
+        )
+        self.start = to_datetime64(start)
+
+    def moments(self, offsets: np.ndarray) -> np.ndarray:
+        return self.start + np.round(offsets * 1e6).astype("timedelta64[us]")
+
+    def _angles(self, positions: np.ndarray, moments: np.ndarray) -> LookAngles:
+        jd, fr = julian_dates(moments)
+        return look_angles(
+            self.point.latitude,
+            self.point.longitude,
+            self.station_ecef,
+            teme_to_ecef(positions, jd, fr),
+        )
+
+    def grid(self, satrecs: Sequence[Satrec], offsets: np.ndarray):
+        """Углы всех спутников на общей сетке: массивы (n, m) и ошибки SGP4"""
+        moments = self.moments(offsets)
+        result = propagate(satrecs, moments)
+        return self._angles(result.positions, moments), result.errors
+
+    def at(self, satrec: Satrec, offsets: np.ndarray) -> LookAngles:
+        """Углы одного спутника в произвольные моменты (векторно по моментам)"""
+        moments = self.moments(offsets)
+        jd, fr = julian_dates(moments)
+        _, positions, _ = satrec.sgp4_array(jd, fr)
+        return self._angles(positions, moments)
+
+    def event(self, angles: LookAngles, offsets: np.ndarray, i: int) -> PassEvent:
+        return PassEvent(
+            self.moments(offsets[i : i + 1])[0],
+            float(angles.azimuth[i]),
+            float(angles.elevation[i]),
+            float(angles.range_km[i]),
+        )
+
+
+def _refine_crossings(
+    observer: _Observer,
+    satrec: Satrec,
+    low: np.ndarray,
+    high: np.ndarray,
+    rising: np.ndarray,
+    min_elevation: float,
+) -> np.ndarray:
+    """
+    Бисекция сразу по всем интервалам пересечения порога одного спутника.
+    rising - угол места растет на интервале (восход), иначе заход.
+    """
+    step = float(np.max(high - low)) if len(low) else 0.0
+    iterations = max(1, ceil(log2(max(step, 1.0) / EVENT_TOLERANCE_SECONDS)))
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        above = observer.at(satrec, middle).elevation >= min_elevation
+        # У восхода граница видимости справа от видимой середины, у захода - слева
+        move_high = above == rising
+        high = np.where(move_high, middle, high)
+        low = np.where(move_high, low, middle)
+    return np.where(rising, high, low)
+
+
+def _refine_culminations(
+    observer: _Observer, satrec: Satrec, low: np.ndarray, high: np.ndarray
+) -> np.ndarray:
+    """Поиск максимума угла места золотым сечением сразу по всем пролетам спутника"""
+    ratio = (sqrt(5) - 1) / 2
+    step = float(np.max(high - low)) if len(low) else 0.0
+    iterations = max(1, ceil(log(max(step, 1.0) / EVENT_TOLERANCE_SECONDS, 1 / ratio)))
+    for _ in range(iterations):
+        left = high - ratio * (high - low)
+        right = low + ratio * (high - low)
+        elevation = observer.at(satrec, np.concatenate((left, right))).elevation
+        left_higher = elevation[: len(left)] > elevation[len(left) :]
+        high = np.where(left_higher, right, high)
+        low = np.where(left_higher, low, left)
+    return (low + high) / 2
+
+
+def _satellite_passes(
+    observer: _Observer,
+    satrec: Satrec,
+    offsets: np.ndarray,
+    angles: LookAngles,
+    min_elevation: float,
+) -> List[PassWindow]:
+    elevation = angles.elevation
+    above = elevation >= min_elevation
+    if not above.any():
+        return list()
+    edges = np.flatnonzero(np.diff(above.astype(np.int8)))
+    rising = above[edges + 1]
+    crossings = _refine_crossings(
+        observer, satrec, offsets[edges], offsets[edges + 1], rising, min_elevation
+    )
+    events = list()
+    if len(crossings):
+        crossing_angles = observer.at(satrec, crossings)
+        events = [
+            observer.event(crossing_angles, crossings, k) for k in range(len(crossings))
+        ]
+    rise_by_start = {edge + 1: event for edge, event in zip(edges, events)}
+    set_by_end = {edge: event for edge, event in zip(edges, events)}
+
+    # Границы непрерывных участков видимости на сетке
+    starts = np.flatnonzero(above & ~np.concatenate(([False], above[:-1])))
+    ends = np.flatnonzero(above & ~np.concatenate((above[1:], [False])))
+    peaks = np.array(
+        [
+            start + int(np.argmax(elevation[start : end + 1]))
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+    )
+    # Максимум лежит между соседними с пиком точками сетки
+    last = len(offsets) - 1
+    peak_offsets = _refine_culminations(
+        observer,
+        satrec,
+        offsets[np.maximum(peaks - 1, 0)],
+        offsets[np.minimum(peaks + 1, last)],
+    )
+    peak_angles = observer.at(satrec, peak_offsets)
+    passes = list()
+    for k, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        culmination = observer.event(angles, offsets, int(peaks[k]))
+        refined = observer.event(peak_angles, peak_offsets, k)
+        if refined.elevation > culmination.elevation:
+            culmination = refined
+        passes.append(
+            PassWindow(rise_by_start.get(start), culmination, set_by_end.get(end))
+        )
+    return passes
+
+
+def predict_passes(
+    satrecs: Sequence[Satrec],
+    point: GroundPoint,
+    start: datetime,
+    end: datetime,
+    step_seconds: float,
+    min_elevation: float,
+) -> List[SatelliteTrack]:
+    """
+    Пролеты спутников над точкой наблюдения в окне [start, end].
+    Угол места считается на общей сетке с шагом step_seconds для всех спутников
+    сразу, затем моменты восхода/захода уточняются бисекцией, а кульминация -
+    золотым сечением между соседними точками. Пролеты короче шага сетки могут быть
+    пропущены.
+    """
+    observer = _Observer(point, start)
+    offsets = time_grid(start, end, step_seconds)
+    chunk_size = max(1, MAX_GRID_POINTS // len(offsets))
+    tracks = list()
+    for chunk_start in range(0, len(satrecs), chunk_size):
+        chunk = satrecs[chunk_start : chunk_start + chunk_size]
+        angles, errors = observer.grid(chunk, offsets)
+        for i, satrec in enumerate(chunk):
+            satellite_angles = LookAngles(
+                angles.azimuth[i], angles.elevation[i], angles.range_km[i]
+            )
+            error_codes = errors[i][errors[i] != 0]
+            tracks.append(
+                SatelliteTrack(
+                    observer.event(satellite_angles, offsets, 0),
+                    _satellite_passes(
+                        observer, satrec, offsets, satellite_angles, min_elevation
+                    ),
+                    int(error_codes[0]) if len(error_codes) else 0,
+                )
+            )
+    return tracks
@@ -1,10 +1,23 @@
+import asyncio
+from contextlib import AsyncExitStack
 from app.core import settings
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
-from botocore.exceptions import ClientError
-from typing import Optional
+from botocore.exceptions import BotoCoreError, ClientError
+from typing import Optional, Protocol, List, Dict
+
+
+class AsyncReadable(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
 
 
 class S3Service:
+    # Клиент общий для всего процесса: один пул соединений и одно
+    # TLS-рукопожатие на соединение вместо нового клиента на каждый вызов.
+    _client = None
+    _exit_stack: Optional[AsyncExitStack] = None
+    _lock: Optional[asyncio.Lock] = None
+
     def __init__(self):
         self.session = get_session()
         self.bucket_name = settings.BUCKET_NAME
@@ -12,46 +25,147 @@ class S3Service:
         self.aws_access_key_id = settings.ACCESS_KEY
         self.aws_secret_access_key = settings.SECRET_KEY
 
-    async def _get_client(self):
-        return self.session.create_client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            verify=False,
+    @staticmethod
+    def _get_config() -> AioConfig:
+        return AioConfig(
+            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.S3_CONNECT_TIMEOUT,
+            read_timeout=settings.S3_READ_TIMEOUT,
+            tcp_keepalive=True,
+            connector_args={"keepalive_timeout": settings.S3_KEEPALIVE_TIMEOUT},
+            retries={"max_attempts": settings.S3_MAX_ATTEMPTS, "mode": "standard"},
         )
 
+    @classmethod
+    async def start(cls) -> None:
+        """Создание общего клиента (вызывается при старте приложения)"""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._client is not None:
+                return
+            service = cls()
+            exit_stack = AsyncExitStack()
+            cls._client = await exit_stack.enter_async_context(
+                service.session.create_client(
+                    "s3",
+                    endpoint_url=service.endpoint_url,
+                    aws_access_key_id=service.aws_access_key_id,
+                    aws_secret_access_key=service.aws_secret_access_key,
+                    verify=False,
+                    config=cls._get_config(),
+                )
+            )
+            cls._exit_stack = exit_stack
+
+    @classmethod
+    async def close(cls) -> None:
+        """Закрытие общего клиента и его пула соединений (при остановке приложения)"""
+        exit_stack, cls._exit_stack, cls._client = cls._exit_stack, None, None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    async def _get_client(self):
+        if S3Service._client is None:
+            await S3Service.start()
+        return S3Service._client
+
     async def upload_file(self, file_data: bytes, file_key: str) -> bool:
-        async with await self._get_client() as client:
+        client = await self._get_client()
+        try:
+            response = await client.put_object(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Body=file_data,
+                ACL="public-read",  # или другой ACL, если нужно
+            )
+            return response["ResponseMetadata"]["HTTPStatusCode"] == 200
+        except ClientError:
+            return False
+
+    async def upload_fileobj(self, file_obj: AsyncReadable, file_key: str) -> bool:
+        """
+        Потоковая загрузка файла кусками: в памяти одновременно не больше
+        S3_MULTIPART_THRESHOLD + S3_MULTIPART_PART_SIZE байт независимо от размера файла.
+        Файлы не больше порога уходят одним put_object, остальные - через multipart upload.
+        """
+        part_size = settings.S3_MULTIPART_PART_SIZE
+        first_chunk = await file_obj.read(settings.S3_MULTIPART_THRESHOLD)
+        next_chunk = await file_obj.read(part_size)
+        if not next_chunk:
+            return await self.upload_file(first_chunk, file_key)
+
+        client = await self._get_client()
+        try:
+            upload = await client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=file_key, ACL="public-read"
+            )
+        except (ClientError, BotoCoreError):
+            return False
+        upload_id = upload["UploadId"]
+        parts: List[Dict] = list()
+        try:
+            for chunk in (first_chunk, next_chunk):
+                parts.append(
+                    await self._upload_part(client, file_key, upload_id, parts, chunk)
+                )
+            del first_chunk, next_chunk
+            while chunk := await file_obj.read(part_size):
+                parts.append(
+                    await self._upload_part(client, file_key, upload_id, parts, chunk)
+                )
+            response = await client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            return response["ResponseMetadata"]["HTTPStatusCode"] == 200
+        except BaseException as error:
+            # Незавершенная загрузка хранит части в S3, пока ее не отменят;
+            # отмена нужна и при разрыве соединения, и при отключении клиента
             try:
-                response = await client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=file_key,
-                    Body=file_data,
-                    ACL="public-read",  # или другой ACL, если нужно
+                await client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=file_key, UploadId=upload_id
                 )
-                return response["ResponseMetadata"]["HTTPStatusCode"] == 200
-            except ClientError:
+            except (ClientError, BotoCoreError):
+                pass
+            if isinstance(error, (ClientError, BotoCoreError)):
                 return False
+            raise
+
+    async def _upload_part(
+        self, client, file_key: str, upload_id: str, parts: List[Dict], chunk: bytes
+    ) -> Dict:
+        part_number = len(parts) + 1
+        response = await client.upload_part(
+            Bucket=self.bucket_name,
+            Key=file_key,
+            PartNumber=part_number,
+            UploadId=upload_id,
+            Body=chunk,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
 
     async def delete_file(self, file_key: str) -> bool:
-        async with await self._get_client() as client:
-            try:
-                response = await client.delete_object(
-                    Bucket=self.bucket_name,
-                    Key=file_key,
-                )
-                return response["ResponseMetadata"]["HTTPStatusCode"] in (200, 204)
-            except ClientError:
-                return False
+        client = await self._get_client()
+        try:
+            response = await client.delete_object(
+                Bucket=self.bucket_name,
+                Key=file_key,
+            )
+            return response["ResponseMetadata"]["HTTPStatusCode"] in (200, 204)
+        except ClientError:
+            return False
 
     async def get_file(self, zone_id: str) -> Optional[bytes]:
+        client = await self._get_client()
         try:
-            async with await self._get_client() as client:
-                response = await client.get_object(
-                    Bucket=self.bucket_name, Key=f"zone/{zone_id}.jpg"
-                )
-                s3_image_data = await response["Body"].read()
-                return s3_image_data
+            response = await client.get_object(
+                Bucket=self.bucket_name, Key=f"zone/{zone_id}.jpg"
+            )
+            async with response["Body"] as stream:
+                s3_image_data = await stream.read()
+            return s3_image_data
         except ClientError:
             return None
@@ -16,13 +16,25 @@ from .region import (
     ZoneRegionDetails,
     Subregion,
     SubregionCreateByName,
+    RegionAssignment,
+)
+from .common_attributes import (
+    Object_ID,
+    PaginationBase,
+    Object_str_ID,
+    CursorPagination,
+    CursorPage,
 )
-from .common_attributes import Object_ID, PaginationBase, Object_str_ID
 from .coverage_zone import (
     CoverageZoneCreate,
     CoverageZoneInDB,
     CoverageZoneUpdate,
     NumberOfZones,
+    FootprintGeometry,
+    SpotBeam,
+    TheoreticalFootprintRequest,
+    EirpContour,
+    TheoreticalFootprint,
 )
 from .satellite import (
     SatelliteCreate,
@@ -33,6 +45,16 @@ from .satellite import (
     SatelliteUpdate,
     SatelliteCharacteristicUpdate,
     SatelliteCompleteUpdate,
+    ExportFormat,
+    SatelliteBulkItem,
+    SatelliteBulkCreate,
+    SatelliteBulkResult,
+    BulkItemStatus,
+    SatelliteCodes,
+    SatelliteCompleteInfoResult,
+    GeoSlot,
+    TerminalLookAngleRequest,
+    TerminalLookAngles,
 )
 
 from .user import (
@@ -46,6 +68,7 @@ from .user import (
     UserPassword,
     UserCreateInDB,
     UserPasswordHash,
+    UserAuthStatus,
 )
 
 from .token import (
@@ -57,12 +80,34 @@ from .token import (
     AccessToken,
 )
 
+from .metrics import HashingPoolStats, CacheStats, DatabasePoolStats
+from .orbit import (
+    OrbitalElementsBase,
+    OrbitalElementsInDB,
+    TLELines,
+    SatelliteState,
+    CatalogPositions,
+    ElementSetFormat,
+    ElementSetIngestReport,
+    GroundStation,
+    PassPredictionRequest,
+    LookAngle,
+    SatellitePass,
+    SatelliteVisibility,
+    ConjunctionScreeningRequest,
+    ConjunctionInDB,
+    ConjunctionScreeningReport,
+    ConjunctionScreeningStatus,
+)
+
 __all__ = [
     "CountryCreate",
     "CountryInDB",
     "CountryUpdate",
     "Object_ID",
     "PaginationBase",
+    "CursorPagination",
+    "CursorPage",
     "CountryFind",
     "RegionCreate",
     "RegionInDB",
@@ -83,11 +128,27 @@ __all__ = [
     "SatelliteCharacteristicInDB",
     "SatelliteCharacteristicCreate",
     "SatelliteCompleteInfo",
+    "ExportFormat",
+    "SatelliteBulkItem",
+    "SatelliteBulkCreate",
+    "SatelliteBulkResult",
+    "BulkItemStatus",
+    "SatelliteCodes",
+    "SatelliteCompleteInfoResult",
+    "GeoSlot",
+    "TerminalLookAngleRequest",
+    "TerminalLookAngles",
     "SatelliteUpdate",
     "SatelliteCharacteristicUpdate",
     "SatelliteCompleteUpdate",
     "NumberOfZones",
+    "FootprintGeometry",
+    "SpotBeam",
+    "TheoreticalFootprintRequest",
+    "EirpContour",
+    "TheoreticalFootprint",
     "SubregionCreateByName",
+    "RegionAssignment",
     "UserUpdate",
     "UserRole",
     "UserCreate",
@@ -98,10 +159,30 @@ __all__ = [
     "UserPassword",
     "UserCreateInDB",
     "UserPasswordHash",
+    "UserAuthStatus",
     "Token",
     "CreateRefreshToken",
     "RefreshTokenInDB",
     "RefreshToken",
     "TokenData",
     "AccessToken",
+    "HashingPoolStats",
+    "DatabasePoolStats",
+    "CacheStats",
+    "OrbitalElementsBase",
+    "OrbitalElementsInDB",
+    "TLELines",
+    "SatelliteState",
+    "CatalogPositions",
+    "ElementSetFormat",
+    "ElementSetIngestReport",
+    "GroundStation",
+    "PassPredictionRequest",
+    "LookAngle",
+    "SatellitePass",
+    "SatelliteVisibility",
+    "ConjunctionScreeningRequest",
+    "ConjunctionInDB",
+    "ConjunctionScreeningReport",
+    "ConjunctionScreeningStatus",
 ]
@@ -1,5 +1,9 @@
+from typing import Generic, List, Optional, TypeVar
+
 from pydantic import BaseModel, Field
 
+ItemT = TypeVar("ItemT")
+
 
 class Object_ID(BaseModel):
     id: int = Field(
@@ -27,3 +31,24 @@ class PaginationBase(BaseModel):
         le=100,
         description="Смещение от начала (по умолчанию: 0), должно быть больше или равно 0",
     )
+
+
+class CursorPagination(BaseModel):
+    limit: int = Field(
+        default=30,
+        gt=0,
+        le=100,
+        description="Максимальное количество возвращаемых элементов, должно быть больше 0",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        max_length=200,
+        description="Непрозрачный курсор из next_cursor предыдущей страницы",
+    )
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    items: List[ItemT]
+    next_cursor: Optional[str] = Field(
+        default=None, description="Курсор следующей страницы, None - страница последняя"
+    )
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from fastapi import UploadFile
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Annotated, List, Literal, Optional, Tuple, Union
 
 
 class CoverageZoneBase(BaseModel):
@@ -15,9 +16,9 @@ class CoverageZoneBase(BaseModel):
 
 
 class CoverageZoneCreate(CoverageZoneBase):
-    image_data: bytes = Field(
+    image_data: Union[bytes, UploadFile] = Field(
         ...,
-        description="Бинарные данные изображения",
+        description="Бинарные данные изображения или загружаемый файл для потоковой передачи в S3",
     )
 
 
@@ -31,9 +32,9 @@ class CoverageZoneInDB(CoverageZoneBase):
 
 
 class CoverageZoneUpdate(BaseModel):
-    image_data: Optional[bytes] = Field(
+    image_data: Optional[Union[bytes, UploadFile]] = Field(
         None,
-        description="Бинарные данные изображения",
+        description="Бинарные данные изображения или загружаемый файл для потоковой передачи в S3",
     )
     transmitter_type: Optional[str] = Field(
         None, min_length=5, max_length=25, json_schema_extra={"example": "Ku-band"}
@@ -45,3 +46,88 @@ class CoverageZoneUpdate(BaseModel):
 
 class NumberOfZones(BaseModel):
     number_of_coverage_zones: int = Field(..., ge=0, json_schema_extra={"example": 15})
+
+
+# Вершина полигона GeoJSON: [долгота, широта]
+Position = Tuple[
+    Annotated[float, Field(ge=-180, le=180)], Annotated[float, Field(ge=-90, le=90)]
+]
+
+
+class FootprintGeometry(BaseModel):
+    """
+    Контур зоны покрытия - полигон GeoJSON: внешнее кольцо и дыры.
+    Ребро идет по кратчайшему пути по долготе, поэтому контур может пересекать
+    антимеридиан без разбиения (179 -> -179). Полюс внутри контура не поддерживается.
+    """
+
+    type: Literal["Polygon"] = "Polygon"
+    coordinates: List[
+        Annotated[List[Position], Field(min_length=4, max_length=10000)]
+    ] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        json_schema_extra={
+            "example": [[[20.0, 40.0], [60.0, 40.0], [60.0, 70.0], [20.0, 40.0]]]
+        },
+    )
+
+    @field_validator("coordinates")
+    @classmethod
+    def rings_are_polygons(cls, coordinates):
+        for ring in coordinates:
+            if len(set(ring)) < 3:
+                raise ValueError("Ring must have at least 3 distinct positions")
+        return coordinates
+
+
+class SpotBeam(BaseModel):
+    """
+    Парциальный луч: точка прицеливания, ширина по уровню -3 дБ, ЭИИМ в центре
+    луча и уровни ЭИИМ, для которых строятся изолинии
+    """
+
+    boresight_latitude: float = Field(..., ge=-90, le=90)
+    boresight_longitude: float = Field(..., ge=-180, le=180)
+    beamwidth: float = Field(
+        ..., gt=0, le=20, description="Ширина луча по уровню -3 дБ, град"
+    )
+    peak_eirp_dbw: float = Field(..., ge=0, le=100, json_schema_extra={"example": 52})
+    eirp_levels_dbw: List[float] = Field(
+        ..., min_length=1, max_length=10, json_schema_extra={"example": [50, 46, 40]}
+    )
+
+    @model_validator(mode="after")
+    def levels_within_main_lobe(self):
+        # Модель главного лепестка справедлива до 20 дБ ниже максимума
+        for level in self.eirp_levels_dbw:
+            if not self.peak_eirp_dbw - 20 <= level < self.peak_eirp_dbw:
+                raise ValueError(
+                    "EIRP levels must be below the peak by no more than 20 dB"
+                )
+        return self
+
+
+class TheoreticalFootprintRequest(BaseModel):
+    """Параметры расчетного контура; min_elevation по умолчанию из настроек"""
+
+    min_elevation: Optional[float] = Field(
+        None, ge=0, lt=90, description="Минимальный угол места, град"
+    )
+    beam: Optional[SpotBeam] = None
+
+
+class EirpContour(BaseModel):
+    eirp_dbw: float
+    geometry: FootprintGeometry
+
+
+class TheoreticalFootprint(BaseModel):
+    """Зона видимости геостационарного спутника и изолинии ЭИИМ его луча"""
+
+    satellite_code: str
+    longitude: float
+    min_elevation: float
+    visibility: FootprintGeometry
+    eirp_contours: List[EirpContour]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel, Field
+
+
+class HashingPoolStats(BaseModel):
+    """Состояние пула потоков для bcrypt"""
+
+    max_workers: int = Field(..., description="Размер пула потоков")
+    in_flight: int = Field(..., description="Задачи в работе и в очереди")
+    queue_depth: int = Field(..., description="Задачи, ожидающие свободного потока")
+    max_queue_depth: int = Field(
+        ..., description="Максимальная глубина очереди с момента запуска"
+    )
+    completed: int = Field(..., description="Количество завершённых задач")
+
+
+class CacheStats(BaseModel):
+    """Состояние кеша"""
+
+    size: int = Field(..., description="Количество записей")
+    max_size: int = Field(..., description="Максимальное количество записей")
+    hits: int = Field(..., description="Попадания с момента запуска")
+    misses: int = Field(..., description="Промахи с момента запуска")
+
+
+class DatabasePoolStats(BaseModel):
+    """Состояние пула соединений с БД"""
+
+    pool_size: int = Field(..., description="Постоянный размер пула")
+    max_overflow: int = Field(..., description="Соединений сверх постоянного пула")
+    checked_out: int = Field(..., description="Соединения, выданные запросам")
+    checked_in: int = Field(..., description="Свободные соединения в пуле")
+    overflow: int = Field(..., description="Открытые соединения сверх пула")
+    saturation: float = Field(
+        ..., description="Доля занятых соединений от pool_size + max_overflow"
+    )
+    max_checked_out: int = Field(
+        ..., description="Максимум одновременно выданных соединений с момента запуска"
+    )
+    connects: int = Field(..., description="Открыто соединений с момента запуска")
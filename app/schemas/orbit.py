@@ -0,0 +1,231 @@
+from datetime import datetime, timezone
+from enum import Enum
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, List
+
+
+class OrbitalElementsBase(BaseModel):
+    """Средние элементы орбиты SGP4 (поля OMM)"""
+
+    epoch: datetime = Field(
+        ...,
+        description="Эпоха элементов (UTC)",
+        json_schema_extra={"example": "2024-03-01T12:00:00Z"},
+    )
+    mean_motion: float = Field(..., gt=0, description="Среднее движение, об/сут")
+    eccentricity: float = Field(..., ge=0, lt=1, description="Эксцентриситет")
+    inclination: float = Field(..., ge=0, le=180, description="Наклонение, град")
+    ra_of_asc_node: float = Field(
+        ..., ge=0, lt=360, description="Долгота восходящего узла, град"
+    )
+    arg_of_pericenter: float = Field(
+        ..., ge=0, lt=360, description="Аргумент перигея, град"
+    )
+    mean_anomaly: float = Field(..., ge=0, lt=360, description="Средняя аномалия, град")
+    bstar: float = Field(0.0, description="Баллистический коэффициент B*, 1/R_E")
+    mean_motion_dot: float = Field(
+        0.0, description="Первая производная среднего движения / 2, об/сут²"
+    )
+    mean_motion_ddot: float = Field(
+        0.0, description="Вторая производная среднего движения / 6, об/сут³"
+    )
+
+    @field_validator("epoch")
+    @classmethod
+    def epoch_to_utc(cls, epoch: datetime) -> datetime:
+        if epoch.tzinfo is None:
+            return epoch.replace(tzinfo=timezone.utc)
+        return epoch.astimezone(timezone.utc)
+
+
+class OrbitalElementsInDB(OrbitalElementsBase):
+    """Элементы орбиты спутника в БД"""
+
+    international_code: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TLELines(BaseModel):
+    """Двухстрочный набор элементов (TLE)"""
+
+    line1: str = Field(..., min_length=69, max_length=69)
+    line2: str = Field(..., min_length=69, max_length=69)
+
+
+class SatelliteState(BaseModel):
+    """Положение и скорость спутника в системе TEME, None при ошибке SGP4"""
+
+    international_code: str
+    position: Optional[List[float]] = Field(None, description="x, y, z, км")
+    velocity: Optional[List[float]] = Field(None, description="vx, vy, vz, км/с")
+    error: Optional[str] = None
+
+
+class CatalogPositions(BaseModel):
+    """Положения спутников каталога на заданный момент"""
+
+    epoch: datetime
+    frame: str = "TEME"
+    items: List[SatelliteState]
+
+
+class ElementSetFormat(str, Enum):
+    """Форматы файлов с наборами элементов орбит"""
+
+    TLE = "tle"
+    OMM_JSON = "omm_json"
+    OMM_XML = "omm_xml"
+    OMM_CSV = "omm_csv"
+
+
+class ElementSetIngestReport(BaseModel):
+    """Итог загрузки файла с элементами орбит"""
+
+    format: ElementSetFormat
+    received: int = Field(0, description="Корректно разобранных записей")
+    invalid: int = Field(0, description="Записей, которые не удалось разобрать")
+    unmatched: int = Field(0, description="Записей без спутника с таким NORAD ID")
+    skipped: int = Field(
+        0, description="Записей с эпохой не новее сохраненной или повторов в файле"
+    )
+    upserted: int = Field(0, description="Сохраненных наборов элементов")
+    elapsed_seconds: float = 0.0
+    records_per_second: float = 0.0
+
+
+class GroundStation(BaseModel):
+    """Точка наблюдения на поверхности Земли (WGS84)"""
+
+    latitude: float = Field(..., ge=-90, le=90, description="Широта, град")
+    longitude: float = Field(..., ge=-180, le=180, description="Долгота, град")
+    altitude_m: float = Field(0.0, ge=-500, le=10000, description="Высота, м")
+
+
+class PassPredictionRequest(BaseModel):
+    """Параметры расчета пролетов спутников над точкой наблюдения"""
+
+    station: GroundStation
+    start: Optional[datetime] = Field(
+        None, description="Начало окна расчета (UTC), по умолчанию текущий момент"
+    )
+    duration_hours: float = Field(24.0, gt=0, le=168, description="Длина окна, ч")
+    min_elevation: float = Field(
+        10.0, ge=0, lt=90, description="Минимальный угол места, град"
+    )
+    step_seconds: int = Field(
+        60, ge=10, le=600, description="Шаг сетки поиска пролетов, с"
+    )
+    international_codes: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        max_length=500,
+        description="Спутники для расчета, по умолчанию все с элементами орбит",
+    )
+
+    @field_validator("start")
+    @classmethod
+    def start_to_utc(cls, start: Optional[datetime]) -> Optional[datetime]:
+        if start is None:
+            return None
+        if start.tzinfo is None:
+            return start.replace(tzinfo=timezone.utc)
+        return start.astimezone(timezone.utc)
+
+
+class LookAngle(BaseModel):
+    """Направление на спутник из точки наблюдения в момент time"""
+
+    time: datetime
+    azimuth: float = Field(..., description="Азимут, град от севера по часовой")
+    elevation: float = Field(..., description="Угол места, град")
+    range_km: float = Field(..., description="Наклонная дальность, км")
+
+
+class SatellitePass(BaseModel):
+    """Пролет спутника; rise/set = None, если он виден на границе окна"""
+
+    rise: Optional[LookAngle] = None
+    culmination: LookAngle
+    set: Optional[LookAngle] = None
+
+
+class SatelliteVisibility(BaseModel):
+    """
+    Видимость спутника в окне расчета. Для геостационарных спутников
+    look_angle - практически неизменное направление на спутник.
+    """
+
+    international_code: str
+    visible: bool = False
+    geostationary: bool = False
+    look_angle: Optional[LookAngle] = None
+    passes: List[SatellitePass] = list()
+    error: Optional[str] = None
+
+
+class ConjunctionScreeningRequest(BaseModel):
+    """Параметры скрининга сближений всего каталога"""
+
+    start: Optional[datetime] = Field(
+        None, description="Начало окна скрининга (UTC), по умолчанию текущий момент"
+    )
+    days: Optional[float] = Field(
+        None, gt=0, le=30, description="Длина окна, сут; по умолчанию из настроек"
+    )
+    threshold_km: Optional[float] = Field(
+        None,
+        gt=0,
+        le=100,
+        description="Расстояние, ближе которого сближение сохраняется, км",
+    )
+    step_seconds: Optional[float] = Field(
+        None, ge=10, le=300, description="Шаг сетки скрининга, с"
+    )
+
+    @field_validator("start")
+    @classmethod
+    def start_to_utc(cls, start: Optional[datetime]) -> Optional[datetime]:
+        if start is None:
+            return None
+        if start.tzinfo is None:
+            return start.replace(tzinfo=timezone.utc)
+        return start.astimezone(timezone.utc)
+
+
+class ConjunctionInDB(BaseModel):
+    """Сближение пары спутников: момент, расстояние и относительная скорость"""
+
+    international_code: str
+    other_international_code: str
+    tca: datetime = Field(..., description="Момент наибольшего сближения (UTC)")
+    miss_distance_km: float = Field(..., description="Расстояние сближения, км")
+    relative_speed_kms: float = Field(..., description="Относительная скорость, км/с")
+    screened_at: datetime = Field(..., description="Время запуска скрининга")
+
+
+class ConjunctionScreeningReport(BaseModel):
+    """Итоги скрининга сближений"""
+
+    start: datetime
+    end: datetime
+    satellites: int = Field(..., description="Спутников с элементами орбит")
+    screened: int = Field(
+        ..., description="Спутников, чей диапазон высот пересекается с другими"
+    )
+    conjunctions: int
+    elapsed_seconds: float
+
+
+class ConjunctionScreeningStatus(BaseModel):
+    """Состояние фонового скрининга сближений"""
+
+    running: bool = Field(..., description="Скрининг выполняется")
+    started_at: Optional[datetime] = Field(
+        None, description="Время запуска последнего скрининга"
+    )
+    report: Optional[ConjunctionScreeningReport] = Field(
+        None, description="Итоги последнего завершенного скрининга"
+    )
+    error: Optional[str] = Field(
+        None, description="Ошибка последнего скрининга, если он не завершился"
+    )
@@ -92,3 +92,18 @@ class ZoneRegionDetails(RegionInDB):
     """Схема для одного региона зоны"""
 
     subregion_list: List[Subregion]
+
+
+class RegionAssignment(BaseModel):
+    """Результат привязки регионов к зоне по ее контуру"""
+
+    region_ids: List[int] = Field(
+        ..., description="Регионы, граница которых пересекает контур зоны"
+    )
+    subregion_ids: List[int] = Field(
+        ..., description="Подрегионы, граница которых пересекает контур зоны"
+    )
+    regions_added: int = Field(
+        ..., description="Новых связей с регионами, включая регионы подрегионов"
+    )
+    subregions_added: int = Field(..., description="Новых связей с подрегионами")
@@ -1,6 +1,7 @@
 from datetime import date
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, ClassVar
+from enum import Enum
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from typing import Annotated, Optional, ClassVar, List
 
 
 class SatelliteBase(BaseModel):
@@ -217,3 +218,101 @@ class SatelliteCompleteInfo(SatelliteInDB, SatelliteCharacteristicBase):
 
 class SatelliteCompleteUpdate(SatelliteUpdate, SatelliteCharacteristicUpdate):
     """Схема для обновления полной информации о спутнике"""
+
+
+class SatelliteBulkItem(BaseModel):
+    """Спутник с характеристиками для пакетного создания"""
+
+    satellite: SatelliteCreate
+    characteristic: SatelliteCharacteristicCreate
+
+
+class SatelliteBulkCreate(BaseModel):
+    """Пакет спутников для создания за одну транзакцию"""
+
+    items: List[SatelliteBulkItem] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkItemStatus(str, Enum):
+    CREATED = "created"
+    CONFLICT = "conflict"
+    INVALID = "invalid"
+
+
+class SatelliteBulkResult(BaseModel):
+    """Результат создания одного спутника из пакета"""
+
+    international_code: str
+    status: BulkItemStatus
+    detail: Optional[str] = None
+
+
+class SatelliteCodes(BaseModel):
+    """Список международных кодов спутников для пакетного получения"""
+
+    international_codes: List[str] = Field(..., min_length=1, max_length=200)
+
+
+class SatelliteCompleteInfoResult(BaseModel):
+    """Результат поиска спутника по коду, satellite = None если не найден"""
+
+    international_code: str
+    found: bool
+    satellite: Optional[SatelliteCompleteInfo] = None
+
+
+class GeoSlot(BaseModel):
+    """Точка стояния GEO-спутника, distance - угловое расстояние до запрошенной долготы"""
+
+    international_code: str
+    longitude: float
+    distance: Optional[float] = None
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TerminalLookAngleRequest(BaseModel):
+    """
+    Наземные терминалы и GEO-спутники для расчета углов наведения.
+    Координаты терминалов передаются параллельными массивами.
+    """
+
+    latitudes: List[Annotated[float, Field(ge=-90, le=90)]] = Field(
+        ..., min_length=1, max_length=20000, description="Широты терминалов, град"
+    )
+    longitudes: List[Annotated[float, Field(ge=-180, le=180)]] = Field(
+        ..., min_length=1, max_length=20000, description="Долготы терминалов, град"
+    )
+    altitudes_m: Optional[List[float]] = Field(
+        None, description="Высоты терминалов, м; по умолчанию 0"
+    )
+    international_codes: List[str] = Field(..., min_length=1, max_length=100)
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "TerminalLookAngleRequest":
+        size = len(self.latitudes)
+        if len(self.longitudes) != size or (
+            self.altitudes_m is not None and len(self.altitudes_m) != size
+        ):
+            raise ValueError("Terminal coordinate arrays must have equal length")
+        return self
+
+
+class TerminalLookAngles(BaseModel):
+    """
+    Углы наведения терминалов на спутники: строка i массивов azimuth,
+    elevation и range_km относится к спутнику international_codes[i],
+    столбец j - к терминалу j запроса
+    """
+
+    international_codes: List[str]
+    satellite_longitudes: List[float]
+    azimuth: List[List[float]] = Field(..., description="Азимут, град")
+    elevation: List[List[float]] = Field(..., description="Угол места, град")
+    range_km: List[List[float]] = Field(..., description="Наклонная дальность, км")
+    not_found: List[str] = Field(
+        list(), description="Спутники без долготы стояния в характеристиках"
+    )
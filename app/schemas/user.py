@@ -82,3 +82,10 @@ class AdminPassword(BaseModel):
 
 class UserPasswordHash(BaseModel):
     hashed_password: str
+
+
+class UserAuthStatus(BaseModel):
+    """Статус пользователя для проверки прав по access-токену"""
+
+    exists: bool
+    role: Optional[str] = None
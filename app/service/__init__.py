@@ -1,10 +1,25 @@
-from .security import verify_password, get_hash
+from .security import (
+    verify_password,
+    get_hash,
+    verify_password_async,
+    get_hash_async,
+    password_hasher,
+)
 from .country_service import CountryService
-from .satellite_service import SatelliteService
-from .region_service import RegionService
-from .coverage_zone_service import CoverageZoneService
-from .user_service import UserService
+from .satellite_service import SatelliteService, satellite_cache, geo_slot_index
+from .region_service import (
+    RegionService,
+    region_boundary_index,
+    subregion_boundary_index,
+)
+from .coverage_zone_service import (
+    CoverageZoneService,
+    coverage_index,
+    footprint_cache,
+)
+from .user_service import UserService, user_status_cache
 from .token_service import TokenService
+from .orbit_service import OrbitService, ScreeningJob, conjunction_screener
 from .service import (
     create_country_service,
     create_satellite_service,
@@ -12,21 +27,38 @@ from .service import (
     create_coverage_zone_service,
     create_user_service,
     create_token_service,
+    create_orbit_service,
+    screening_job,
 )
 
 __all__ = [
     "CountryService",
     "create_country_service",
     "SatelliteService",
+    "satellite_cache",
+    "geo_slot_index",
+    "coverage_index",
+    "footprint_cache",
     "create_satellite_service",
     "RegionService",
+    "region_boundary_index",
+    "subregion_boundary_index",
     "create_region_service",
     "CoverageZoneService",
     "create_coverage_zone_service",
     "verify_password",
     "get_hash",
+    "verify_password_async",
+    "get_hash_async",
+    "password_hasher",
     "UserService",
+    "user_status_cache",
     "create_user_service",
     "TokenService",
     "create_token_service",
+    "OrbitService",
+    "create_orbit_service",
+    "conjunction_screener",
+    "ScreeningJob",
+    "screening_job",
 ]
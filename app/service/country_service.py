@@ -6,6 +6,8 @@ from app.schemas import (
     CountryUpdate,
     Object_ID,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     SatelliteInDB,
 )
 from typing import Optional, List
@@ -71,7 +73,12 @@ class CountryService:
         return country
 
     async def get_countries(self, pagination: PaginationBase) -> List[CountryInDB]:
-        return await self.repository.get_models(pagination)
+        return await self.repository.get_projected(pagination)
+
+    async def get_countries_page(
+        self, pagination: CursorPagination
+    ) -> Optional[CursorPage[CountryInDB]]:
+        return await self.repository.get_page(pagination)
 
     async def get_country(self, country_id: int) -> Optional[CountryInDB]:
         return await self.repository.get_as_model(Object_ID(id=country_id))
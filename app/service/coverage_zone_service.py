@@ -1,4 +1,9 @@
-from app.db import CoverageZoneRepository, RegionRepository
+from app.db import (
+    CoverageZoneRepository,
+    RegionRepository,
+    SubregionRepository,
+    SatelliteCharacteristicRepository,
+)
 from app.schemas import (
     CoverageZoneInDB,
     Object_str_ID,
@@ -10,16 +15,52 @@ from app.schemas import (
     SubregionBase,
     CoverageZoneUpdate,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     NumberOfZones,
     SubregionCreateByName,
+    FootprintGeometry,
+    TheoreticalFootprintRequest,
+    TheoreticalFootprint,
+    EirpContour,
+    RegionAssignment,
+)
+from app.core import settings, TTLCache
+from app.orbit import (
+    PolygonIndex,
+    normalize_polygon,
+    visibility_contours,
+    beam_contours,
 )
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import ValidationError
+from app.service import RegionService
+
+# Контуры зон покрытия с пространственным индексом; обновляется при записи
+# контура и удалении зоны и перечитывается из БД по TTL
+coverage_index: PolygonIndex[str] = PolygonIndex(
+    ttl_seconds=settings.COVERAGE_INDEX_TTL_SECONDS
+)
+
+# Расчетные контуры по параметрам (долгота, угол места, луч): не зависят
+# от спутника, поэтому общие для спутников в одной точке стояния
+footprint_cache: TTLCache[tuple, Tuple[FootprintGeometry, List[EirpContour]]] = (
+    TTLCache(ttl_seconds=float("inf"), max_size=settings.FOOTPRINT_CACHE_SIZE)
+)
+
+
+def _as_geometry(ring) -> FootprintGeometry:
+    return FootprintGeometry(coordinates=[ring.round(4).tolist()])
 
 
 class CoverageZoneService:
-    def __init__(self, repository: CoverageZoneRepository):
+    def __init__(
+        self,
+        repository: CoverageZoneRepository,
+        index: PolygonIndex[str] = coverage_index,
+    ):
         self.repository = repository
+        self.index = index
 
     @staticmethod
     async def _get_validated_object_id(
@@ -73,7 +114,12 @@ class CoverageZoneService:
     async def get_coverage_zones(
         self, pagination: PaginationBase
     ) -> List[CoverageZoneInDB]:
-        return await self.repository.get_models(pagination)
+        return await self.repository.get_projected(pagination)
+
+    async def get_coverage_zones_page(
+        self, pagination: CursorPagination
+    ) -> Optional[CursorPage[CoverageZoneInDB]]:
+        return await self.repository.get_page(pagination)
 
     async def get_count_coverage_zone_in_db(self) -> Optional[NumberOfZones]:
         try:
@@ -216,4 +262,197 @@ class CoverageZoneService:
         res = await self.repository.delete_model(coverage_zone_id)
         if res:
             await self.repository.session.commit()
+            self.index.remove(coverage_zone_id.id)
+        return res
+
+    async def set_footprint(
+        self, coverage_zone_id: str, geometry: FootprintGeometry
+    ) -> bool:
+        coverage_zone_id = await self._get_validated_object_id(coverage_zone_id)
+        if coverage_zone_id is None:
+            return False
+        res = await self.repository.set_footprint(coverage_zone_id, geometry)
+        if res:
+            await self.repository.session.commit()
+            self.index.set(coverage_zone_id.id, normalize_polygon(geometry.coordinates))
         return res
+
+    async def get_footprint(self, coverage_zone_id: str) -> Optional[FootprintGeometry]:
+        coverage_zone_id = await self._get_validated_object_id(coverage_zone_id)
+        return (
+            await self.repository.get_footprint(coverage_zone_id)
+            if coverage_zone_id is not None
+            else None
+        )
+
+    async def delete_footprint(self, coverage_zone_id: str) -> bool:
+        coverage_zone_id = await self._get_validated_object_id(coverage_zone_id)
+        if coverage_zone_id is None:
+            return False
+        res = await self.repository.delete_footprint(coverage_zone_id)
+        if res:
+            await self.repository.session.commit()
+            self.index.remove(coverage_zone_id.id)
+        return res
+
+    async def _get_coverage_index(self) -> PolygonIndex[str]:
+        if self.index.is_stale():
+            version = self.index.version
+            footprints = await self.repository.get_footprints()
+            self.index.load(
+                (
+                    (zone_id, normalize_polygon(geometry["coordinates"]))
+                    for zone_id, geometry in footprints
+                ),
+                version,
+            )
+        return self.index
+
+    async def assign_regions_from_footprint(
+        self, coverage_zone_id: str
+    ) -> Optional[RegionAssignment]:
+        """
+        Привязывает к зоне все регионы и подрегионы, граница которых пересекает
+        контур зоны. Кандидаты выбираются по индексу границ, связи добавляются
+        двумя INSERT ... SELECT. None, если у зоны нет контура.
+        """
+        coverage_zone_id = await self._get_validated_object_id(coverage_zone_id)
+        if coverage_zone_id is None:
+            return None
+        footprint = await self.repository.get_footprint(coverage_zone_id)
+        if footprint is None:
+            return None
+        session = self.repository.session
+        region_service = RegionService(
+            RegionRepository(session), SubregionRepository(session)
+        )
+        region_ids, subregion_ids = await region_service.find_intersecting(
+            normalize_polygon(footprint.coordinates)
+        )
+        regions_added, subregions_added = await self.repository.attach_regions(
+            coverage_zone_id, region_ids, subregion_ids
+        )
+        await session.commit()
+        return RegionAssignment(
+            region_ids=region_ids,
+            subregion_ids=subregion_ids,
+            regions_added=regions_added,
+            subregions_added=subregions_added,
+        )
+
+    async def get_coverage_zones_at_point(
+        self, longitude: float, latitude: float
+    ) -> List[CoverageZoneInDB]:
+        """Зоны, контур которых содержит точку"""
+        index = await self._get_coverage_index()
+        return await self.repository.get_models_by_ids(
+            index.covering(longitude, latitude)
+        )
+
+    async def get_coverage_zones_in_box(
+        self, west: float, south: float, east: float, north: float
+    ) -> List[CoverageZoneInDB]:
+        """Зоны, контур которых пересекает прямоугольник; west > east - через антимеридиан"""
+        index = await self._get_coverage_index()
+        return await self.repository.get_models_by_ids(
+            index.intersecting(west, south, east, north)
+        )
+
+    @staticmethod
+    def _compute_footprint(
+        longitude: float, min_elevation: float, request: TheoreticalFootprintRequest
+    ) -> Tuple[FootprintGeometry, List[EirpContour]]:
+        """Контуры из кеша или расчет; ValueError, если луч не виден со спутника"""
+        beam = request.beam
+        key = (
+            longitude,
+            min_elevation,
+            beam.model_dump_json() if beam is not None else None,
+        )
+        result = footprint_cache.get(key)
+        if result is not None:
+            return result
+        points = settings.FOOTPRINT_POINTS
+        (visibility,) = visibility_contours(longitude, [min_elevation], points)
+        contours = list()
+        if beam is not None:
+            rings = beam_contours(
+                longitude,
+                beam.boresight_latitude,
+                beam.boresight_longitude,
+                beam.beamwidth,
+                beam.peak_eirp_dbw,
+                beam.eirp_levels_dbw,
+                points,
+            )
+            contours = [
+                EirpContour(eirp_dbw=level, geometry=_as_geometry(ring))
+                for level, ring in zip(beam.eirp_levels_dbw, rings)
+            ]
+        result = (_as_geometry(visibility), contours)
+        footprint_cache.set(key, result)
+        return result
+
+    async def _get_satellite_longitude(
+        self, satellite_code: Object_str_ID
+    ) -> Optional[float]:
+        characteristic_repository = SatelliteCharacteristicRepository(
+            self.repository.session
+        )
+        characteristics = await characteristic_repository.get_by_field(
+            field_name="international_code", field_value=satellite_code.id
+        )
+        return characteristics.longitude if characteristics is not None else None
+
+    async def get_theoretical_footprint(
+        self, satellite_code: str, request: TheoreticalFootprintRequest
+    ) -> Optional[TheoreticalFootprint]:
+        """
+        Зона видимости и изолинии ЭИИМ по точке стояния спутника.
+        None, если спутник не найден или его долгота неизвестна.
+        """
+        satellite_code = await self._get_validated_object_id(satellite_code)
+        if satellite_code is None:
+            return None
+        longitude = await self._get_satellite_longitude(satellite_code)
+        if longitude is None:
+            return None
+        min_elevation = (
+            request.min_elevation
+            if request.min_elevation is not None
+            else settings.FOOTPRINT_MIN_ELEVATION
+        )
+        visibility, contours = self._compute_footprint(
+            longitude, min_elevation, request
+        )
+        return TheoreticalFootprint(
+            satellite_code=satellite_code.id,
+            longitude=longitude,
+            min_elevation=min_elevation,
+            visibility=visibility,
+            eirp_contours=contours,
+        )
+
+    async def generate_footprint(
+        self, coverage_zone_id: str, request: TheoreticalFootprintRequest
+    ) -> Optional[FootprintGeometry]:
+        """
+        Сохраняет расчетный контур как контур зоны: изолинию наименьшего
+        уровня ЭИИМ, если задан луч, иначе зону видимости спутника.
+        """
+        coverage_zone = await self.get_by_id(coverage_zone_id)
+        if coverage_zone is None:
+            return None
+        footprint = await self.get_theoretical_footprint(
+            coverage_zone.satellite_code, request
+        )
+        if footprint is None:
+            return None
+        geometry = footprint.visibility
+        if footprint.eirp_contours:
+            geometry = min(
+                footprint.eirp_contours, key=lambda contour: contour.eirp_dbw
+            ).geometry
+        if not await self.set_footprint(coverage_zone_id, geometry):
+            return None
+        return geometry
@@ -0,0 +1,519 @@
+from __future__ import annotations
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import (
+    Awaitable,
+    Callable,
+    Optional,
+    List,
+    Dict,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+from pydantic import ValidationError
+from sgp4.api import Satrec
+from sqlalchemy import Row
+
+from app.core import (
+    settings,
+    TTLCache,
+    InvalidTLEError,
+    InvalidElementSetFileError,
+)
+from app.orbit import (
+    ElementSetRecord,
+    ElementSetReader,
+    satrec_from_elements,
+    elements_from_tle,
+    to_datetime64,
+    from_datetime64,
+    propagate,
+    sgp4_error_message,
+    is_geostationary,
+    predict_passes,
+    GroundPoint,
+    PassEvent,
+    SatelliteTrack,
+    CloseApproach,
+    orbit_shells,
+    shell_overlap_mask,
+    screen_window,
+    screen_elements,
+    merge_approaches,
+)
+from app.orbit.conjunctions import SHELL_MARGIN_KM
+from app.orbit.visibility import time_grid
+from app.schemas import (
+    Object_str_ID,
+    OrbitalElementsBase,
+    OrbitalElementsInDB,
+    TLELines,
+    SatelliteState,
+    CatalogPositions,
+    ElementSetIngestReport,
+    PassPredictionRequest,
+    LookAngle,
+    SatellitePass,
+    SatelliteVisibility,
+    ConjunctionScreeningRequest,
+    ConjunctionInDB,
+    ConjunctionScreeningReport,
+    ConjunctionScreeningStatus,
+)
+
+if TYPE_CHECKING:
+    from app.db import (
+        OrbitalElementsRepository,
+        SatelliteRepository,
+        ConjunctionRepository,
+    )
+
+# Инициализированные модели SGP4 по строке элементов орбиты: пока элементы
+# спутника не меняются, sgp4init для него повторно не вызывается
+satrec_cache: TTLCache[tuple, Satrec] = TTLCache(
+    ttl_seconds=float("inf"), max_size=settings.ORBIT_SATREC_CACHE_SIZE
+)
+
+
+class ConjunctionScreener:
+    """
+    Запускает скрининг сближений в пуле процессов: окно расчета делится
+    на части по времени, каждая часть считается в своем процессе.
+    Небольшие задачи выполняются в потоке без передачи данных между процессами.
+    """
+
+    # Меньше этого числа точек спутник x момент на процесс пул не используется
+    MIN_TASK_GRID_POINTS = 500_000
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: дочерние процессы не наследуют соединения и потоки приложения
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def screen(
+        self,
+        elements: Sequence[OrbitalElementsBase],
+        satrecs: Sequence[Satrec],
+        start: datetime,
+        offsets: np.ndarray,
+        step_seconds: float,
+        threshold_km: float,
+    ) -> List[CloseApproach]:
+        """
+        Сближения спутников; satrecs - уже инициализированные модели для elements
+        на случай расчета в текущем процессе
+        """
+        moment = to_datetime64(start)
+        parts = min(
+            self.max_workers,
+            len(satrecs) * len(offsets) // self.MIN_TASK_GRID_POINTS,
+        )
+        if parts <= 1:
+            return await asyncio.to_thread(
+                screen_window, satrecs, moment, offsets, step_seconds, threshold_km
+            )
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._get_executor(),
+                    screen_elements,
+                    list(elements),
+                    moment,
+                    part,
+                    step_seconds,
+                    threshold_km,
+                )
+                for part in np.array_split(offsets, parts)
+            )
+        )
+        # Сближение на границе частей находят обе соседние части
+        return merge_approaches(
+            [approach for result in results for approach in result], step_seconds
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+conjunction_screener = ConjunctionScreener(
+    max_workers=settings.CONJUNCTION_SCREENING_WORKERS
+)
+
+
+class ScreeningJob:
+    """
+    Скрининг сближений в фоновой задаче процесса: одновременно выполняется
+    не больше одного запуска, итоги последнего хранятся в памяти
+    """
+
+    def __init__(
+        self,
+        run: Callable[
+            [ConjunctionScreeningRequest], Awaitable[ConjunctionScreeningReport]
+        ],
+    ):
+        self._run = run
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[datetime] = None
+        self._report: Optional[ConjunctionScreeningReport] = None
+        self._error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, request: ConjunctionScreeningRequest) -> bool:
+        """Запуск скрининга, False - предыдущий запуск еще выполняется"""
+        if self.running:
+            return False
+        self._started_at = datetime.now(timezone.utc)
+        self._task = asyncio.create_task(self._execute(request))
+        return True
+
+    async def _execute(self, request: ConjunctionScreeningRequest) -> None:
+        try:
+            self._report, self._error = await self._run(request), None
+        except Exception as error:
+            self._error = repr(error)
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def cancel(self) -> None:
+        """Остановка при завершении приложения"""
+        if self.running:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def get_status(self) -> ConjunctionScreeningStatus:
+        return ConjunctionScreeningStatus(
+            running=self.running,
+            started_at=self._started_at,
+            report=self._report,
+            error=self._error,
+        )
+
+
+class OrbitService:
+    def __init__(
+        self,
+        repository: OrbitalElementsRepository,
+        satellite_repository: SatelliteRepository,
+        conjunction_repository: ConjunctionRepository,
+        screener: ConjunctionScreener = conjunction_screener,
+    ):
+        self.repository = repository
+        self.satellite_repository = satellite_repository
+        self.conjunction_repository = conjunction_repository
+        self.screener = screener
+
+    @staticmethod
+    async def _get_validated_code(satellite_id: str) -> Optional[Object_str_ID]:
+        try:
+            return Object_str_ID(id=satellite_id)
+        except ValidationError:
+            return None
+
+    async def get_elements(self, satellite_id: str) -> Optional[OrbitalElementsInDB]:
+        international_code = await self._get_validated_code(satellite_id)
+        if international_code is None:
+            return None
+        return await self.repository.get_elements(international_code)
+
+    async def set_elements(
+        self, satellite_id: str, elements: OrbitalElementsBase
+    ) -> Optional[OrbitalElementsInDB]:
+        international_code = await self._get_validated_code(satellite_id)
+        if international_code is None:
+            return None
+        satellite = await self.satellite_repository.get_by_field(
+            field_name="international_code", field_value=international_code.id
+        )
+        if satellite is None:
+            return None
+        res = await self.repository.upsert_elements(international_code, elements)
+        await self.repository.session.commit()
+        return res
+
+    async def set_elements_from_tle(
+        self, satellite_id: str, tle: TLELines
+    ) -> Optional[OrbitalElementsInDB]:
+        international_code = await self._get_validated_code(satellite_id)
+        if international_code is None:
+            return None
+        satellite = await self.satellite_repository.get_by_field(
+            field_name="international_code", field_value=international_code.id
+        )
+        if satellite is None:
+            return None
+        try:
+            norad_id, elements = elements_from_tle(tle.line1, tle.line2)
+        except (ValueError, ValidationError):
+            raise InvalidTLEError()
+        if norad_id != satellite.norad_id:
+            raise InvalidTLEError("NORAD ID in TLE does not match the satellite")
+        res = await self.repository.upsert_elements(international_code, elements)
+        await self.repository.session.commit()
+        return res
+
+    @staticmethod
+    def _get_satrecs(rows: Sequence[Row]) -> List[Satrec]:
+        satrecs = list()
+        for row in rows:
+            satrec = satrec_cache.get(tuple(row))
+            if satrec is None:
+                satrec = satrec_from_elements(row)
+                satrec_cache.set(tuple(row), satrec)
+            satrecs.append(satrec)
+        return satrecs
+
+    async def get_catalog_positions(self, epoch: datetime) -> CatalogPositions:
+        """Положения всех спутников с элементами орбит на момент epoch"""
+        rows = await self.repository.get_all_elements()
+        if not rows:
+            return CatalogPositions(epoch=epoch, items=[])
+        result = propagate(self._get_satrecs(rows), np.array([to_datetime64(epoch)]))
+        items = list()
+        for row, error, position, velocity in zip(
+            rows,
+            result.errors[:, 0].tolist(),
+            result.positions[:, 0].tolist(),
+            result.velocities[:, 0].tolist(),
+        ):
+            items.append(
+                SatelliteState(
+                    international_code=row.international_code,
+                    error=sgp4_error_message(error),
+                )
+                if error
+                else SatelliteState(
+                    international_code=row.international_code,
+                    position=position,
+                    velocity=velocity,
+                )
+            )
+        return CatalogPositions(epoch=epoch, items=items)
+
+    async def ingest_element_sets(
+        self, reader: ElementSetReader
+    ) -> ElementSetIngestReport:
+        """
+        Загрузка файла элементов орбит пачками по ORBIT_INGEST_BATCH_SIZE записей.
+        Очередная пачка разбирается в отдельном потоке, каждая сохраненная пачка
+        фиксируется своей транзакцией.
+        :raises InvalidElementSetFileError: структура файла повреждена
+        """
+        report = ElementSetIngestReport(format=reader.format)
+        started = perf_counter()
+        batches = reader.batches(settings.ORBIT_INGEST_BATCH_SIZE)
+        while True:
+            try:
+                batch = await asyncio.to_thread(next, batches, None)
+            except ValueError as error:
+                raise InvalidElementSetFileError(str(error))
+            if batch is None:
+                break
+            report.received += len(batch)
+            await self._ingest_batch(batch, report)
+        report.invalid = reader.invalid
+        report.elapsed_seconds = perf_counter() - started
+        if report.elapsed_seconds > 0:
+            report.records_per_second = (
+                report.received + report.invalid
+            ) / report.elapsed_seconds
+        return report
+
+    async def _ingest_batch(
+        self, batch: List[ElementSetRecord], report: ElementSetIngestReport
+    ) -> None:
+        latest: Dict[int, ElementSetRecord] = dict()
+        for record in batch:
+            current = latest.get(record.norad_id)
+            if current is None or current.elements.epoch < record.elements.epoch:
+                latest[record.norad_id] = record
+        report.skipped += len(batch) - len(latest)
+        state = await self.repository.get_ingest_state(list(latest))
+        rows = list()
+        for norad_id, record in latest.items():
+            if norad_id not in state:
+                report.unmatched += 1
+                continue
+            international_code, epoch = state[norad_id]
+            if epoch is not None and record.elements.epoch <= epoch:
+                report.skipped += 1
+                continue
+            rows.append(
+                {
+                    "international_code": international_code,
+                    **record.elements.model_dump(),
+                }
+            )
+        if rows:
+            await self.repository.upsert_elements_bulk(rows)
+            await self.repository.session.commit()
+        report.upserted += len(rows)
+
+    async def predict_passes(
+        self, request: PassPredictionRequest
+    ) -> List[SatelliteVisibility]:
+        """
+        Пролеты спутников над точкой наблюдения. Расчет выполняется в отдельном
+        потоке, чтобы не блокировать цикл событий.
+        """
+        start = request.start or datetime.now(timezone.utc)
+        end = start + timedelta(hours=request.duration_hours)
+        if request.international_codes is None:
+            rows = await self.repository.get_all_elements()
+        else:
+            rows = await self.repository.get_elements_many(request.international_codes)
+        tracks = list()
+        if rows:
+            station = request.station
+            tracks = await asyncio.to_thread(
+                predict_passes,
+                self._get_satrecs(rows),
+                GroundPoint(
+                    station.latitude, station.longitude, station.altitude_m / 1000
+                ),
+                start,
+                end,
+                request.step_seconds,
+                request.min_elevation,
+            )
+        visibility = {
+            row.international_code: self._to_visibility(row, track)
+            for row, track in zip(rows, tracks)
+        }
+        if request.international_codes is None:
+            return list(visibility.values())
+        return [
+            visibility.get(code)
+            or SatelliteVisibility(
+                international_code=code, error="Orbital elements not found"
+            )
+            for code in request.international_codes
+        ]
+
+    @staticmethod
+    def _to_look_angle(event: Optional[PassEvent]) -> Optional[LookAngle]:
+        if event is None:
+            return None
+        return LookAngle(
+            time=from_datetime64(event.time),
+            azimuth=event.azimuth,
+            elevation=event.elevation,
+            range_km=event.range_km,
+        )
+
+    def _to_visibility(self, row: Row, track: SatelliteTrack) -> SatelliteVisibility:
+        geostationary = is_geostationary(
+            row.mean_motion, row.eccentricity, row.inclination
+        )
+        passes = [
+            SatellitePass(
+                rise=self._to_look_angle(satellite_pass.rise),
+                culmination=self._to_look_angle(satellite_pass.culmination),
+                set=self._to_look_angle(satellite_pass.set),
+            )
+            for satellite_pass in track.passes
+        ]
+        return SatelliteVisibility(
+            international_code=row.international_code,
+            visible=bool(passes),
+            geostationary=geostationary,
+            look_angle=(
+                self._to_look_angle(track.start)
+                if geostationary and not track.error
+                else None
+            ),
+            passes=passes,
+            error=sgp4_error_message(track.error) if track.error else None,
+        )
+
+    async def screen_conjunctions(
+        self, request: ConjunctionScreeningRequest
+    ) -> ConjunctionScreeningReport:
+        """
+        Скрининг сближений всех пар спутников каталога в окне расчета.
+        Результаты заменяют сохраненные результаты предыдущего скрининга.
+        """
+        started = perf_counter()
+        screened_at = datetime.now(timezone.utc)
+        start = request.start or screened_at
+        days = request.days or settings.CONJUNCTION_SCREENING_DAYS
+        threshold_km = request.threshold_km or settings.CONJUNCTION_THRESHOLD_KM
+        step_seconds = request.step_seconds or settings.CONJUNCTION_STEP_SECONDS
+        end = start + timedelta(days=days)
+
+        rows = await self.repository.get_all_elements()
+        # Транзакция чтения закрывается: соединение не занято на время расчета
+        await self.repository.session.commit()
+        selected = list()
+        if rows:
+            satrecs = self._get_satrecs(rows)
+            # Спутники, чьи диапазоны высот не пересекаются ни с чьими, не считаются
+            perigee, apogee = orbit_shells(satrecs)
+            mask = shell_overlap_mask(perigee, apogee, SHELL_MARGIN_KM + threshold_km)
+            selected = np.flatnonzero(mask).tolist()
+        approaches = list()
+        if len(selected) > 1:
+            approaches = await self.screener.screen(
+                [
+                    OrbitalElementsBase.model_validate(rows[i], from_attributes=True)
+                    for i in selected
+                ],
+                [satrecs[i] for i in selected],
+                start,
+                time_grid(start, end, step_seconds),
+                step_seconds,
+                threshold_km,
+            )
+        codes = [rows[i].international_code for i in selected]
+        conjunctions = await self.conjunction_repository.replace_all(
+            [
+                dict(
+                    international_code=codes[approach.first],
+                    other_international_code=codes[approach.second],
+                    tca=from_datetime64(approach.tca),
+                    miss_distance_km=approach.miss_distance_km,
+                    relative_speed_kms=approach.relative_speed_kms,
+                    screened_at=screened_at,
+                )
+                for approach in approaches
+            ]
+        )
+        await self.conjunction_repository.session.commit()
+        return ConjunctionScreeningReport(
+            start=start,
+            end=end,
+            satellites=len(rows),
+            screened=len(selected),
+            conjunctions=conjunctions,
+            elapsed_seconds=perf_counter() - started,
+        )
+
+    async def get_conjunctions(
+        self, satellite_id: str
+    ) -> Optional[List[ConjunctionInDB]]:
+        """Сближения спутника по результатам последнего скрининга"""
+        international_code = await self._get_validated_code(satellite_id)
+        if international_code is None:
+            return None
+        return await self.conjunction_repository.get_by_satellite(international_code)
@@ -10,10 +10,24 @@ from app.schemas import (
     RegionUpdate,
     SubregionUpdate,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
+    FootprintGeometry,
 )
-from typing import Optional, List
+from app.core import settings
+from app.orbit import PolygonIndex, Rings, normalize_polygon
+from typing import Optional, List, Tuple, Union
 from pydantic import ValidationError
 
+# Границы регионов и подрегионов с пространственным индексом; обновляются
+# при записи границы и удалении и перечитываются из БД по TTL
+region_boundary_index: PolygonIndex[int] = PolygonIndex(
+    ttl_seconds=settings.REGION_INDEX_TTL_SECONDS
+)
+subregion_boundary_index: PolygonIndex[int] = PolygonIndex(
+    ttl_seconds=settings.REGION_INDEX_TTL_SECONDS
+)
+
 
 class RegionService:
     def __init__(
@@ -23,6 +37,8 @@ class RegionService:
     ):
         self.region_repository = region_repository
         self.subregion_repository = subregion_repository
+        self.region_index = region_boundary_index
+        self.subregion_index = subregion_boundary_index
 
     @staticmethod
     async def _get_validated_id(satellite_id: int) -> Optional[Object_ID]:
@@ -66,10 +82,15 @@ class RegionService:
             return None
 
     async def get_regions(self, pagination: PaginationBase) -> List[RegionInDB]:
-        return await self.region_repository.get_models(pagination)
+        return await self.region_repository.get_projected(pagination)
+
+    async def get_regions_page(
+        self, pagination: CursorPagination
+    ) -> Optional[CursorPage[RegionInDB]]:
+        return await self.region_repository.get_page(pagination)
 
     async def get_subregions(self, pagination: PaginationBase) -> List[SubregionInDB]:
-        return await self.subregion_repository.get_models(pagination)
+        return await self.subregion_repository.get_projected(pagination)
 
     async def create_region(self, region_create: RegionCreate) -> Optional[RegionInDB]:
         region = await self.region_repository.create_entity(region_create)
@@ -97,6 +118,7 @@ class RegionService:
         result = await self.region_repository.delete_model(object_id)
         if result:
             await self.region_repository.session.commit()
+            self.region_index.remove(object_id.id)
         return result
 
     async def delete_subregion(self, subregion_id: int) -> bool:
@@ -106,6 +128,7 @@ class RegionService:
         result = await self.subregion_repository.delete_model(object_id)
         if result:
             await self.region_repository.session.commit()
+            self.subregion_index.remove(object_id.id)
         return result
 
     async def update_region(
@@ -158,3 +181,75 @@ class RegionService:
             if object_id is not None
             else None
         )
+
+    async def set_region_boundary(
+        self, region_id: int, geometry: FootprintGeometry
+    ) -> bool:
+        object_id = await self._get_validated_id(region_id)
+        if object_id is None:
+            return False
+        result = await self.region_repository.set_boundary(object_id, geometry)
+        if result:
+            await self.region_repository.session.commit()
+            self.region_index.set(object_id.id, normalize_polygon(geometry.coordinates))
+        return result
+
+    async def get_region_boundary(self, region_id: int) -> Optional[FootprintGeometry]:
+        object_id = await self._get_validated_id(region_id)
+        return (
+            await self.region_repository.get_boundary(object_id)
+            if object_id is not None
+            else None
+        )
+
+    async def set_subregion_boundary(
+        self, subregion_id: int, geometry: FootprintGeometry
+    ) -> bool:
+        object_id = await self._get_validated_id(subregion_id)
+        if object_id is None:
+            return False
+        result = await self.subregion_repository.set_boundary(object_id, geometry)
+        if result:
+            await self.region_repository.session.commit()
+            self.subregion_index.set(
+                object_id.id, normalize_polygon(geometry.coordinates)
+            )
+        return result
+
+    async def get_subregion_boundary(
+        self, subregion_id: int
+    ) -> Optional[FootprintGeometry]:
+        object_id = await self._get_validated_id(subregion_id)
+        return (
+            await self.subregion_repository.get_boundary(object_id)
+            if object_id is not None
+            else None
+        )
+
+    @staticmethod
+    async def _load_index(
+        index: PolygonIndex[int],
+        repository: Union[RegionRepository, SubregionRepository],
+    ) -> PolygonIndex[int]:
+        if index.is_stale():
+            version = index.version
+            boundaries = await repository.get_boundaries()
+            index.load(
+                (
+                    (object_id, normalize_polygon(geometry["coordinates"]))
+                    for object_id, geometry in boundaries
+                ),
+                version,
+            )
+        return index
+
+    async def find_intersecting(self, rings: Rings) -> Tuple[List[int], List[int]]:
+        """Регионы и подрегионы, граница которых пересекает полигон"""
+        region_index = await self._load_index(self.region_index, self.region_repository)
+        subregion_index = await self._load_index(
+            self.subregion_index, self.subregion_repository
+        )
+        return (
+            region_index.intersecting_polygon(rings),
+            subregion_index.intersecting_polygon(rings),
+        )
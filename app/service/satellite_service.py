@@ -1,5 +1,10 @@
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+import csv
+import io
+import json
+from typing import Optional, List, TYPE_CHECKING, AsyncIterator
+
+import numpy as np
 from pydantic import ValidationError
 
 from app.schemas import (
@@ -10,22 +15,50 @@ from app.schemas import (
     SatelliteCreate,
     SatelliteCharacteristicCreate,
     PaginationBase,
+    CursorPagination,
+    CursorPage,
     SatelliteUpdate,
     SatelliteCharacteristicUpdate,
+    ExportFormat,
+    SatelliteBulkCreate,
+    SatelliteBulkResult,
+    BulkItemStatus,
+    SatelliteCodes,
+    SatelliteCompleteInfoResult,
+    GeoSlot,
+    TerminalLookAngleRequest,
+    TerminalLookAngles,
 )
+from app.core import settings, CacheBackend, InMemoryCacheBackend
+from app.orbit import LongitudeSlotIndex, geostationary_look_angles
 
 if TYPE_CHECKING:
     from app.db import SatelliteRepository, SatelliteCharacteristicRepository
 
+# Полная информация о спутниках по международному коду; сбрасывается
+# при изменении и удалении спутника или его характеристик
+satellite_cache: CacheBackend[SatelliteCompleteInfo] = InMemoryCacheBackend(
+    ttl_seconds=settings.SATELLITE_CACHE_TTL_SECONDS,
+    max_size=settings.SATELLITE_CACHE_MAX_SIZE,
+)
+
+# Точки стояния спутников с известной долготой (GEO), отсортированные по долготе;
+# обновляется при записи характеристик и перечитывается из БД по TTL
+geo_slot_index = LongitudeSlotIndex(ttl_seconds=settings.GEO_SLOT_INDEX_TTL_SECONDS)
+
 
 class SatelliteService:
     def __init__(
         self,
         repository: SatelliteRepository,
         characteristic_repository: SatelliteCharacteristicRepository,
+        cache: CacheBackend[SatelliteCompleteInfo] = satellite_cache,
+        slot_index: LongitudeSlotIndex = geo_slot_index,
     ):
         self.repository = repository
         self.characteristic_repository = characteristic_repository
+        self.cache = cache
+        self.slot_index = slot_index
 
     @staticmethod
     async def _get_validated_code(satellite_id: str) -> Optional[Object_str_ID]:
@@ -45,11 +78,39 @@ class SatelliteService:
         self, satellite_id: str
     ) -> Optional[SatelliteCompleteInfo]:
         international_code = await self._get_validated_code(satellite_id)
-        return (
-            await self.repository.get_complete_info(international_code)
-            if international_code
-            else None
-        )
+        if international_code is None:
+            return None
+        satellite = await self.cache.get(international_code.id)
+        if satellite is None:
+            satellite = await self.repository.get_complete_info(international_code)
+            if satellite is not None:
+                await self.cache.set(international_code.id, satellite)
+        return satellite
+
+    async def get_satellites_complete_info(
+        self, satellite_codes: SatelliteCodes
+    ) -> List[SatelliteCompleteInfoResult]:
+        codes = satellite_codes.international_codes
+        complete_info, missing_codes = dict(), list()
+        for code in dict.fromkeys(codes):
+            satellite = await self.cache.get(code)
+            if satellite is None:
+                missing_codes.append(code)
+            else:
+                complete_info[code] = satellite
+        if missing_codes:
+            loaded = await self.repository.get_complete_info_many(missing_codes)
+            for code, satellite in loaded.items():
+                await self.cache.set(code, satellite)
+            complete_info.update(loaded)
+        return [
+            SatelliteCompleteInfoResult(
+                international_code=code,
+                found=code in complete_info,
+                satellite=complete_info.get(code),
+            )
+            for code in codes
+        ]
 
     async def get_satellite_characteristics(
         self, satellite_id: str
@@ -61,12 +122,17 @@ class SatelliteService:
         )
 
     async def get_satellites(self, pagination: PaginationBase) -> List[SatelliteInDB]:
-        return await self.repository.get_models(pagination)
+        return await self.repository.get_projected(pagination)
+
+    async def get_satellites_page(
+        self, pagination: CursorPagination
+    ) -> Optional[CursorPage[SatelliteInDB]]:
+        return await self.repository.get_page(pagination)
 
     async def get_satellites_characteristics_list(
         self, pagination: PaginationBase
     ) -> List[SatelliteCharacteristicInDB]:
-        return await self.characteristic_repository.get_models(pagination)
+        return await self.characteristic_repository.get_projected(pagination)
 
     async def create_satellite_base(
         self, satellite_data: SatelliteCreate
@@ -84,8 +150,18 @@ class SatelliteService:
         res = await self.repository.create_satellite(satellite_data, characteristic)
         if res:
             await self.repository.session.commit()
+            self.slot_index.set(res.international_code, res.longitude)
         return res
 
+    async def create_satellites_bulk(
+        self, satellites: SatelliteBulkCreate
+    ) -> List[SatelliteBulkResult]:
+        results = await self.repository.create_satellites_bulk(satellites.items)
+        if any(result.status == BulkItemStatus.CREATED for result in results):
+            await self.repository.session.commit()
+            self.slot_index.invalidate()
+        return results
+
     async def create_satellite_characteristic(
         self, satellite_characteristic: SatelliteCharacteristicCreate
     ) -> Optional[SatelliteCharacteristicInDB]:
@@ -94,6 +170,7 @@ class SatelliteService:
         )
         if res:
             await self.characteristic_repository.session.commit()
+            self.slot_index.set(res.international_code, res.longitude)
         return res
 
     async def delete_characteristic(self, satellite_id: str) -> bool:
@@ -101,6 +178,8 @@ class SatelliteService:
         res = await self.characteristic_repository.delete_model(international_code)
         if res:
             await self.characteristic_repository.session.commit()
+            await self.cache.delete(international_code.id)
+            self.slot_index.remove(international_code.id)
         return res
 
     async def delete_satellite(self, satellite_id: str) -> bool:
@@ -108,6 +187,8 @@ class SatelliteService:
         res = await self.repository.delete_model(international_code)
         if res:
             await self.repository.session.commit()
+            await self.cache.delete(international_code.id)
+            self.slot_index.remove(international_code.id)
         return res
 
     async def update_satellite(
@@ -119,6 +200,9 @@ class SatelliteService:
         )
         if res:
             await self.repository.session.commit()
+            await self.cache.delete(international_code.id, res.international_code)
+            if res.international_code != international_code.id:
+                self.slot_index.invalidate()
         return res
 
     async def update_satellite_characteristic(
@@ -132,4 +216,92 @@ class SatelliteService:
         )
         if res:
             await self.characteristic_repository.session.commit()
+            await self.cache.delete(international_code.id)
+            self.slot_index.set(international_code.id, res.longitude)
         return res
+
+    async def _get_slot_index(self) -> LongitudeSlotIndex:
+        if self.slot_index.is_stale():
+            version = self.slot_index.version
+            slots = await self.characteristic_repository.get_longitude_slots()
+            self.slot_index.load(slots, version)
+        return self.slot_index
+
+    async def get_satellites_in_longitude_range(
+        self, west: float, east: float
+    ) -> List[GeoSlot]:
+        """GEO-спутники между долготами west и east; west > east - через антимеридиан"""
+        slot_index = await self._get_slot_index()
+        return [
+            GeoSlot(international_code=code, longitude=longitude)
+            for code, longitude in slot_index.range(west, east)
+        ]
+
+    async def get_nearest_satellites(
+        self, longitude: float, limit: int
+    ) -> List[GeoSlot]:
+        slot_index = await self._get_slot_index()
+        return [
+            GeoSlot(international_code=code, longitude=slot, distance=distance)
+            for code, slot, distance in slot_index.nearest(longitude, limit)
+        ]
+
+    async def get_terminal_look_angles(
+        self, request: TerminalLookAngleRequest
+    ) -> TerminalLookAngles:
+        """
+        Азимут, угол места и дальность от каждого терминала до каждого
+        GEO-спутника; долготы стояния берутся из индекса точек стояния
+        """
+        slot_index = await self._get_slot_index()
+        codes, longitudes, not_found = list(), list(), list()
+        for code in dict.fromkeys(request.international_codes):
+            longitude = slot_index.get(code)
+            if longitude is None:
+                not_found.append(code)
+            else:
+                codes.append(code)
+                longitudes.append(longitude)
+        altitudes_km = (
+            np.asarray(request.altitudes_m) / 1000
+            if request.altitudes_m is not None
+            else 0.0
+        )
+        angles = geostationary_look_angles(
+            np.asarray(request.latitudes),
+            np.asarray(request.longitudes),
+            altitudes_km,
+            np.asarray(longitudes, dtype=float),
+        )
+        return TerminalLookAngles(
+            international_codes=codes,
+            satellite_longitudes=longitudes,
+            azimuth=angles.azimuth.round(3).tolist(),
+            elevation=angles.elevation.round(3).tolist(),
+            range_km=angles.range_km.round(3).tolist(),
+            not_found=not_found,
+        )
+
+    async def export_catalog(self, export_format: ExportFormat) -> AsyncIterator[str]:
+        """Экспорт всего каталога в NDJSON или CSV кусками по пачке строк"""
+        header_written = False
+        async for rows in self.repository.stream_catalog(settings.EXPORT_BATCH_SIZE):
+            records = [
+                {**row, "coverage_zone_ids": row["coverage_zone_ids"] or []}
+                for row in rows
+            ]
+            if export_format == ExportFormat.NDJSON:
+                yield "".join(
+                    json.dumps(record, default=str, ensure_ascii=False) + "\n"
+                    for record in records
+                )
+                continue
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if not header_written:
+                writer.writerow(records[0].keys())
+                header_written = True
+            for record in records:
+                record["coverage_zone_ids"] = ";".join(record["coverage_zone_ids"])
+                writer.writerow(record.values())
+            yield buffer.getvalue()
@@ -1,7 +1,14 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 from passlib.context import CryptContext
+from app.core import settings
+from app.schemas import HashingPoolStats
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+R = TypeVar("R")
+
 
 def get_hash(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +16,70 @@ def get_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Выполняет bcrypt в ограниченном пуле потоков, чтобы хеширование
+    не блокировало цикл событий (bcrypt отпускает GIL на время вычисления).
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Количество задач, ожидающих свободного потока"""
+        return max(0, self._in_flight - self.max_workers)
+
+    async def _run(self, func: Callable[..., R], *args) -> R:
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def get_hash(self, password: str) -> str:
+        return await self._run(get_hash, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def get_stats(self) -> HashingPoolStats:
+        return HashingPoolStats(
+            max_workers=self.max_workers,
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            max_queue_depth=self._max_queue_depth,
+            completed=self._completed,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(max_workers=settings.PASSWORD_HASH_WORKERS)
+
+
+async def get_hash_async(password: str) -> str:
+    return await password_hasher.get_hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify_password(plain_password, hashed_password)
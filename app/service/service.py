@@ -5,6 +5,9 @@ from app.service import RegionService
 from app.service import CoverageZoneService
 from app.service import UserService
 from app.service import TokenService
+from app.service import OrbitService, ScreeningJob
+from app.core import async_session_maker
+from app.schemas import ConjunctionScreeningRequest, ConjunctionScreeningReport
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import (
     SatelliteRepository,
@@ -14,6 +17,8 @@ from app.db import (
     CoverageZoneRepository,
     UserRepository,
     TokenRepository,
+    OrbitalElementsRepository,
+    ConjunctionRepository,
 )
 
 
@@ -48,3 +53,25 @@ def create_token_service(session: AsyncSession) -> TokenService:
     repo = TokenRepository(session)
     user_repo = UserRepository(session)
     return TokenService(repository=repo, user_repository=user_repo)
+
+
+def create_orbit_service(session: AsyncSession) -> OrbitService:
+    repo = OrbitalElementsRepository(session)
+    satellite_repo = SatelliteRepository(session)
+    conjunction_repo = ConjunctionRepository(session)
+    return OrbitService(
+        repository=repo,
+        satellite_repository=satellite_repo,
+        conjunction_repository=conjunction_repo,
+    )
+
+
+async def screen_conjunctions(
+    request: ConjunctionScreeningRequest,
+) -> ConjunctionScreeningReport:
+    """Скрининг в собственной сессии: запрос, запустивший его, уже завершен"""
+    async with async_session_maker() as session:
+        return await create_orbit_service(session).screen_conjunctions(request)
+
+
+screening_job = ScreeningJob(screen_conjunctions)
@@ -11,7 +11,7 @@ from app.schemas import (
     RefreshTokenInDB,
     UserRole,
 )
-from app.service import get_hash, verify_password
+from app.service import get_hash_async, verify_password_async
 from app.core import (
     settings,
     InvalidRefreshToken,
@@ -79,7 +79,7 @@ class TokenService:
                 user_id=user_id.id,
                 device_info=data_dict.get("device_info"),
                 ip_address=data_dict.get("ip_address"),
-                token_hash=get_hash(refresh_token),
+                token_hash=await get_hash_async(refresh_token),
                 expires_at=expire,
                 jti=jti,
             )
@@ -123,33 +123,43 @@ class TokenService:
         except jwt.PyJWTError:
             raise InvalidAccessToken()
 
-    async def _decode_refresh_token(self, token: str) -> tuple[Object_ID, UserRole]:
+    async def decode_access_token_claims(
+        self, token: str
+    ) -> tuple[Object_ID, UserRole]:
         try:
-            decode_data = await self._decode_token(
-                token=token, secret_key=settings.REFRESH_TOKEN_SECRET_KEY
+            payload = await self._decode_token(
+                token=token, secret_key=settings.ACCESS_TOKEN_SECRET_KEY
             )
-            return Object_ID(id=decode_data.get("sub")), UserRole(
-                decode_data.get("role")
+            return Object_ID(id=int(payload.get("sub"))), UserRole(payload.get("role"))
+        except jwt.ExpiredSignatureError:
+            raise AccessTokenExpiredError()
+        except (jwt.PyJWTError, TypeError, ValueError):
+            raise InvalidAccessToken()
+
+    async def _decode_refresh_payload(self, token: str) -> Dict:
+        try:
+            return await self._decode_token(
+                token=token, secret_key=settings.REFRESH_TOKEN_SECRET_KEY
             )
         except jwt.ExpiredSignatureError:
             raise RefreshTokenExpiredError()
         except jwt.PyJWTError:
             raise InvalidRefreshToken()
 
-    @staticmethod
-    async def _get_token(
-        refresh_tokens: List[RefreshTokenInDB], token: str
-    ) -> Optional[RefreshTokenInDB]:
-        for refresh_token in refresh_tokens:
-            if verify_password(token, refresh_token.token_hash):
-                payload = jwt.decode(
-                    token,
-                    settings.REFRESH_TOKEN_SECRET_KEY,
-                    algorithms=[settings.ALGORITHM],
-                )
-                if payload.get("jti") == refresh_token.jti:
-                    return refresh_token
-        return None
+    async def _get_token(self, token: str, payload: Dict) -> Optional[RefreshTokenInDB]:
+        """
+        Поиск refresh-токена по jti из уже проверенного payload:
+        один запрос по уникальному индексу и одна проверка bcrypt-хеша.
+        """
+        jti = payload.get("jti")
+        if jti is None:
+            return None
+        refresh_token = await self.repository.get_refresh_token_by_jti(jti)
+        if refresh_token is None or str(refresh_token.user_id) != payload.get("sub"):
+            return None
+        if not await verify_password_async(token, refresh_token.token_hash):
+            return None
+        return refresh_token
 
     async def get_refresh_tokens_by_user_id(
         self, user_id: Object_ID
@@ -159,20 +169,17 @@ class TokenService:
     async def decode_and_verify_refresh_token(
         self, token: str
     ) -> tuple[Object_ID, UserRole]:
-        object_id, role = await self._decode_refresh_token(token)
-        refresh_tokens = await self.get_refresh_tokens_by_user_id(object_id)
-        if await self._get_token(refresh_tokens, token) is None:
+        payload = await self._decode_refresh_payload(token)
+        if await self._get_token(token, payload) is None:
             raise RefreshTokenNotFoundError()
-        return object_id, role
+        return Object_ID(id=payload.get("sub")), UserRole(payload.get("role"))
 
     async def delete_refresh_token(self, token: str) -> bool:
         try:
-            object_id, role = await self._decode_refresh_token(token)
+            payload = await self._decode_refresh_payload(token)
         except InvalidRefreshToken:
             return False
-        refresh_token_db = await self._get_token(
-            await self.repository.get_refresh_tokens_by_user_id(object_id), token
-        )
+        refresh_token_db = await self._get_token(token, payload)
         if refresh_token_db is None:
             return False
         res = await self.repository.delete_refresh_token(
@@ -13,6 +13,7 @@ from app.schemas import (
     PaginationBase,
     UserPassword,
     UserPasswordHash,
+    UserAuthStatus,
 )
 from pydantic import ValidationError, EmailStr
 from app.core import (
@@ -21,12 +22,21 @@ from app.core import (
     EmailNotFoundError,
     NewPasswordMatchesOldError,
     AccessDeniedError,
+    TTLCache,
+    settings,
 )
-from app.service import get_hash, verify_password
+from app.service import get_hash_async, verify_password_async
 
 if TYPE_CHECKING:
     from app.db import UserRepository
 
+# Статусы пользователей для авторизации по claims; сбрасываются при изменении
+# и удалении пользователя в этом процессе, в остальных - по истечении TTL.
+user_status_cache: TTLCache[int, UserAuthStatus] = TTLCache(
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+)
+
 
 class UserService:
     def __init__(
@@ -57,8 +67,6 @@ class UserService:
         self, user_create: UserCreate, admin_password: Optional[AdminPassword]
     ) -> Optional[UserInDB]:
         if user_create.role == UserRole.ADMIN:
-            from app.core import settings
-
             if (
                 admin_password is None
                 or settings.ADMIN_SECRET_KEY != admin_password.password
@@ -67,7 +75,7 @@ class UserService:
         user_create_db = UserCreateInDB(
             name=user_create.name,
             email=user_create.email,
-            hashed_password=get_hash(user_create.password),
+            hashed_password=await get_hash_async(user_create.password),
             role=user_create.role,
         )
         user = await self.repository.create_entity(user_create_db)
@@ -83,17 +91,27 @@ class UserService:
         )
         if password_hash_db is None:
             raise EmailNotFoundError(email=str(auth_request.email))
-        if not verify_password(auth_request.password, password_hash_db):
+        if not await verify_password_async(auth_request.password, password_hash_db):
             raise InvalidPasswordError()
         user = await self.get_user_by_email(auth_request.email)
         return Object_ID(id=user.id), UserRole(user.role)
 
+    async def get_user_auth_status(self, user_id: Object_ID) -> UserAuthStatus:
+        user_status = user_status_cache.get(user_id.id)
+        if user_status is None:
+            role = await self.repository.get_role_by_id(user_id)
+            user_status = UserAuthStatus(exists=role is not None, role=role)
+            user_status_cache.set(user_id.id, user_status)
+        return user_status
+
     async def delete_user(self, email_user: EmailStr) -> bool:
         try:
             email = UserEmail(email=email_user)
+            user_id = await self.repository.get_id_by_email(email)
             res = await self.repository.delete_model_by_email(email)
             if res:
                 await self.repository.session.commit()
+                user_status_cache.invalidate(user_id)
             return res
         except ValidationError:
             return False
@@ -121,6 +139,7 @@ class UserService:
         )
         if res:
             await self.repository.session.commit()
+            user_status_cache.invalidate(user_id.id)
         return res
 
     async def update_password(
@@ -133,7 +152,7 @@ class UserService:
         if user_id is None:
             return False
         user_password_hash = UserPasswordHash(
-            hashed_password=get_hash(new_password.password)
+            hashed_password=await get_hash_async(new_password.password)
         )
         res = await self.repository.update_model(
             object_id=user_id, object_update=user_password_hash
@@ -144,4 +163,4 @@ class UserService:
         return res is not None
 
     async def get_users(self, pagination: PaginationBase) -> List[UserInDB]:
-        return await self.repository.get_models(pagination)
+        return await self.repository.get_projected(pagination)
@@ -0,0 +1,65 @@
+"""
+Время расчета углов наведения терминалов на GEO-спутники, включая разбор
+запроса и сериализацию ответа в JSON (целевое значение для 10k терминалов - 100 мс).
+
+Запуск (БД не нужна): python -m benchmarks.bench_look_angles
+"""
+
+import asyncio
+import json
+import random
+from time import perf_counter
+
+from app.orbit import LongitudeSlotIndex
+from app.schemas import TerminalLookAngleRequest
+from app.service import SatelliteService
+
+TERMINAL_COUNTS = [1000, 10000, 20000]
+SATELLITE_COUNTS = [1, 5, 20]
+REPEATS = 5
+
+
+def make_service(satellites: int) -> SatelliteService:
+    slot_index = LongitudeSlotIndex(ttl_seconds=float("inf"))
+    slots = [(f"GEO-{i}", -170.0 + 340.0 * i / satellites) for i in range(satellites)]
+    slot_index.load(slots, slot_index.version)
+    return SatelliteService(None, None, slot_index=slot_index)
+
+
+def make_body(terminals: int, satellites: int) -> str:
+    generator = random.Random(42)
+    return json.dumps(
+        {
+            "latitudes": [generator.uniform(-70, 70) for _ in range(terminals)],
+            "longitudes": [generator.uniform(-180, 180) for _ in range(terminals)],
+            "international_codes": [f"GEO-{i}" for i in range(satellites)],
+        }
+    )
+
+
+async def handle(service: SatelliteService, body: str) -> bytes:
+    request = TerminalLookAngleRequest.model_validate_json(body)
+    look_angles = await service.get_terminal_look_angles(request)
+    return look_angles.model_dump_json().encode()
+
+
+async def best_time(service: SatelliteService, body: str) -> float:
+    timings = list()
+    for _ in range(REPEATS):
+        start = perf_counter()
+        await handle(service, body)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+async def main():
+    print(f"{'terminals':>10} {'satellites':>10} {'time, ms':>10}")
+    for satellites in SATELLITE_COUNTS:
+        service = make_service(satellites)
+        for terminals in TERMINAL_COUNTS:
+            elapsed = await best_time(service, make_body(terminals, satellites))
+            print(f"{terminals:>10} {satellites:>10} {elapsed * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
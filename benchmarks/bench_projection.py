@@ -0,0 +1,88 @@
+"""
+Скорость чтения списка спутников (строк/с): ORM-сущности с копированием
+в модели (get_models) против выборки только колонок схемы (get_projected).
+
+Запуск (нужна тестовая БД из .env): python -m benchmarks.bench_projection
+"""
+
+import asyncio
+from datetime import date
+from time import perf_counter
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core import settings
+from app.db import Base, Country, Satellite, SatelliteRepository
+from app.schemas import PaginationBase
+
+ROW_COUNTS = [100, 1000, 10000]
+REPEATS = 5
+BENCH_COUNTRY_ID = 9000
+BENCH_PREFIX = "BENCH_PROJ_"
+
+
+async def rows_per_second(read, pagination: PaginationBase) -> float:
+    start = perf_counter()
+    for _ in range(REPEATS):
+        await read(pagination)
+    return pagination.limit * REPEATS / (perf_counter() - start)
+
+
+async def main():
+    engine = create_async_engine(settings.get_test_db_url())
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await session.execute(
+            insert(Country).values(
+                id=BENCH_COUNTRY_ID, abbreviation="BNCH", full_name="Benchmark"
+            )
+        )
+        await session.execute(
+            insert(Satellite),
+            [
+                dict(
+                    international_code=f"{BENCH_PREFIX}{number}",
+                    name_satellite=f"Bench projection {number}",
+                    norad_id=800000 + number,
+                    launch_date=date(2020, 1, 1),
+                    country_id=BENCH_COUNTRY_ID,
+                )
+                for number in range(max(ROW_COUNTS))
+            ],
+        )
+        await session.commit()
+        try:
+            repo = SatelliteRepository(session)
+            print(
+                f"{'rows':>6} | {'get_models':>12} | {'projected':>12} | {'as_dict':>12}"
+            )
+            for rows in ROW_COUNTS:
+                # Ограничение limit <= 100 относится к API, здесь оно не нужно
+                pagination = PaginationBase.model_construct(limit=rows, offset=0)
+                results = list()
+                for read in (
+                    repo.get_models,
+                    repo.get_projected,
+                    lambda page: repo.get_projected(page, as_dict=True),
+                ):
+                    results.append(await rows_per_second(read, pagination))
+                    session.expunge_all()
+                print(
+                    f"{rows:>6} | "
+                    + " | ".join(f"{result:>12,.0f}" for result in results)
+                )
+        finally:
+            await session.rollback()
+            await session.execute(
+                delete(Satellite).where(Satellite.country_id == BENCH_COUNTRY_ID)
+            )
+            await session.execute(delete(Country).where(Country.id == BENCH_COUNTRY_ID))
+            await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
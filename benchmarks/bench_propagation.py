@@ -0,0 +1,63 @@
+"""
+Время расчета положений каталога: поштучный цикл SGP4 против пакетного SatrecArray.
+
+Запуск (БД не нужна): python -m benchmarks.bench_propagation
+"""
+
+from datetime import datetime, timezone
+from time import perf_counter
+
+import numpy as np
+
+from app.orbit import (
+    elements_from_tle,
+    satrec_from_elements,
+    to_datetime64,
+    julian_dates,
+    propagate,
+)
+
+CATALOG_SIZES = [100, 1000, 10000]
+REPEATS = 5
+TLE = (
+    "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927",
+    "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537",
+)
+
+
+def make_catalog(size: int):
+    _, elements = elements_from_tle(*TLE)
+    satrecs = list()
+    for i in range(size):
+        elements = elements.model_copy(
+            update={"mean_anomaly": 360.0 * i / size, "ra_of_asc_node": i % 360}
+        )
+        satrecs.append(satrec_from_elements(elements))
+    return satrecs
+
+
+def best_time(func) -> float:
+    timings = list()
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    moments = np.array([to_datetime64(datetime.now(timezone.utc))])
+    jd, fr = julian_dates(moments)
+    print(f"{'satellites':>10} {'loop, ms':>10} {'batch, ms':>10} {'speedup':>8}")
+    for size in CATALOG_SIZES:
+        satrecs = make_catalog(size)
+        loop = best_time(lambda: [satrec.sgp4(jd[0], fr[0]) for satrec in satrecs])
+        batch = best_time(lambda: propagate(satrecs, moments))
+        print(
+            f"{size:>10} {loop * 1000:>10.2f} {batch * 1000:>10.2f} "
+            f"{loop / batch:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
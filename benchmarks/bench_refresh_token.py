@@ -0,0 +1,77 @@
+"""
+Время проверки refresh-токена в зависимости от количества токенов пользователя.
+
+Запуск (нужна тестовая БД из .env): python -m benchmarks.bench_refresh_token
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core import settings
+from app.db import Base
+from app.schemas import UserCreate, UserRole, Object_ID, CreateRefreshToken
+from app.service import create_user_service, create_token_service, get_hash_async
+
+TOKENS_PER_USER = [1, 10, 100, 1000]
+REPEATS = 20
+BENCH_EMAIL = "bench_refresh_token@example.com"
+
+
+async def add_filler_tokens(token_service, user_id: Object_ID, count: int, token_hash):
+    expire = datetime.now(timezone.utc) + timedelta(days=1)
+    for _ in range(count):
+        await token_service.repository.create(
+            **CreateRefreshToken(
+                user_id=user_id.id,
+                token_hash=token_hash,
+                expires_at=expire,
+                jti=str(uuid4()),
+            ).model_dump()
+        )
+
+
+async def main():
+    engine = create_async_engine(settings.get_test_db_url())
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    filler_hash = await get_hash_async(str(uuid4()))
+    async with session_maker() as session:
+        user_service = create_user_service(session)
+        token_service = create_token_service(session)
+        user = await user_service.create_user(
+            UserCreate(name="Bench", email=BENCH_EMAIL, password="Bench_12345"),
+            admin_password=None,
+        )
+        user_id = Object_ID(id=user.id)
+        try:
+            total_tokens = 0
+            print(f"{'tokens per user':>16} | {'refresh verify, ms':>18}")
+            for tokens_per_user in TOKENS_PER_USER:
+                await add_filler_tokens(
+                    token_service, user_id, tokens_per_user - total_tokens, filler_hash
+                )
+                total_tokens = tokens_per_user
+                refresh_token = (
+                    await token_service.create_refresh_token(
+                        {}, user_id, UserRole.USER.value
+                    )
+                ).refresh_token
+                total_tokens += 1
+                await session.commit()
+                start = perf_counter()
+                for _ in range(REPEATS):
+                    await token_service.decode_and_verify_refresh_token(refresh_token)
+                elapsed_ms = (perf_counter() - start) * 1000 / REPEATS
+                print(f"{tokens_per_user:>16} | {elapsed_ms:>18.2f}")
+        finally:
+            await user_service.delete_user(BENCH_EMAIL)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
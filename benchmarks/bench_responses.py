@@ -0,0 +1,76 @@
+"""
+Время ответа со списком зон покрытия: стандартный путь FastAPI (повторная
+валидация по response_model и jsonable_encoder) против validated_response.
+
+Запуск (БД не нужна): python -m benchmarks.bench_responses
+"""
+
+import asyncio
+from time import perf_counter
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.helpers import ORJSONResponse, validated_response
+from app.schemas import CoverageZoneInDB
+
+ITEM_COUNTS = [1000, 10000, 100000]
+REPEATS = 5
+
+
+def make_zones(count: int) -> List[CoverageZoneInDB]:
+    return [
+        CoverageZoneInDB(
+            id=f"BENCH-ZONE-{number}",
+            transmitter_type="Ku-band",
+            satellite_code="BENCH_SATELLITE",
+            image_data=f"coverage_zones/BENCH-ZONE-{number}.jpg",
+        )
+        for number in range(count)
+    ]
+
+
+def make_app(zones: List[CoverageZoneInDB]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[CoverageZoneInDB])
+    async def default() -> List[CoverageZoneInDB]:
+        return zones
+
+    @app.get("/validated", response_model=List[CoverageZoneInDB])
+    async def validated() -> ORJSONResponse:
+        return validated_response(zones)
+
+    return app
+
+
+async def elapsed_ms(client: httpx.AsyncClient, url: str) -> float:
+    start = perf_counter()
+    for _ in range(REPEATS):
+        response = await client.get(url)
+        response.raise_for_status()
+    return (perf_counter() - start) * 1000 / REPEATS
+
+
+async def main():
+    print(
+        f"{'items':>7} | {'default, ms':>12} | {'validated, ms':>14} | {'speedup':>7}"
+    )
+    for count in ITEM_COUNTS:
+        transport = httpx.ASGITransport(app=make_app(make_zones(count)))
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            default_response = await client.get("/default")
+            assert default_response.json() == (await client.get("/validated")).json()
+            default = await elapsed_ms(client, "/default")
+            validated = await elapsed_ms(client, "/validated")
+        print(
+            f"{count:>7} | {default:>12.1f} | {validated:>14.1f} | "
+            f"{default / validated:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,9 @@
+import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core import settings
+from app.core.database import async_engine
 from app.db import Base
 from httpx import ASGITransport, AsyncClient
 from app.main import app
@@ -37,6 +40,19 @@ async def db_session(engine):
         await session.rollback()
 
 
+@pytest.fixture
+def sql_statements():
+    """SQL-запросы, выполненные движком приложения за время теста"""
+    statements = list()
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest_asyncio.fixture
 async def async_client():
     async with AsyncClient(
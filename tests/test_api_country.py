@@ -120,6 +120,29 @@ class TestCountryAPI:
         )
         assert response.status_code == 409
 
+    @pytest.mark.asyncio
+    async def test_get_countries_page(self):
+        response = await self.client.get("/country/list/page/", params={"limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is not None
+        response = await self.client.get(
+            "/country/list/page/", params={"limit": 2, "cursor": page["next_cursor"]}
+        )
+        assert response.status_code == 200
+        last_page = response.json()
+        assert len(last_page["items"]) == 1
+        assert last_page["next_cursor"] is None
+        country_ids = [country["id"] for country in page["items"] + last_page["items"]]
+        assert country_ids == sorted(country_ids)
+
+        response = await self.client.get(
+            "/country/list/page/", params={"cursor": "invalid"}
+        )
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid cursor"}
+
     @pytest.mark.asyncio
     async def test_delete_country(self):
         create_response = await self.client.get("/country/list/")
@@ -9,9 +9,16 @@ from tests.test_data import (
     region_list,
     subregion_list,
     headers_auth,
+    footprint_test_data,
+    satellite_characteristic_test_date,
 )
 from tests.test_service_coverage_zone import get_data_image
 from app.s3_service import S3Service
+from app.service import (
+    coverage_index,
+    region_boundary_index,
+    subregion_boundary_index,
+)
 
 
 @pytest.mark.asyncio
@@ -675,6 +682,170 @@ class TestCoverageZoneAPI:
         assert s3_data is not None
         assert s3_data == local_data
 
+    @pytest.mark.asyncio
+    async def test_footprint(self):
+        coverage_index.invalidate()
+        zone_ids = [zone.get("id") for zone in test_create_data]
+        for zone_id, footprint in zip(zone_ids, footprint_test_data):
+            url = "/coverage_zone/footprint/" + zone_id
+            response = await self.client.put(url, json=footprint)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            response = await self.client.put(url, json=footprint, headers=headers_auth)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            response = await self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == footprint
+
+        response = await self.client.put(
+            "/coverage_zone/footprint/UNKNOWN_ZONE",
+            json=footprint_test_data[0],
+            headers=headers_auth,
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = await self.client.put(
+            "/coverage_zone/footprint/" + zone_ids[0],
+            json={"coordinates": [[[0, 100], [1, 0], [0, 1], [0, 100]]]},
+            headers=headers_auth,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = await self.client.get(
+            "/coverage_zone/coverage/point/",
+            params={"latitude": 55.75, "longitude": 37.62},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        (zone,) = response.json()
+        assert zone.get("id") == zone_ids[0]
+        assert zone.get("transmitter_type") and zone.get("satellite_code")
+        response = await self.client.get(
+            "/coverage_zone/coverage/point/",
+            params={"latitude": 0, "longitude": 179.9},
+        )
+        assert [zone.get("id") for zone in response.json()] == [zone_ids[1]]
+
+        bbox = {"west": 100, "south": -30, "east": -100, "north": 30}
+        response = await self.client.get("/coverage_zone/coverage/bbox/", params=bbox)
+        assert response.status_code == status.HTTP_200_OK
+        assert [zone.get("id") for zone in response.json()] == [zone_ids[1]]
+        bbox = {"west": -180, "south": -90, "east": 180, "north": 90}
+        response = await self.client.get("/coverage_zone/coverage/bbox/", params=bbox)
+        assert [zone.get("id") for zone in response.json()] == sorted(zone_ids)
+        bbox = {"west": 0, "south": 10, "east": 10, "north": 0}
+        response = await self.client.get("/coverage_zone/coverage/bbox/", params=bbox)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        url = "/coverage_zone/footprint/" + zone_ids[1]
+        response = await self.client.delete(url, headers=headers_auth)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = await self.client.delete(url, headers=headers_auth)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = await self.client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = await self.client.get(
+            "/coverage_zone/coverage/point/",
+            params={"latitude": 0, "longitude": 179.9},
+        )
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_theoretical_footprint(self):
+        satellite_code = satellite_test_date[0].get("international_code")
+        zone_id = test_create_data[0].get("id")
+        url = "/coverage_zone/footprint/theoretical/" + satellite_code
+        response = await self.client.post(url, json={})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = await self.client.post(
+            "/satellite/characteristic",
+            json=satellite_characteristic_test_date[0],
+            headers=headers_auth,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        beam = {
+            "boresight_latitude": 30,
+            "boresight_longitude": 110,
+            "beamwidth": 2,
+            "peak_eirp_dbw": 52,
+            "eirp_levels_dbw": [49, 44],
+        }
+        response = await self.client.post(url, json={"min_elevation": 10, "beam": beam})
+        assert response.status_code == status.HTTP_200_OK
+        footprint = response.json()
+        assert footprint["longitude"] == satellite_characteristic_test_date[0].get(
+            "longitude"
+        )
+        assert footprint["min_elevation"] == 10
+        assert [contour["eirp_dbw"] for contour in footprint["eirp_contours"]] == [
+            49,
+            44,
+        ]
+
+        response = await self.client.post(
+            url, json={"beam": {**beam, "eirp_levels_dbw": [20]}}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        response = await self.client.post(
+            url, json={"beam": {**beam, "boresight_longitude": -60}}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        generate_url = "/coverage_zone/footprint/" + zone_id + "/generate/"
+        response = await self.client.post(generate_url, json={"beam": beam})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = await self.client.post(
+            generate_url, json={"beam": beam}, headers=headers_auth
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = await self.client.post(
+            "/coverage_zone/footprint/UNKNOWN_ZONE/generate/",
+            json={},
+            headers=headers_auth,
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = await self.client.get(
+            "/coverage_zone/coverage/point/",
+            params={"latitude": 30, "longitude": 110},
+        )
+        assert [zone.get("id") for zone in response.json()] == [zone_id]
+
+    @pytest.mark.asyncio
+    async def test_assign_regions_by_footprint(self):
+        region_boundary_index.invalidate()
+        subregion_boundary_index.invalidate()
+        zone_id = test_create_data[0].get("id")
+        region_id = (await self.client.get("/region/name/region_1")).json().get("id")
+        # Контур зоны - изолиния луча вокруг точки 110 в.д., 30 с.ш.
+        boundary = {
+            "type": "Polygon",
+            "coordinates": [[[100, 20], [120, 20], [120, 45], [100, 45], [100, 20]]],
+        }
+        response = await self.client.put(
+            f"/region/{region_id}/boundary", json=boundary, headers=headers_auth
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        url = "/coverage_zone/regions/" + zone_id + "/auto/"
+        response = await self.client.post(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        for regions_added in (None, 0):
+            response = await self.client.post(url, headers=headers_auth)
+            assert response.status_code == status.HTTP_200_OK
+            assignment = response.json()
+            assert assignment["region_ids"] == [region_id]
+            assert assignment["subregion_ids"] == []
+            assert assignment["subregions_added"] == 0
+            if regions_added is not None:
+                assert assignment["regions_added"] == regions_added
+        response = await self.client.get("/coverage_zone/regions/" + zone_id)
+        assert region_id in [region.get("id") for region in response.json()]
+
+        for unknown_zone in ("UNKNOWN_ZONE", test_create_data[1].get("id")):
+            response = await self.client.post(
+                "/coverage_zone/regions/" + unknown_zone + "/auto/",
+                headers=headers_auth,
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
     @pytest.mark.asyncio
     async def test_delete_coverage_zone(self):
         response = await self.client.get(
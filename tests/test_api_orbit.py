@@ -0,0 +1,156 @@
+from pathlib import Path
+
+import pytest
+from tests.test_data import headers_auth, tle_test_data
+from app.service import screening_job
+
+ELEMENT_SETS_DIR = Path(__file__).parent / "test" / "element_sets"
+
+
+@pytest.mark.usefixtures("async_client")
+class TestOrbitAPI:
+    @pytest.fixture(autouse=True)
+    def _setup_client(self, async_client):
+        self.client = async_client
+
+    @pytest.mark.asyncio
+    async def test_get_positions(self):
+        response = await self.client.get(
+            "/orbit/positions/", params={"epoch": "2024-03-01T12:00:00"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["frame"] == "TEME"
+        assert data["epoch"].startswith("2024-03-01T12:00:00")
+        assert isinstance(data["items"], list)
+
+    @pytest.mark.asyncio
+    async def test_elements_not_found(self):
+        response = await self.client.get("/orbit/UNKNOWN/elements")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Orbital elements not found"
+
+    @pytest.mark.asyncio
+    async def test_set_tle_invalid(self):
+        line1, line2 = tle_test_data[0]
+        response = await self.client.put(
+            "/orbit/UNKNOWN/tle", json={"line1": line1, "line2": line2}
+        )
+        assert response.status_code == 401
+        response = await self.client.put(
+            "/orbit/UNKNOWN/tle",
+            json={"line1": line1, "line2": line2},
+            headers=headers_auth,
+        )
+        assert response.status_code == 404
+        response = await self.client.put(
+            "/orbit/UNKNOWN/tle",
+            json={"line1": line1[:-1], "line2": line2},
+            headers=headers_auth,
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_ingest_element_sets(self):
+        content = (ELEMENT_SETS_DIR / "elements.csv").read_bytes()
+        files = {"file": ("elements.csv", content, "text/csv")}
+        response = await self.client.post(
+            "/orbit/ingest/", params={"format": "omm_csv"}, files=files
+        )
+        assert response.status_code == 401
+        response = await self.client.post(
+            "/orbit/ingest/",
+            params={"format": "omm_csv"},
+            files=files,
+            headers=headers_auth,
+        )
+        assert response.status_code == 200
+        report = response.json()
+        assert report["format"] == "omm_csv"
+        assert report["received"] == 3
+        assert report["invalid"] == 1
+        assert report["unmatched"] + report["skipped"] + report["upserted"] == 3
+
+        response = await self.client.post(
+            "/orbit/ingest/",
+            params={"format": "omm_json"},
+            files={"file": ("elements.json", b'[{"NORAD_CAT_ID"', "text/plain")},
+            headers=headers_auth,
+        )
+        assert response.status_code == 422
+        response = await self.client.post(
+            "/orbit/ingest/",
+            params={"format": "kvn"},
+            files=files,
+            headers=headers_auth,
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_predict_passes(self):
+        station = {"latitude": 55.75, "longitude": 37.62}
+        response = await self.client.post(
+            "/orbit/passes/",
+            json={"station": station, "international_codes": ["UNKNOWN"]},
+        )
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "international_code": "UNKNOWN",
+                "visible": False,
+                "geostationary": False,
+                "look_angle": None,
+                "passes": [],
+                "error": "Orbital elements not found",
+            }
+        ]
+        response = await self.client.post(
+            "/orbit/passes/",
+            json={"station": {"latitude": 91, "longitude": 0}},
+        )
+        assert response.status_code == 422
+        response = await self.client.post(
+            "/orbit/passes/",
+            json={"station": station, "duration_hours": 200},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_conjunctions(self):
+        response = await self.client.post(
+            "/orbit/conjunctions/screen/", json={"days": 0.01}
+        )
+        assert response.status_code == 401
+        response = await self.client.post(
+            "/orbit/conjunctions/screen/",
+            json={"days": 0.01, "threshold_km": 1000},
+            headers=headers_auth,
+        )
+        assert response.status_code == 422
+        response = await self.client.post(
+            "/orbit/conjunctions/screen/",
+            json={"days": 0.01},
+            headers=headers_auth,
+        )
+        assert response.status_code == 202
+        assert response.json()["running"]
+        response = await self.client.post(
+            "/orbit/conjunctions/screen/",
+            json={"days": 0.01},
+            headers=headers_auth,
+        )
+        assert response.status_code == 409
+        await screening_job.wait()
+        response = await self.client.get("/orbit/conjunctions/screen/")
+        assert response.status_code == 200
+        screening = response.json()
+        assert not screening["running"] and screening["error"] is None
+        report = screening["report"]
+        assert report["screened"] <= report["satellites"]
+        assert report["conjunctions"] >= 0
+
+        response = await self.client.get("/orbit/UNKNOWN/conjunctions")
+        assert response.status_code == 200
+        assert response.json() == []
+        response = await self.client.get("/orbit/B/conjunctions")
+        assert response.status_code == 404
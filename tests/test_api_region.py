@@ -234,6 +234,32 @@ class TestRegionAPI:
         )
         assert update_response.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.asyncio
+    async def test_boundary(self):
+        boundary = {
+            "type": "Polygon",
+            "coordinates": [[[20, 40], [60, 40], [60, 70], [20, 70], [20, 40]]],
+        }
+        region = (await self.client.get("/region/regions/")).json()[0]
+        subregion = (await self.client.get("/region/subregions/")).json()[0]
+        for url in (
+            "/region/" + str(region.get("id")) + "/boundary",
+            "/region/subregion/" + str(subregion.get("id")) + "/boundary",
+        ):
+            response = await self.client.get(url)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            response = await self.client.put(url, json=boundary)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            response = await self.client.put(url, json=boundary, headers=headers_auth)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+            response = await self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == boundary
+
+        for url in ("/region/9999/boundary", "/region/subregion/9999/boundary"):
+            response = await self.client.put(url, json=boundary, headers=headers_auth)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
     @pytest.mark.asyncio
     async def test_delete_region_invalid(self):
         # Мы можем удалить регион даже если у него есть субрегион. Он будет удален вместе с регионом
@@ -0,0 +1,47 @@
+from datetime import date
+
+import orjson
+from pydantic import BaseModel, Field, computed_field, field_serializer
+
+from app.api.v1.helpers import ORJSONResponse, validated_response
+
+
+class ResponseItem(BaseModel):
+    name: str = Field(serialization_alias="title")
+    secret: str = Field(exclude=True)
+    launch_date: date
+
+    @field_serializer("launch_date")
+    def serialize_launch_date(self, value: date) -> str:
+        return value.strftime("%d.%m.%Y")
+
+    @computed_field
+    def name_length(self) -> int:
+        return len(self.name)
+
+
+class OtherItem(BaseModel):
+    code: str
+
+
+item = ResponseItem(name="Express", secret="hidden", launch_date=date(2015, 3, 1))
+expected = {"title": "Express", "launch_date": "01.03.2015", "name_length": 7}
+
+
+def test_validated_response_model():
+    assert orjson.loads(validated_response(item).body) == expected
+
+
+def test_validated_response_list():
+    response = validated_response([item, item], status_code=201)
+    assert response.status_code == 201
+    assert orjson.loads(response.body) == [expected, expected]
+
+
+def test_response_mixed_content():
+    # Разнотипные модели и словари сериализуются через orjson
+    response = ORJSONResponse({"items": [item, OtherItem(code="A")], 1: None})
+    assert orjson.loads(response.body) == {
+        "items": [expected, {"code": "A"}],
+        "1": None,
+    }
@@ -1,7 +1,11 @@
+import csv
+import io
+import json
 import pytest
 from fastapi import status
 from datetime import date
 from app.schemas import SatelliteCreate, SatelliteCharacteristicCreate
+from app.service import geo_slot_index
 from tests.test_data import (
     country_test_data,
     satellite_test_date,
@@ -238,6 +242,112 @@ class TestSatelliteAPI:
         # Проверяем пагинацию
         assert len(satellites) == 0
 
+    @pytest.mark.asyncio
+    async def test_export_satellites(self):
+        response = await self.client.get("/satellite/export/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 4
+        codes = [record["international_code"] for record in records]
+        for record in records:
+            assert "rocket" in record
+            assert isinstance(record["coverage_zone_ids"], list)
+
+        response = await self.client.get("/satellite/export/", params={"format": "csv"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert len(rows) == 5
+        assert rows[0][0] == "international_code"
+        assert rows[0][-1] == "coverage_zone_ids"
+        assert [row[0] for row in rows[1:]] == codes
+
+    @pytest.mark.asyncio
+    async def test_get_satellites_complete_batch(self):
+        response = await self.client.get("/satellite/list/", params={"limit": 10})
+        codes = [satellite["international_code"] for satellite in response.json()]
+        requested = [codes[1], "MISSING-0001", codes[0], codes[1]]
+        response = await self.client.post(
+            "/satellite/complete/batch", json={"international_codes": requested}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()
+        assert [result["international_code"] for result in results] == requested
+        assert not results[1]["found"]
+        assert results[1]["satellite"] is None
+        for result in results:
+            if result["international_code"] == "MISSING-0001":
+                continue
+            single = await self.client.get(
+                f"/satellite/{result['international_code']}/complete"
+            )
+            assert result["found"] == (single.status_code == status.HTTP_200_OK)
+            if result["found"]:
+                assert result["satellite"] == single.json()
+
+        response = await self.client.post(
+            "/satellite/complete/batch", json={"international_codes": []}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_get_geo_slots(self):
+        geo_slot_index.invalidate()
+        response = await self.client.get("/satellite/export/")
+        expected = sorted(
+            (record["longitude"], record["international_code"])
+            for record in map(json.loads, response.text.splitlines())
+            if record["longitude"] is not None
+        )
+        assert expected
+        response = await self.client.get(
+            "/satellite/geo/range/", params={"west": -180, "east": 180}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        slots = [
+            (slot["longitude"], slot["international_code"]) for slot in response.json()
+        ]
+        assert slots == expected
+
+        longitude, code = expected[0]
+        response = await self.client.get(
+            "/satellite/geo/nearest/", params={"longitude": longitude, "limit": 1}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"international_code": code, "longitude": longitude, "distance": 0.0}
+        ]
+        response = await self.client.get(
+            "/satellite/geo/nearest/", params={"longitude": 181}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = await self.client.post(
+            "/satellite/geo/look_angles/",
+            json={
+                "latitudes": [0, 55.75],
+                "longitudes": [longitude, 37.62],
+                "altitudes_m": [0, 200],
+                "international_codes": [code, "UNKNOWN"],
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        look_angles = response.json()
+        assert look_angles["international_codes"] == [code]
+        assert look_angles["not_found"] == ["UNKNOWN"]
+        assert look_angles["elevation"][0][0] == 90
+        assert len(look_angles["azimuth"][0]) == len(look_angles["range_km"][0]) == 2
+        response = await self.client.post(
+            "/satellite/geo/look_angles/",
+            json={
+                "latitudes": [0, 10],
+                "longitudes": [longitude],
+                "international_codes": [code],
+            },
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     @pytest.mark.asyncio
     async def test_update_satellite(self):
         # Тест обновления данных спутника
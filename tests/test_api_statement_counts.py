@@ -0,0 +1,192 @@
+import pytest
+from fastapi import status
+from tests.test_data import headers_auth
+from tests.test_service_coverage_zone import get_data_image
+from app.core import entity_counters
+from app.service import (
+    satellite_cache,
+    coverage_index,
+    region_boundary_index,
+    subregion_boundary_index,
+)
+
+# Число SQL-запросов на эндпоинт: связи моделей не загружаются неявно,
+# поэтому рост числа запросов означает лишнюю загрузку
+country = {"abbreviation": "SC", "full_name": "Statement count", "id": 50}
+satellite = {
+    "international_code": "STMT_COUNT_1",
+    "name_satellite": "Statement count",
+    "norad_id": 900001,
+    "launch_date": "2015-03-01",
+    "country_id": country["id"],
+}
+characteristic = {
+    "international_code": satellite["international_code"],
+    "longitude": 36.0,
+    "period": 1436.1,
+    "launch_site": "Baikonur",
+    "rocket": "Proton-M",
+    "launch_mass": 5700,
+    "manufacturer": "ISS Reshetnev",
+    "model": "Express-1000",
+    "expected_lifetime": 15,
+    "remaining_lifetime": 5,
+    "details": None,
+}
+zone_id = "STMT-COUNT-ZONE"
+region = {"name_region": "Statement count region"}
+added_region = {"name_region": "Statement count added region"}
+subregion = {"name_subregion": "Statement count subregion"}
+footprint = {
+    "type": "Polygon",
+    "coordinates": [[[20, 40], [60, 40], [60, 70], [20, 70], [20, 40]]],
+}
+ids = dict()
+
+endpoint_statements = [
+    ("/country/id/{country_id}", 1),
+    ("/country/id/{country_id}/satellite", 2),
+    ("/country/list/", 1),
+    ("/satellite/{satellite_code}", 1),
+    ("/satellite/{satellite_code}/characteristics", 1),
+    ("/satellite/{satellite_code}/complete", 1),
+    ("/satellite/list/", 1),
+    ("/region/{region_id}", 1),
+    ("/region/subregion/{subregion_id}", 1),
+    ("/region/regions/", 1),
+    ("/region/subregions/", 1),
+    ("/region/{region_id}/boundary", 1),
+    ("/coverage_zone/{zone_id}", 1),
+    ("/coverage_zone/regions/{zone_id}", 3),
+    ("/coverage_zone/satellite/coverage_zone_id/{zone_id}", 1),
+    ("/coverage_zone/satellite/satellite_international_code/{satellite_code}", 2),
+    ("/coverage_zone/coverage_zones/", 1),
+    ("/coverage_zone/coverage_zones/count/", 1),
+    ("/coverage_zone/footprint/{zone_id}", 1),
+    ("/coverage_zone/coverage/point/?longitude=37.6&latitude=55.7", 2),
+]
+
+# Запись: (метод, адрес, тело запроса, число запросов). Тело строится при
+# выполнении, идентификаторы известны только после создания данных.
+# Порядок важен: связи зоны снимаются и добавляются заново, последний
+# шаг удаляет зону с привязанным регионом
+write_statements = [
+    ("DELETE", "/coverage_zone/{zone_id}/region_name/{name_region}", None, 7),
+    (
+        "POST",
+        "/coverage_zone/subregion/{zone_id}",
+        lambda: {**subregion, "id_region": ids["region_id"]},
+        9,
+    ),
+    ("DELETE", "/coverage_zone/{zone_id}/subregion_name/{name_subregion}", None, 7),
+    ("POST", "/coverage_zone/region/{zone_id}", lambda: added_region, 8),
+    ("DELETE", "/region/subregion/{subregion_id}", None, 5),
+    ("DELETE", "/coverage_zone/{zone_id}", None, 10),
+]
+
+
+async def reset_caches():
+    """Кеши и индексы сброшены: считаются запросы холодного обращения"""
+    await satellite_cache.delete(satellite["international_code"])
+    for index in (coverage_index, region_boundary_index, subregion_boundary_index):
+        index.invalidate()
+    entity_counters.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_create_data(async_client):
+    response = await async_client.post("/country/", json=country, headers=headers_auth)
+    assert response.status_code == status.HTTP_200_OK
+    response = await async_client.post(
+        "/satellite/complete",
+        json={
+            "satellite_create": satellite,
+            "satellite_characteristic": characteristic,
+        },
+        headers=headers_auth,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    image = await get_data_image("tests/test/test1.jpg")
+    response = await async_client.post(
+        "/coverage_zone/",
+        data={
+            "coverage_zone_id": zone_id,
+            "transmitter_type": "Ku-band",
+            "satellite_code": satellite["international_code"],
+        },
+        files={"image": ("test1.jpg", image, "image/jpeg")},
+        headers=headers_auth,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await async_client.post("/region/", json=region, headers=headers_auth)
+    assert response.status_code == status.HTTP_200_OK
+    ids["region_id"] = response.json().get("id")
+    response = await async_client.post(
+        "/coverage_zone/subregion/" + zone_id,
+        json={**subregion, "id_region": ids["region_id"]},
+        headers=headers_auth,
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    response = await async_client.get(
+        "/region/subregion/name/" + subregion["name_subregion"]
+    )
+    ids["subregion_id"] = response.json().get("id")
+    for url in (
+        "/coverage_zone/footprint/" + zone_id,
+        "/region/" + str(ids["region_id"]) + "/boundary",
+    ):
+        response = await async_client.put(url, json=footprint, headers=headers_auth)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint, expected", endpoint_statements)
+async def test_statement_count(async_client, sql_statements, endpoint, expected):
+    await reset_caches()
+    url = endpoint.format(
+        country_id=country["id"],
+        satellite_code=satellite["international_code"],
+        zone_id=zone_id,
+        **ids,
+    )
+    sql_statements.clear()
+    response = await async_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(sql_statements) == expected, sql_statements
+
+
+@pytest.mark.asyncio
+async def test_count_from_counter(async_client, sql_statements):
+    url = "/coverage_zone/coverage_zones/count/"
+    response = await async_client.get(url)
+    sql_statements.clear()
+    assert (await async_client.get(url)).json() == response.json()
+    assert sql_statements == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, endpoint, body, expected", write_statements)
+async def test_write_statement_count(
+    async_client, sql_statements, method, endpoint, body, expected
+):
+    await reset_caches()
+    url = endpoint.format(zone_id=zone_id, **region, **subregion, **ids)
+    json = body() if body is not None else None
+    sql_statements.clear()
+    response = await async_client.request(method, url, json=json, headers=headers_auth)
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+    assert len(sql_statements) == expected, sql_statements
+
+
+@pytest.mark.asyncio
+async def test_delete_data(async_client):
+    response = await async_client.get("/region/name/" + added_region["name_region"])
+    assert response.status_code == status.HTTP_200_OK
+    for url in (
+        "/region/" + str(response.json().get("id")),
+        "/satellite/" + satellite["international_code"],
+        "/region/" + str(ids["region_id"]),
+        "/country/" + str(country["id"]),
+    ):
+        response = await async_client.delete(url, headers=headers_auth)
+        assert response.status_code == status.HTTP_204_NO_CONTENT, url
@@ -1,7 +1,7 @@
 import pytest
 from fastapi import status
 from tests.test_data import user_data_tests, user_data_admin
-from app.core import settings
+from app.core import settings, warm_up_pool
 from app.schemas import AdminPassword
 
 
@@ -134,3 +134,41 @@ class TestUserAPI:
             "/user/", params={"user_mail": "not_found_email@mail.ru"}
         )
         assert delete_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_stats(async_client):
+    response = await async_client.get("/metrics/hashing")
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["max_workers"] == settings.PASSWORD_HASH_WORKERS
+    assert stats["completed"] > 0
+
+
+@pytest.mark.asyncio
+async def test_db_pool_stats(async_client):
+    assert await warm_up_pool() == settings.DB_POOL_SIZE
+    response = await async_client.get("/metrics/db_pool")
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["pool_size"] == settings.DB_POOL_SIZE
+    assert stats["checked_in"] >= settings.DB_POOL_SIZE
+    assert stats["checked_out"] == 0 and stats["saturation"] == 0
+    assert stats["max_checked_out"] >= settings.DB_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_cache_stats(async_client):
+    response = await async_client.get("/metrics/caches")
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert set(stats) == {
+        "satellite_complete_info",
+        "user_status",
+        "theoretical_footprint",
+    }
+    assert (
+        stats["satellite_complete_info"]["max_size"]
+        == settings.SATELLITE_CACHE_MAX_SIZE
+    )
+    assert stats["user_status"]["max_size"] == settings.AUTH_USER_CACHE_MAX_SIZE
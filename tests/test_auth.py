@@ -1,12 +1,20 @@
 import pytest
 from fastapi import status
-from tests.test_data import user_data_tests, country_test_data, invalid_refresh_token
+from tests.test_data import (
+    user_data_tests,
+    user_data_trust_admin,
+    country_test_data,
+    invalid_refresh_token,
+    headers_auth as headers_admin,
+)
 from app.core import settings
+from app.schemas import AdminPassword
 from asyncio import sleep
 
 jwt_tokens = dict()
 headers_auth = dict()
 headers_refresh = dict()
+headers_trust_admin = dict()
 
 
 @pytest.mark.usefixtures("async_client")
@@ -151,6 +159,86 @@ class TestUserAPI:
         )
         assert response.status_code == status.HTTP_200_OK
 
+    @pytest.fixture
+    def trust_token_claims(self, monkeypatch):
+        monkeypatch.setattr(settings, "AUTH_TRUST_TOKEN_CLAIMS", True)
+
+    @pytest.mark.asyncio
+    async def test_auth_trust_token_claims(self, trust_token_claims):
+        create_response = await self.client.post(
+            "/country/", json=country_test_data[0], headers=headers_auth
+        )
+        assert create_response.status_code == status.HTTP_403_FORBIDDEN
+        assert create_response.json() == {"detail": "Insufficient permissions"}
+
+    @pytest.mark.asyncio
+    async def test_auth_trust_token_claims_admin(self, trust_token_claims):
+        # 404 вместо 401/403: авторизация пройдена, страны с таким id нет
+        delete_response = await self.client.delete(
+            "/country/99999", headers=headers_admin
+        )
+        assert delete_response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_auth_trust_token_claims_demoted_admin(self, trust_token_claims):
+        admin_password = AdminPassword(password=settings.ADMIN_SECRET_KEY)
+        create_response = await self.client.post(
+            "/user/",
+            json={
+                "user_create": user_data_trust_admin,
+                "admin_password": admin_password.model_dump(),
+            },
+        )
+        assert create_response.status_code == status.HTTP_200_OK
+        auth_request = {
+            "email": user_data_trust_admin.get("email"),
+            "password": user_data_trust_admin.get("password"),
+        }
+        response = await self.client.post(
+            "/auth/tokens",
+            data={
+                "username": auth_request["email"],
+                "password": auth_request["password"],
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        access_token = response.json().get("access_token")
+        headers_trust_admin["Authorization"] = f"Bearer {access_token}"
+
+        # Статус администратора попадает в кеш
+        delete_response = await self.client.delete(
+            "/country/99999", headers=headers_trust_admin
+        )
+        assert delete_response.status_code == status.HTTP_404_NOT_FOUND
+
+        update_response = await self.client.put(
+            "/user/user_data",
+            json={"user_update": {"role": "user"}, "auth_request": auth_request},
+        )
+        assert update_response.status_code == status.HTTP_200_OK
+
+        # В токене роль admin, но после смены роли кеш сброшен
+        delete_response = await self.client.delete(
+            "/country/99999", headers=headers_trust_admin
+        )
+        assert delete_response.status_code == status.HTTP_403_FORBIDDEN
+        assert delete_response.json() == {"detail": "Insufficient permissions"}
+
+    @pytest.mark.asyncio
+    async def test_auth_trust_token_claims_deleted_admin(self, trust_token_claims):
+        delete_response = await self.client.delete(
+            "/user/", params={"user_mail": user_data_trust_admin.get("email")}
+        )
+        assert delete_response.status_code == status.HTTP_204_NO_CONTENT
+
+        delete_response = await self.client.delete(
+            "/country/99999", headers=headers_trust_admin
+        )
+        assert delete_response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert delete_response.json() == {
+            "detail": "The access token contains a non-existent user ID"
+        }
+
     @pytest.mark.asyncio
     async def test_delete_user(self):
         country_data = country_test_data[0]
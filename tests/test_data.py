@@ -50,6 +50,30 @@ satellite_test_date = [
         "country_id": 1,
     },
 ]
+orbit_satellite_test_data = [
+    {
+        "international_code": "1998-067A",
+        "name_satellite": "ISS",
+        "norad_id": 25544,
+        "launch_date": date(1998, 11, 20),
+    },
+    {
+        "international_code": "2005-041A",
+        "name_satellite": "GEO-1",
+        "norad_id": 28884,
+        "launch_date": date(2005, 10, 13),
+    },
+]
+tle_test_data = [
+    (
+        "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927",
+        "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537",
+    ),
+    (
+        "1 28884U 05041A   24061.50000000 -.00000100  00000-0  00000-0 0  9990",
+        "2 28884   0.0210  90.1230 0002100 270.5000 200.3000  1.00271000067893",
+    ),
+]
 satellite_characteristic_test_date = [
     {
         "international_code": "123_A_123_A",
@@ -148,6 +172,28 @@ test_create_data = [
     },
 ]
 
+# Контуры зон покрытия test_create_data: над Европой и через антимеридиан
+footprint_test_data = [
+    {
+        "type": "Polygon",
+        "coordinates": [
+            [[20.0, 40.0], [60.0, 40.0], [60.0, 70.0], [20.0, 70.0], [20.0, 40.0]]
+        ],
+    },
+    {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [170.0, -20.0],
+                [-170.0, -20.0],
+                [-170.0, 20.0],
+                [170.0, 20.0],
+                [170.0, -20.0],
+            ]
+        ],
+    },
+]
+
 test_get_data = [
     ("2021-12bd-23730", True),
     ("2001-1234-24670", True),
@@ -181,6 +227,12 @@ user_data_admin = {
     "password": "Admin_1291_admin",
     "role": UserRole.ADMIN,
 }
+user_data_trust_admin = {
+    "name": "Grisha",
+    "email": "trust_claims_admin@gmail.com",
+    "password": "Trust_8213_admin",
+    "role": UserRole.ADMIN,
+}
 invalid_email = {"email": "Invalid_email@gmail.com"}
 user_data_tests = [
     {"name": "Misha", "email": "dfff34@gmail.com", "password": "Ldr21fe2e"},
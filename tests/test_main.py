@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app import main
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shutdown_continues_after_error(monkeypatch):
+    calls = list()
+
+    async def s3_start():
+        calls.append("s3_start")
+
+    async def s3_close():
+        calls.append("s3_close")
+        raise RuntimeError("S3 close failed")
+
+    async def warm_up_pool():
+        calls.append("warm_up_pool")
+
+    async def screening_cancel():
+        calls.append("screening_cancel")
+
+    async def engine_dispose():
+        calls.append("engine_dispose")
+
+    monkeypatch.setattr(main.S3Service, "start", s3_start)
+    monkeypatch.setattr(main.S3Service, "close", s3_close)
+    monkeypatch.setattr(main, "warm_up_pool", warm_up_pool)
+    monkeypatch.setattr(main.screening_job, "cancel", screening_cancel)
+    monkeypatch.setattr(main, "async_engine", SimpleNamespace(dispose=engine_dispose))
+    monkeypatch.setattr(
+        main.password_hasher, "shutdown", lambda: calls.append("hasher_shutdown")
+    )
+    monkeypatch.setattr(
+        main.conjunction_screener,
+        "shutdown",
+        lambda: calls.append("screener_shutdown"),
+    )
+    with pytest.raises(RuntimeError):
+        async with main.lifespan(main.app):
+            assert calls == ["s3_start", "warm_up_pool"]
+    assert calls[2:] == [
+        "s3_close",
+        "hasher_shutdown",
+        "screening_cancel",
+        "screener_shutdown",
+        "engine_dispose",
+    ]
@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from app.orbit import (
+    close_pairs,
+    elements_from_tle,
+    merge_approaches,
+    orbit_shells,
+    propagate,
+    satrec_from_elements,
+    screen_elements,
+    screen_window,
+    shell_overlap_mask,
+    to_datetime64,
+)
+from app.orbit.visibility import time_grid
+from tests.test_data import tle_test_data
+
+start = datetime(2008, 9, 20, tzinfo=timezone.utc)
+end = start + timedelta(hours=2)
+threshold_km = 50.0
+
+
+def make_elements(size: int):
+    """Спутники в близких орбитальных плоскостях с высотой как у МКС"""
+    _, elements = elements_from_tle(*tle_test_data[0])
+    generator = random.Random(3)
+    return [
+        elements.model_copy(
+            update={
+                "ra_of_asc_node": generator.uniform(247, 249),
+                "mean_anomaly": generator.uniform(0, 360),
+                "mean_motion": 15.72 + generator.uniform(-0.01, 0.01),
+            }
+        )
+        for _ in range(size)
+    ]
+
+
+def brute_force(satrecs):
+    """Минимумы расстояний всех пар внутри окна на сетке с шагом 1 с"""
+    offsets = time_grid(start, end, 1.0)
+    moments = to_datetime64(start) + (offsets * 1e6).astype("timedelta64[us]")
+    positions = propagate(satrecs, moments).positions
+    approaches = list()
+    for i in range(len(satrecs)):
+        distances = np.linalg.norm(positions[i + 1 :] - positions[i], axis=-1)
+        for shift, distance in enumerate(distances):
+            close = np.flatnonzero(distance <= threshold_km)
+            for run in np.split(close, np.flatnonzero(np.diff(close) > 1) + 1):
+                if not len(run):
+                    continue
+                k = run[np.argmin(distance[run])]
+                # Минимум на границе окна - сближение вне окна
+                if 0 < k < len(offsets) - 1:
+                    approaches.append((i, i + 1 + shift, moments[k], distance[k]))
+    return sorted(approaches)
+
+
+def test_close_pairs_match_full_scan():
+    generator = np.random.default_rng(1)
+    positions = generator.uniform(-8000, 8000, size=(400, 3))
+    for radius in (300.0, 1500.0):
+        first, second = close_pairs(positions, radius)
+        distances = np.linalg.norm(positions[:, None] - positions[None], axis=-1)
+        expected = {(i, j) for i, j in zip(*np.nonzero(distances <= radius)) if i < j}
+        assert set(zip(first.tolist(), second.tolist())) == expected
+        assert len(first) == len(expected)
+    assert len(close_pairs(positions[:1], 100.0)[0]) == 0
+
+
+def test_shell_overlap_mask():
+    perigee = np.array([6700.0, 6750.0, 7500.0, 42000.0, 42100.0, 26000.0])
+    apogee = np.array([6720.0, 6800.0, 7600.0, 42200.0, 42150.0, 26100.0])
+    mask = shell_overlap_mask(perigee, apogee, margin_km=50.0)
+    assert mask.tolist() == [True, True, False, True, True, False]
+    satrecs = [satrec_from_elements(elements) for elements in make_elements(3)]
+    perigee, apogee = orbit_shells(satrecs)
+    assert np.all((6600 < perigee) & (perigee <= apogee) & (apogee < 6800))
+
+
+def test_screen_window_matches_brute_force():
+    satrecs = [satrec_from_elements(elements) for elements in make_elements(40)]
+    offsets = time_grid(start, end, 60)
+    approaches = screen_window(satrecs, to_datetime64(start), offsets, 60, threshold_km)
+    expected = brute_force(satrecs)
+    assert len(expected) > 3
+    assert [approach[:2] for approach in approaches] == [item[:2] for item in expected]
+    for approach, (_, _, moment, distance) in zip(approaches, expected):
+        assert abs(approach.tca - moment) <= np.timedelta64(1, "s")
+        assert approach.miss_distance_km <= distance + 1e-6
+        assert approach.miss_distance_km > distance - 1.0
+        assert approach.relative_speed_kms > 0
+
+    # Части окна, посчитанные отдельно (как в пуле процессов), дают тот же результат
+    parts = [
+        screen_elements(make_elements(40), to_datetime64(start), part, 60, threshold_km)
+        for part in np.array_split(offsets, 3)
+    ]
+    merged = merge_approaches([item for part in parts for item in part], 60)
+    assert [item[:3] for item in merged] == [item[:3] for item in approaches]
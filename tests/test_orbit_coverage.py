@@ -0,0 +1,118 @@
+import numpy as np
+
+from app.orbit import (
+    PolygonIndex,
+    PackedRTree,
+    normalize_polygon,
+    polygon_bounds,
+    points_in_polygon,
+    polygon_intersects_box,
+    polygons_intersect,
+)
+
+
+def square(west, south, east, north):
+    return [[west, south], [east, south], [east, north], [west, north], [west, south]]
+
+
+def test_rtree_matches_full_scan():
+    generator = np.random.default_rng(42)
+    centers = generator.uniform([-180, -80], [180, 80], (3000, 2))
+    sizes = generator.uniform(0.1, 10, (3000, 2))
+    boxes = np.column_stack((centers - sizes, centers + sizes))
+    tree = PackedRTree(boxes)
+    assert len(tree.levels) > 2
+    for _ in range(200):
+        west, south = generator.uniform([-180, -80], [180, 80])
+        east, north = np.array([west, south]) + generator.uniform(0, 20, 2)
+        expected = np.flatnonzero(
+            (boxes[:, 0] <= east)
+            & (boxes[:, 2] >= west)
+            & (boxes[:, 1] <= north)
+            & (boxes[:, 3] >= south)
+        )
+        assert np.array_equal(np.sort(tree.query(west, south, east, north)), expected)
+    assert len(PackedRTree(np.zeros((0, 4))).query(-180, -90, 180, 90)) == 0
+
+
+def test_polygon_with_hole():
+    rings = normalize_polygon([square(0, 0, 10, 10), square(4, 4, 6, 6)])
+    assert polygon_bounds(rings) == (0.0, 0.0, 10.0, 10.0)
+    inside = points_in_polygon(rings, [1, 5, 11, 9.9], [1, 5, 5, 9.9])
+    assert inside.tolist() == [True, False, False, True]
+    assert polygon_intersects_box(rings, 9, 9, 20, 20)
+    assert polygon_intersects_box(rings, 1, 1, 2, 2)
+    assert polygon_intersects_box(rings, -5, -5, 15, 15)
+    assert not polygon_intersects_box(rings, 4.5, 4.5, 5.5, 5.5)
+    assert not polygon_intersects_box(rings, 11, 0, 12, 10)
+
+
+def test_antimeridian():
+    (ring,) = normalize_polygon([square(170, -10, -170, 10)])
+    assert ring[:, 0].tolist() == [170, 190, 190, 170, 170]
+    index = PolygonIndex(ttl_seconds=60)
+    index.load(
+        [
+            ("PACIFIC", normalize_polygon([square(170, -10, -170, 10)])),
+            ("EUROPE", normalize_polygon([square(20, 40, 60, 70)])),
+        ],
+        index.version,
+    )
+    assert not index.is_stale()
+    assert index.covering(-175, 0) == ["PACIFIC"]
+    assert index.covering(179.5, 5) == ["PACIFIC"]
+    assert index.covering(37.6, 55.7) == ["EUROPE"]
+    assert index.covering(0, 0) == []
+    assert index.intersecting(175, -1, -175, 1) == ["PACIFIC"]
+    assert index.intersecting(-169, -5, -160, 5) == []
+    assert index.intersecting(-180, -90, 180, 90) == ["EUROPE", "PACIFIC"]
+
+
+def test_hole_across_antimeridian():
+    hole = [[-179.5, -1], [-179.5, 1], [179.5, 1], [179.5, -1], [-179.5, -1]]
+    rings = normalize_polygon([square(170, -10, -170, 10), hole])
+    assert polygon_bounds(rings) == (170.0, -10.0, 190.0, 10.0)
+    index = PolygonIndex(ttl_seconds=60)
+    index.set("PACIFIC", rings)
+    assert index.covering(-179.8, 0) == []
+    assert index.covering(179.8, 0) == []
+    assert index.covering(-175, 0) == ["PACIFIC"]
+    assert index.covering(175, 0) == ["PACIFIC"]
+
+
+def test_set_and_remove():
+    index = PolygonIndex(ttl_seconds=60)
+    version = index.version
+    index.set("A", normalize_polygon([square(0, 0, 10, 10)]))
+    index.set("B", normalize_polygon([square(5, 5, 15, 15)]))
+    assert index.covering(7, 7) == ["A", "B"]
+    index.set("A", normalize_polygon([square(20, 20, 30, 30)]))
+    assert index.covering(7, 7) == ["B"]
+    index.remove("B")
+    index.remove("UNKNOWN")
+    assert index.covering(7, 7) == [] and len(index) == 1
+    assert index.get("A") is not None and index.get("B") is None
+    assert index.version > version
+    assert PolygonIndex(ttl_seconds=60).covering(0, 0) == []
+
+
+def test_polygon_intersection():
+    frame = normalize_polygon([square(0, 0, 10, 10), square(2, 2, 8, 8)])
+    assert polygons_intersect(frame, normalize_polygon([square(9, 9, 20, 20)]))
+    assert polygons_intersect(normalize_polygon([square(-5, -5, 15, 15)]), frame)
+    # Касание по общему ребру считается пересечением
+    assert polygons_intersect(frame, normalize_polygon([square(10, 0, 12, 10)]))
+    assert not polygons_intersect(frame, normalize_polygon([square(3, 3, 7, 7)]))
+    assert not polygons_intersect(frame, normalize_polygon([square(11, 0, 12, 10)]))
+
+    index = PolygonIndex(ttl_seconds=60)
+    index.set(1, normalize_polygon([square(20, 40, 60, 70)]))
+    index.set(2, normalize_polygon([square(-175, -10, -160, 10)]))
+    index.set(3, frame)
+    assert index.intersecting_polygon(normalize_polygon([square(5, 5, 30, 50)])) == [
+        1,
+        3,
+    ]
+    pacific = normalize_polygon([square(170, -5, -170, 5)])
+    assert index.intersecting_polygon(pacific) == [2]
+    assert index.intersecting_polygon(normalize_polygon([square(3, 3, 7, 7)])) == []
@@ -0,0 +1,73 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from app.orbit import ElementSetReader, elements_from_tle
+from app.orbit import element_sets
+from app.schemas import ElementSetFormat
+
+ELEMENT_SETS_DIR = Path(__file__).parent / "test" / "element_sets"
+element_set_files = [
+    (ElementSetFormat.TLE, "elements.tle"),
+    (ElementSetFormat.OMM_JSON, "elements.json"),
+    (ElementSetFormat.OMM_XML, "elements.xml"),
+    (ElementSetFormat.OMM_CSV, "elements.csv"),
+]
+
+
+def read_records(file_format: ElementSetFormat, file_name: str):
+    with open(ELEMENT_SETS_DIR / file_name, "rb") as stream:
+        reader = ElementSetReader(stream, file_format)
+        return list(reader), reader.invalid
+
+
+@pytest.mark.parametrize("file_format, file_name", element_set_files)
+def test_read_element_sets(file_format, file_name):
+    records, invalid = read_records(file_format, file_name)
+    assert [record.norad_id for record in records] == [25544, 28884, 43013]
+    assert invalid == 1
+    tle_records, _ = read_records(ElementSetFormat.TLE, "elements.tle")
+    for record, tle_record in zip(records, tle_records):
+        assert record.elements.epoch == tle_record.elements.epoch
+        for field in ("mean_motion", "eccentricity", "inclination", "mean_anomaly"):
+            assert getattr(record.elements, field) == pytest.approx(
+                getattr(tle_record.elements, field), abs=1e-6
+            )
+
+
+def test_read_json_in_small_chunks(monkeypatch):
+    monkeypatch.setattr(element_sets, "JSON_CHUNK_SIZE", 7)
+    records, invalid = read_records(ElementSetFormat.OMM_JSON, "elements.json")
+    assert len(records) == 3
+    assert invalid == 1
+
+
+def test_read_batches():
+    with open(ELEMENT_SETS_DIR / "elements.tle", "rb") as stream:
+        batches = list(ElementSetReader(stream, ElementSetFormat.TLE).batches(2))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+@pytest.mark.parametrize(
+    "file_format, content",
+    [
+        (ElementSetFormat.OMM_JSON, b'{"NORAD_CAT_ID": 1}'),
+        (ElementSetFormat.OMM_JSON, b'[{"NORAD_CAT_ID": 1}, {"NORAD'),
+        (ElementSetFormat.OMM_XML, b"<ndm><omm><body></omm>"),
+    ],
+)
+def test_read_malformed_file(file_format, content):
+    with pytest.raises(ValueError):
+        list(ElementSetReader(io.BytesIO(content), file_format))
+
+
+def test_read_tle_without_name_lines():
+    with open(ELEMENT_SETS_DIR / "elements.tle", "rb") as stream:
+        lines = stream.read().decode().splitlines()
+    two_line = "\r\n".join(line for line in lines if line[:2] in ("1 ", "2 "))
+    reader = ElementSetReader(io.BytesIO(two_line.encode()), ElementSetFormat.TLE)
+    records = list(reader)
+    assert len(records) == 3
+    assert reader.invalid == 1
+    assert records[0] == elements_from_tle(lines[1], lines[2])
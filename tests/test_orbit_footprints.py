@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from app.orbit import (
+    PolygonIndex,
+    beam_contours,
+    coverage_angle,
+    geostationary_ecef,
+    geostationary_look_angles,
+    normalize_polygon,
+    points_in_polygon,
+    visibility_contours,
+)
+from app.orbit.geometry import EARTH_RADIUS_KM
+
+
+def spherical_ecef(latitudes, longitudes):
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    return EARTH_RADIUS_KM * np.stack(
+        (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)), axis=-1
+    )
+
+
+def test_visibility_contours():
+    assert np.degrees(coverage_angle(0.0)) == pytest.approx(81.3, abs=0.05)
+    levels = [0.0, 5.0, 20.0]
+    rings = visibility_contours(36.0, levels, 90)
+    assert rings.shape == (3, 91, 2)
+    assert np.array_equal(rings[:, 0], rings[:, -1])
+    for ring, level in zip(rings, levels):
+        # Контур на сферической Земле: угол места WGS84 отличается на сотые градуса
+        angles = geostationary_look_angles(
+            ring[:, 1], ring[:, 0], np.zeros(len(ring)), np.array([36.0])
+        )
+        assert np.allclose(angles.elevation, level, atol=0.05)
+    # Более высокий угол места - вложенный контур
+    inner = normalize_polygon([rings[2]])
+    assert points_in_polygon(normalize_polygon([rings[1]]), *inner[0].T).all()
+
+
+def test_visibility_across_antimeridian():
+    (ring,) = visibility_contours(170.0, [5.0], 360)
+    index = PolygonIndex(ttl_seconds=60)
+    index.set("PACIFIC", normalize_polygon([ring]))
+    assert index.covering(-150.0, 0.0) == ["PACIFIC"]
+    assert index.covering(120.0, 30.0) == ["PACIFIC"]
+    assert index.covering(0.0, 0.0) == []
+
+
+def test_beam_contours():
+    satellite_longitude, beamwidth = 36.0, 1.0
+    levels = [49.0, 45.0, 40.0]
+    rings = beam_contours(satellite_longitude, 45.0, 37.0, beamwidth, 52.0, levels, 72)
+    satellite = geostationary_ecef(satellite_longitude)
+    axis = spherical_ecef(45.0, 37.0) - satellite
+    axis /= np.linalg.norm(axis)
+    for ring, level in zip(rings, levels):
+        directions = spherical_ecef(ring[:, 1], ring[:, 0]) - satellite
+        directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+        off_axis = np.degrees(np.arccos(directions @ axis))
+        # -3 дБ на половине ширины луча
+        expected = beamwidth * np.sqrt((52.0 - level) / 12.0)
+        assert np.allclose(off_axis, expected, atol=1e-6)
+    assert rings[0, 0, 0] == pytest.approx(rings[0, -1, 0])
+
+    # Край луча за видимым диском обрезается по касательной
+    (ring,) = beam_contours(satellite_longitude, 70.0, 36.0, 8.0, 52.0, [32.0], 72)
+    assert ring[:, 1].max() < 81.4
+    with pytest.raises(ValueError):
+        beam_contours(satellite_longitude, 0.0, -120.0, 1.0, 52.0, [49.0], 72)
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sgp4.api import Satrec, jday
+
+from app.orbit import (
+    elements_from_tle,
+    satrec_from_elements,
+    to_datetime64,
+    julian_dates,
+    propagate,
+)
+from tests.test_data import tle_test_data
+
+moments = [
+    datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc) + timedelta(minutes=17 * i)
+    for i in range(5)
+]
+
+
+def scalar_state(satrec: Satrec, moment: datetime):
+    jd, fr = jday(
+        moment.year,
+        moment.month,
+        moment.day,
+        moment.hour,
+        moment.minute,
+        moment.second + moment.microsecond / 1e6,
+    )
+    return satrec.sgp4(jd, fr)
+
+
+@pytest.mark.parametrize("line1, line2", tle_test_data)
+def test_elements_from_tle(line1, line2):
+    norad_id, elements = elements_from_tle(line1, line2)
+    assert norad_id == int(line1[2:7])
+    reference = Satrec.twoline2rv(line1, line2)
+    satrec = satrec_from_elements(elements)
+    assert satrec.jdsatepoch + satrec.jdsatepochF == pytest.approx(
+        reference.jdsatepoch + reference.jdsatepochF, abs=1e-8
+    )
+    for moment in moments[:2]:
+        _, position, velocity = scalar_state(satrec, moment)
+        _, ref_position, ref_velocity = scalar_state(reference, moment)
+        assert np.allclose(position, ref_position, atol=1e-6)
+        assert np.allclose(velocity, ref_velocity, atol=1e-9)
+
+
+def test_elements_from_invalid_tle():
+    line1, line2 = tle_test_data[0]
+    with pytest.raises(ValueError):
+        elements_from_tle(line1[:-1] + "0", line2)
+    with pytest.raises(ValueError):
+        elements_from_tle(line1, tle_test_data[1][1])
+    with pytest.raises(ValueError):
+        elements_from_tle(line2, line1)
+
+
+def test_julian_dates():
+    jd, fr = julian_dates(np.array([to_datetime64(moment) for moment in moments]))
+    for moment, day, fraction in zip(moments, jd, fr):
+        ref_jd, ref_fr = jday(
+            moment.year, moment.month, moment.day, moment.hour, moment.minute, 0
+        )
+        assert day + fraction == pytest.approx(ref_jd + ref_fr, abs=1e-9)
+
+
+def test_propagate_matches_scalar():
+    satrecs = [
+        satrec_from_elements(elements_from_tle(*tle)[1]) for tle in tle_test_data
+    ]
+    result = propagate(satrecs, np.array([to_datetime64(moment) for moment in moments]))
+    assert result.errors.shape == (len(satrecs), len(moments))
+    assert result.positions.shape == (len(satrecs), len(moments), 3)
+    assert not result.errors.any()
+    for i, satrec in enumerate(satrecs):
+        for j, moment in enumerate(moments):
+            _, position, velocity = scalar_state(satrec, moment)
+            assert np.allclose(result.positions[i, j], position, atol=1e-6)
+            assert np.allclose(result.velocities[i, j], velocity, atol=1e-9)
+    geo_radius = np.linalg.norm(result.positions[1], axis=1)
+    assert np.all(np.abs(geo_radius - 42164) < 100)
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from app.orbit import LongitudeSlotIndex, longitude_distance
+
+
+def make_index(slots):
+    index = LongitudeSlotIndex(ttl_seconds=60)
+    index.load(sorted(slots, key=lambda slot: slot[1]), index.version)
+    return index
+
+
+def in_range(longitude, west, east):
+    if west <= east:
+        return west <= longitude <= east
+    return longitude >= west or longitude <= east
+
+
+def test_longitude_distance():
+    assert longitude_distance(170, -170) == pytest.approx(20)
+    assert longitude_distance(-10, 10) == pytest.approx(20)
+    assert longitude_distance(0, 180) == pytest.approx(180)
+    assert longitude_distance(45, 45) == 0
+
+
+def test_range_and_nearest_match_full_scan():
+    generator = random.Random(42)
+    slots = [(f"SAT_{i}", round(generator.uniform(-180, 180), 1)) for i in range(500)]
+    index = make_index(slots)
+    assert not index.is_stale()
+    for _ in range(200):
+        west = round(generator.uniform(-180, 180), 1)
+        east = round(generator.uniform(-180, 180), 1)
+        expected = {slot for slot in slots if in_range(slot[1], west, east)}
+        assert set(index.range(west, east)) == expected
+
+        longitude = generator.uniform(-180, 180)
+        limit = generator.randint(1, 20)
+        nearest = index.nearest(longitude, limit)
+        distances = sorted(longitude_distance(slot[1], longitude) for slot in slots)
+        assert [distance for _, _, distance in nearest] == pytest.approx(
+            distances[:limit]
+        )
+        assert len({code for code, _, _ in nearest}) == limit
+
+
+def test_antimeridian():
+    index = make_index([("A", 179.5), ("B", -179.0), ("C", 0.0), ("D", 170.0)])
+    assert index.range(175, -175) == [("A", 179.5), ("B", -179.0)]
+    assert [code for code, _, _ in index.nearest(-179.9, 2)] == ["A", "B"]
+    assert [code for code, _, _ in index.nearest(10, 10)] == ["C", "D", "A", "B"]
+    assert index.nearest(10, 1)[0][2] == pytest.approx(10)
+
+
+def test_set_and_remove():
+    index = make_index([("A", 10.0), ("B", 20.0), ("C", 20.0)])
+    version = index.version
+    index.set("B", 30.0)
+    index.set("D", 20.0)
+    index.set("E", None)
+    assert index.range(-180, 180) == [
+        ("A", 10.0),
+        ("C", 20.0),
+        ("D", 20.0),
+        ("B", 30.0),
+    ]
+    index.remove("C")
+    index.remove("UNKNOWN")
+    assert index.get("B") == 30.0 and index.get("C") is None
+    assert index.range(15, 25) == [("D", 20.0)]
+    assert len(index) == 3
+    assert index.version > version
+
+    # Запись во время чтения из БД: загруженный снимок не считается свежим
+    index.invalidate()
+    version = index.version
+    index.set("F", 50.0)
+    index.load([("A", 10.0)], version)
+    assert index.is_stale()
+    assert make_index([]).nearest(0, 5) == []
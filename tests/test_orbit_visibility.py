@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sgp4.api import Satrec
+from sgp4.propagation import gstime
+
+from app.orbit import (
+    GroundPoint,
+    predict_passes,
+    gmst,
+    julian_dates,
+    look_angles,
+    geodetic_to_ecef,
+    geostationary_ecef,
+    geostationary_look_angles,
+    teme_to_ecef,
+    to_datetime64,
+    from_datetime64,
+)
+from app.orbit.visibility import time_grid
+from tests.test_data import tle_test_data
+
+moscow = GroundPoint(55.75, 37.62, 0.2)
+honolulu = GroundPoint(21.31, -157.86, 0.0)
+
+
+def elevation_at(satrec: Satrec, point: GroundPoint, moments: np.ndarray):
+    jd, fr = julian_dates(moments)
+    _, positions, _ = satrec.sgp4_array(jd, fr)
+    return look_angles(
+        point.latitude,
+        point.longitude,
+        geodetic_to_ecef(point.latitude, point.longitude, point.altitude_km),
+        teme_to_ecef(positions, jd, fr),
+    )
+
+
+def test_gmst_matches_sgp4():
+    moments = np.array(
+        [
+            to_datetime64(datetime(2024, 3, 1, hour, tzinfo=timezone.utc))
+            for hour in range(24)
+        ]
+    )
+    jd, fr = julian_dates(moments)
+    expected = [gstime(day + fraction) for day, fraction in zip(jd, fr)]
+    assert np.allclose(gmst(jd, fr), expected, atol=1e-9)
+
+
+def test_geostationary_look_angles():
+    angles = look_angles(
+        0.0, 60.0, geodetic_to_ecef(0.0, 60.0, 0.0), geostationary_ecef(60.0)
+    )
+    assert angles.elevation == pytest.approx(90.0)
+    assert angles.range_km == pytest.approx(35786.03, abs=0.01)
+    # Москва -> 36° в.д.: азимут чуть западнее юга, угол места около 26°
+    angles = look_angles(
+        moscow.latitude,
+        moscow.longitude,
+        geodetic_to_ecef(moscow.latitude, moscow.longitude, 0.0),
+        geostationary_ecef(36.0),
+    )
+    assert angles.azimuth == pytest.approx(182.0, abs=0.1)
+    assert angles.elevation == pytest.approx(26.5, abs=0.1)
+
+    # Пакетный расчет терминалы x спутники совпадает с попарным
+    latitudes = np.array([55.75, 0.0, -33.9])
+    longitudes = np.array([37.62, 60.0, 151.2])
+    altitudes = np.array([0.2, 0.0, 0.05])
+    satellite_longitudes = np.array([36.0, 60.0, 140.0, -30.0])
+    batch = geostationary_look_angles(
+        latitudes, longitudes, altitudes, satellite_longitudes
+    )
+    assert batch.elevation.shape == (4, 3)
+    for i, satellite_longitude in enumerate(satellite_longitudes):
+        for j in range(3):
+            single = look_angles(
+                latitudes[j],
+                longitudes[j],
+                geodetic_to_ecef(latitudes[j], longitudes[j], altitudes[j]),
+                geostationary_ecef(satellite_longitude),
+            )
+            assert np.allclose([values[i, j] for values in batch], single)
+
+
+def test_passes_match_brute_force():
+    satrec = Satrec.twoline2rv(*tle_test_data[0])
+    start = datetime(2008, 9, 20, 12, 0, tzinfo=timezone.utc)
+    end = start + timedelta(hours=12)
+    (track,) = predict_passes([satrec], moscow, start, end, 60, 10.0)
+    assert track.error == 0
+
+    offsets = time_grid(start, end, 1.0)
+    moments = to_datetime64(start) + (offsets * 1e6).astype("timedelta64[us]")
+    elevation = elevation_at(satrec, moscow, moments).elevation
+    above = elevation >= 10.0
+    edges = np.flatnonzero(np.diff(above.astype(np.int8)))
+    rises = moments[edges[above[edges + 1]] + 1]
+    sets = moments[edges[~above[edges + 1]]]
+    assert len(track.passes) == len(rises) == 3
+    for satellite_pass, rise, set_time in zip(track.passes, rises, sets):
+        assert abs(satellite_pass.rise.time - rise) <= np.timedelta64(2, "s")
+        assert abs(satellite_pass.set.time - set_time) <= np.timedelta64(2, "s")
+        assert satellite_pass.rise.elevation == pytest.approx(10.0, abs=0.1)
+        window = (moments >= rise) & (moments <= set_time)
+        assert satellite_pass.culmination.elevation == pytest.approx(
+            elevation[window].max(), abs=0.01
+        )
+        assert rise < satellite_pass.culmination.time < set_time
+
+
+def test_geostationary_passes():
+    satrec = Satrec.twoline2rv(*tle_test_data[1])
+    start = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+    end = start + timedelta(hours=24)
+    visible = predict_passes([satrec], honolulu, start, end, 600, 5)
+    hidden = predict_passes([satrec], moscow, start, end, 600, 5)
+    (satellite_pass,) = visible[0].passes
+    assert satellite_pass.rise is None and satellite_pass.set is None
+    assert from_datetime64(visible[0].start.time) == start
+    assert visible[0].start.elevation > 5
+    assert hidden[0].passes == []
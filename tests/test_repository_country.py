@@ -1,5 +1,6 @@
 import pytest
-from app.db import CountryRepository
+from app.core import entity_counters
+from app.db import Country, CountryRepository
 from app.schemas import (
     CountryCreate,
     Object_ID,
@@ -191,6 +192,51 @@ class TestUpdate:
             assert country is not None
 
 
+class TestCount:
+    @pytest.mark.asyncio
+    async def test_count(self, db_session):
+        repo = CountryRepository(db_session)
+        test_country = {"abbreviation": "CNT", "full_name": "Счетчик", "id": 60}
+        entity_counters.invalidate()
+        async with db_session.begin():
+            count = await repo.get_count()
+            assert entity_counters.get("countries") == count
+        # Незафиксированное создание видно только своей транзакции
+        await db_session.begin()
+        try:
+            await repo.create_entity(CountryCreate(**test_country))
+            assert await repo.get_count() == count + 1
+        finally:
+            await db_session.rollback()
+        assert entity_counters.get("countries") == count
+        async with db_session.begin():
+            await repo.create_entity(CountryCreate(**test_country))
+        assert entity_counters.get("countries") == count + 1
+        async with db_session.begin():
+            assert await repo.get_count() == count + 1
+            assert await repo.delete_model(Object_ID(id=test_country["id"]))
+        assert entity_counters.get("countries") == count
+        # Сверка с COUNT(*) после истечения срока счетчика
+        entity_counters.invalidate("countries")
+        async with db_session.begin():
+            assert await repo.get_count() == count
+
+    @pytest.mark.asyncio
+    async def test_count_unflushed(self, db_session):
+        repo = CountryRepository(db_session)
+        entity_counters.invalidate()
+        async with db_session.begin():
+            db_session.add(Country(abbreviation="UNF", full_name="Без flush", id=61))
+            count = await repo.get_count()
+            # COUNT(*) видит незафиксированную строку, в счетчик она не попадает
+            assert entity_counters.get("countries") is None
+        async with db_session.begin():
+            assert await repo.get_count() == count
+            assert entity_counters.get("countries") == count
+            assert await repo.delete_model(Object_ID(id=61))
+        assert entity_counters.get("countries") == count - 1
+
+
 class TestDelete:
     @pytest.mark.asyncio
     @pytest.mark.parametrize("country_data", country_test_data)
@@ -1,6 +1,14 @@
+import asyncio
+import io
+import os
 import pytest
 import aiofiles
+from botocore.exceptions import EndpointConnectionError
+from sqlalchemy import event
 from typing import Optional, List
+from fastapi import UploadFile
+from app.core import settings
+from app.s3_service import S3Service
 
 from app.db import (
     CoverageZoneRepository,
@@ -104,12 +112,12 @@ class TestCreate:
             assert zone is not None
             assert zone.id == zone_data["id"]
             assert zone.transmitter_type == zone_data["transmitter_type"]
-            async with await repo.s3._get_client() as client:
-                response = await client.get_object(
-                    Bucket=repo.s3.bucket_name, Key=f"zone/{zone.id}.jpg"
-                )
-                s3_image_data = await response["Body"].read()
-                assert local_data == s3_image_data
+            client = await repo.s3._get_client()
+            response = await client.get_object(
+                Bucket=repo.s3.bucket_name, Key=f"zone/{zone.id}.jpg"
+            )
+            s3_image_data = await response["Body"].read()
+            assert local_data == s3_image_data
 
 
 class TestGet:
@@ -309,6 +317,57 @@ class TestZoneRelationship:
             assert await repo_region.delete_model(Object_ID(id=5))
             assert len(await repo_region.get_models(PaginationBase())) == 3
 
+    @pytest.mark.asyncio
+    async def test_add_lists(self, db_session):
+        repo = CoverageZoneRepository(db_session)
+        repo_region = RegionRepository(db_session)
+        zone_2_id = Object_str_ID(id="2001-1234-24670")
+        statements = list()
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+        await db_session.begin()
+        try:
+            regions = [RegionBase(name_region=f"Bulk {i}") for i in range(50)]
+            regions.append(RegionBase(name_region="Russia"))
+            result = await repo.add_region_list(regions + regions[:1], zone_2_id)
+            assert result == [True] * 51 + [False]
+            # Число запросов не зависит от длины списка
+            assert len(statements) == 5
+            assert await repo.add_region_list(regions[:2], zone_2_id) == [False] * 2
+            assert (
+                await repo.add_region_list(regions, Object_str_ID(id="B" * 5)) is None
+            )
+
+            russia = await repo_region.get_region_by_name(regions[-1])
+            bulk = await repo_region.get_region_by_name(regions[0])
+            subregions = [
+                SubregionCreate(name_subregion=f"Bulk sub {i}", id_region=bulk.id)
+                for i in range(100)
+            ]
+            statements.clear()
+            result = await repo.add_subregion_list(
+                subregions
+                + [
+                    SubregionCreate(name_subregion="Bulk sub 0", id_region=russia.id),
+                    SubregionCreate(name_subregion="Bulk sub X", id_region=99999),
+                ],
+                zone_2_id,
+            )
+            assert result == [True] * 100 + [False, False]
+            assert len(statements) == 7
+
+            region_list = await repo.get_region_list(zone_2_id)
+            assert len(region_list) == 51
+            (bulk_details,) = [r for r in region_list if r.id == bulk.id]
+            assert len(bulk_details.subregion_list) == 100
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+            await db_session.rollback()
+
 
 class TestUpdate:
     @pytest.mark.asyncio
@@ -320,15 +379,14 @@ class TestUpdate:
             zone_data_in_db: Optional[CoverageZoneInDB] = await repo.get_as_model(
                 zone_id
             )
-            async with await repo.s3._get_client() as client:
-                response = await client.get_object(
-                    Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
-                )
-                s3_image_data = await response["Body"].read()
-                assert (
-                    await get_data_image(test_create_data[0].get("image"))
-                    == s3_image_data
-                )
+            client = await repo.s3._get_client()
+            response = await client.get_object(
+                Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
+            )
+            s3_image_data = await response["Body"].read()
+            assert (
+                await get_data_image(test_create_data[0].get("image")) == s3_image_data
+            )
             assert zone_data_in_db.id == test_create_data[0].get("id")
             assert zone_data_in_db.transmitter_type == test_create_data[0].get(
                 "transmitter_type"
@@ -364,12 +422,12 @@ class TestUpdate:
             assert zone_data_in_db.satellite_code == satellite_test_date[1].get(
                 "international_code"
             )
-            async with await repo.s3._get_client() as client:
-                response = await client.get_object(
-                    Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
-                )
-                s3_image_data = await response["Body"].read()
-                assert await get_data_image("tests/test/test3.jpg") == s3_image_data
+            client = await repo.s3._get_client()
+            response = await client.get_object(
+                Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
+            )
+            s3_image_data = await response["Body"].read()
+            assert await get_data_image("tests/test/test3.jpg") == s3_image_data
 
     @pytest.mark.asyncio
     async def test_update_2(self, db_session):
@@ -388,15 +446,14 @@ class TestUpdate:
             zone_data_in_db: Optional[CoverageZoneInDB] = await repo.get_as_model(
                 zone_id
             )
-            async with await repo.s3._get_client() as client:
-                response = await client.get_object(
-                    Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
-                )
-                s3_image_data = await response["Body"].read()
-                assert (
-                    await get_data_image(test_create_data[0].get("image"))
-                    == s3_image_data
-                )
+            client = await repo.s3._get_client()
+            response = await client.get_object(
+                Bucket=repo.s3.bucket_name, Key=f"zone/{zone_data_in_db.id}.jpg"
+            )
+            s3_image_data = await response["Body"].read()
+            assert (
+                await get_data_image(test_create_data[0].get("image")) == s3_image_data
+            )
             assert zone_data_in_db.id == test_create_data[0].get("id")
             assert zone_data_in_db.transmitter_type == test_create_data[0].get(
                 "transmitter_type"
@@ -476,3 +533,65 @@ async def test_delete_country(db_session):
         for country in country_list:
             assert await country_repo.delete_model(Object_ID(id=country.id))
         assert len(await country_repo.get_models(PaginationBase())) == 0
+
+
+@pytest.mark.asyncio
+async def test_s3_client_is_shared(db_session):
+    first_repo = CoverageZoneRepository(db_session)
+    second_repo = CoverageZoneRepository(db_session)
+    client = await first_repo.s3._get_client()
+    assert client is await second_repo.s3._get_client()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "file_size",
+    [
+        1024,
+        settings.S3_MULTIPART_THRESHOLD + settings.S3_MULTIPART_PART_SIZE + 1024,
+    ],
+)
+async def test_s3_upload_fileobj(db_session, file_size):
+    repo = CoverageZoneRepository(db_session)
+    file_data = os.urandom(file_size)
+    file_key = await repo.get_s3_file_key("stream-upload-test")
+    assert await repo.s3.upload_fileobj(
+        UploadFile(file=io.BytesIO(file_data)), file_key
+    )
+    client = await repo.s3._get_client()
+    response = await client.get_object(Bucket=repo.s3.bucket_name, Key=file_key)
+    assert await response["Body"].read() == file_data
+    assert await repo.s3.delete_file(file_key)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error", [EndpointConnectionError(endpoint_url="s3"), asyncio.CancelledError()]
+)
+async def test_s3_upload_fileobj_aborted(db_session, monkeypatch, error):
+    repo = CoverageZoneRepository(db_session)
+    upload_part = S3Service._upload_part
+
+    async def failing_upload_part(self, client, file_key, upload_id, parts, chunk):
+        if parts:
+            raise error
+        return await upload_part(self, client, file_key, upload_id, parts, chunk)
+
+    monkeypatch.setattr(S3Service, "_upload_part", failing_upload_part)
+    file_data = io.BytesIO(os.urandom(settings.S3_MULTIPART_THRESHOLD + 1024))
+    file_key = await repo.get_s3_file_key("aborted-upload-test")
+    client = await repo.s3._get_client()
+
+    async def open_uploads():
+        response = await client.list_multipart_uploads(
+            Bucket=repo.s3.bucket_name, Prefix=file_key
+        )
+        return {upload["UploadId"] for upload in response.get("Uploads", [])}
+
+    uploads = await open_uploads()
+    if isinstance(error, asyncio.CancelledError):
+        with pytest.raises(asyncio.CancelledError):
+            await repo.s3.upload_fileobj(UploadFile(file=file_data), file_key)
+    else:
+        assert not await repo.s3.upload_fileobj(UploadFile(file=file_data), file_key)
+    assert await open_uploads() == uploads
@@ -11,6 +11,7 @@ from app.schemas import (
     Object_str_ID,
     CountryCreate,
     PaginationBase,
+    CursorPagination,
     CountryInDB,
     SatelliteCreate,
     SatelliteCharacteristicCreate,
@@ -79,6 +80,20 @@ class TestGet:
             assert len(await repo_sat.get_models(PaginationBase())) == 2
             assert len(await repo_characteristic.get_models(PaginationBase())) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_satellite_projected(self, db_session):
+        repo_sat = SatelliteRepository(db_session)
+        repo_characteristic = SatelliteCharacteristicRepository(db_session)
+        pagination = PaginationBase()
+        async with db_session.begin():
+            for repo in (repo_sat, repo_characteristic):
+                models = await repo.get_models(pagination)
+                assert await repo.get_projected(pagination) == models
+                rows = await repo.get_projected(pagination, as_dict=True)
+                assert rows == [model.model_dump() for model in models]
+            page = await repo_sat.get_projected(PaginationBase(limit=1, offset=1))
+            assert page == (await repo_sat.get_models(pagination))[1:]
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "satellite_date, satellite_characteristic", satellite_complete_data
@@ -99,6 +114,35 @@ class TestGet:
                 )
                 assert test_value == value
 
+    @pytest.mark.asyncio
+    async def test_get_complete_info_many(self, db_session):
+        repo_sat = SatelliteRepository(db_session)
+        async with db_session.begin():
+            codes = ["321_B_123_A", "MISSING_CODE", "123_A_123_A"]
+            complete_info = await repo_sat.get_complete_info_many(codes)
+            assert set(complete_info) == {"321_B_123_A", "123_A_123_A"}
+            for code, satellite_info in complete_info.items():
+                assert satellite_info == await repo_sat.get_complete_info(
+                    Object_str_ID(id=code)
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_satellite_page(self, db_session):
+        repo_sat = SatelliteRepository(db_session)
+        async with db_session.begin():
+            codes = list()
+            page = await repo_sat.get_page(CursorPagination(limit=1))
+            while True:
+                assert len(page.items) <= 1
+                codes.extend(satellite.international_code for satellite in page.items)
+                if page.next_cursor is None:
+                    break
+                page = await repo_sat.get_page(
+                    CursorPagination(limit=1, cursor=page.next_cursor)
+                )
+            assert codes == ["123_A_123_A", "321_B_123_A"]
+            assert await repo_sat.get_page(CursorPagination(cursor="invalid")) is None
+
     @pytest.mark.asyncio
     async def test_get_satellite_from_country(self, db_session):
         country_repo = CountryRepository(db_session)
@@ -9,8 +9,18 @@ from app.schemas import (
     SubregionBase,
     CoverageZoneUpdate,
     SubregionCreateByName,
+    FootprintGeometry,
+    SatelliteCharacteristicCreate,
+    SpotBeam,
+    TheoreticalFootprintRequest,
+    RegionCreate,
 )
+from app.core import settings
 from app.service import (
+    coverage_index,
+    footprint_cache,
+    region_boundary_index,
+    subregion_boundary_index,
     create_country_service,
     create_satellite_service,
     create_coverage_zone_service,
@@ -18,7 +28,13 @@ from app.service import (
 )
 from app.s3_service import S3Service
 
-from tests.test_data import country_test_data, satellite_test_date, test_create_data
+from tests.test_data import (
+    country_test_data,
+    satellite_test_date,
+    test_create_data,
+    footprint_test_data,
+    satellite_characteristic_test_date,
+)
 import aiofiles
 from typing import Optional
 
@@ -34,6 +50,14 @@ async def get_data_image(path_img: str) -> Optional[bytes]:
         return None
 
 
+def square_geometry(west, south, east, north) -> FootprintGeometry:
+    return FootprintGeometry(
+        coordinates=[
+            [[west, south], [east, south], [east, north], [west, north], [west, south]]
+        ]
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("country_data", country_test_data)
 async def test_create_country(db_session, country_data):
@@ -415,6 +439,191 @@ class TestUpdate:
             assert s3_data is not None
             assert s3_data == local_data
 
+    @pytest.mark.asyncio
+    async def test_footprint(self, db_session):
+        service = create_coverage_zone_service(db_session)
+        coverage_index.invalidate()
+        zone_ids = [zone.get("id") for zone in test_create_data]
+        for zone_id, footprint in zip(zone_ids, footprint_test_data):
+            async with db_session.begin():
+                assert await service.set_footprint(
+                    zone_id, FootprintGeometry(**footprint)
+                )
+        async with db_session.begin():
+            geometry = FootprintGeometry(**footprint_test_data[0])
+            assert not await service.set_footprint("B", geometry)
+            assert not await service.set_footprint("UNKNOWN_ZONE", geometry)
+            assert await service.get_footprint(zone_ids[0]) == geometry
+            assert await service.get_footprint("UNKNOWN_ZONE") is None
+
+        # Индекс, перечитанный из БД, отвечает так же, как обновленный при записи
+        for reload in (False, True):
+            if reload:
+                coverage_index.invalidate()
+            async with db_session.begin():
+                (zone,) = await service.get_coverage_zones_at_point(37.62, 55.75)
+                assert zone.id == zone_ids[0]
+                assert zone.transmitter_type == test_create_data[0].get(
+                    "transmitter_type"
+                )
+                assert zone.satellite_code == satellite_test_date[0].get(
+                    "international_code"
+                )
+                zones = await service.get_coverage_zones_at_point(-175.0, 0.0)
+                assert [zone.id for zone in zones] == [zone_ids[1]]
+                assert await service.get_coverage_zones_at_point(0.0, 0.0) == []
+                zones = await service.get_coverage_zones_in_box(100, -30, -100, 30)
+                assert [zone.id for zone in zones] == [zone_ids[1]]
+                zones = await service.get_coverage_zones_in_box(-180, -90, 180, 90)
+                assert [zone.id for zone in zones] == sorted(zone_ids)
+
+        async with db_session.begin():
+            assert await service.delete_footprint(zone_ids[1])
+        async with db_session.begin():
+            assert not await service.delete_footprint(zone_ids[1])
+            assert await service.get_coverage_zones_at_point(-175.0, 0.0) == []
+            assert await service.get_footprint(zone_ids[1]) is None
+            assert await service.set_footprint(
+                zone_ids[1], FootprintGeometry(**footprint_test_data[1])
+            )
+
+    @pytest.mark.asyncio
+    async def test_theoretical_footprint(self, db_session):
+        service = create_coverage_zone_service(db_session)
+        satellite_service = create_satellite_service(db_session)
+        zone_id = test_create_data[0].get("id")
+        satellite_code = satellite_test_date[0].get("international_code")
+        request = TheoreticalFootprintRequest()
+        async with db_session.begin():
+            # Долгота спутника еще неизвестна
+            assert (
+                await service.get_theoretical_footprint(satellite_code, request) is None
+            )
+            assert await service.generate_footprint(zone_id, request) is None
+            assert await service.get_theoretical_footprint("B", request) is None
+        async with db_session.begin():
+            assert await satellite_service.create_satellite_characteristic(
+                SatelliteCharacteristicCreate(**satellite_characteristic_test_date[0])
+            )
+
+        footprint_cache.clear()
+        async with db_session.begin():
+            footprint = await service.get_theoretical_footprint(satellite_code, request)
+        assert footprint.longitude == satellite_characteristic_test_date[0].get(
+            "longitude"
+        )
+        assert footprint.min_elevation == settings.FOOTPRINT_MIN_ELEVATION
+        assert footprint.eirp_contours == []
+        assert len(footprint.visibility.coordinates[0]) == settings.FOOTPRINT_POINTS + 1
+
+        beam = SpotBeam(
+            boresight_latitude=30,
+            boresight_longitude=110,
+            beamwidth=2,
+            peak_eirp_dbw=52,
+            eirp_levels_dbw=[49, 44],
+        )
+        request = TheoreticalFootprintRequest(min_elevation=10, beam=beam)
+        async with db_session.begin():
+            footprint = await service.get_theoretical_footprint(satellite_code, request)
+        assert [contour.eirp_dbw for contour in footprint.eirp_contours] == [49, 44]
+        hits = footprint_cache.hits
+        async with db_session.begin():
+            assert (
+                await service.get_theoretical_footprint(satellite_code, request)
+                == footprint
+            )
+        assert footprint_cache.hits == hits + 1 and len(footprint_cache) == 2
+
+        # Контур зоны - изолиния наименьшего уровня ЭИИМ, по нему ищется покрытие
+        coverage_index.invalidate()
+        async with db_session.begin():
+            geometry = await service.generate_footprint(zone_id, request)
+        assert geometry == footprint.eirp_contours[1].geometry
+        async with db_session.begin():
+            assert await service.get_footprint(zone_id) == geometry
+            zones = await service.get_coverage_zones_at_point(110.0, 30.0)
+            assert [zone.id for zone in zones] == [zone_id]
+            assert await service.get_coverage_zones_at_point(37.62, 55.75) == []
+
+        beam.boresight_longitude = -60
+        with pytest.raises(ValueError):
+            async with db_session.begin():
+                await service.get_theoretical_footprint(satellite_code, request)
+
+    @pytest.mark.asyncio
+    async def test_assign_regions_from_footprint(self, db_session):
+        service = create_coverage_zone_service(db_session)
+        region_service = create_region_service(db_session)
+        zone_id = test_create_data[0].get("id")
+        async with db_session.begin():
+            china = await region_service.create_region(
+                RegionCreate(name_region="China")
+            )
+        subregions = dict()
+        for name in ("Hubei", "Xinjiang"):
+            async with db_session.begin():
+                subregions[name] = await region_service.create_subregion(
+                    SubregionCreate(name_subregion=name, id_region=china.id)
+                )
+        async with db_session.begin():
+            russia = await region_service.get_region_by_name("Russia")
+        # Контур зоны - изолиния луча вокруг точки 110 в.д., 30 с.ш.
+        boundaries = [
+            (region_service.set_region_boundary, china.id, (100, 20, 120, 45)),
+            (region_service.set_region_boundary, russia.id, (30, 50, 180, 75)),
+            (
+                region_service.set_subregion_boundary,
+                subregions["Hubei"].id,
+                (108, 29, 116, 33),
+            ),
+            (
+                region_service.set_subregion_boundary,
+                subregions["Xinjiang"].id,
+                (75, 35, 95, 49),
+            ),
+        ]
+        for set_boundary, object_id, bounds in boundaries:
+            async with db_session.begin():
+                assert await set_boundary(object_id, square_geometry(*bounds))
+        async with db_session.begin():
+            assert not await region_service.set_region_boundary(
+                9999, square_geometry(0, 0, 1, 1)
+            )
+            assert await region_service.get_region_boundary(
+                china.id
+            ) == square_geometry(100, 20, 120, 45)
+            assert await region_service.get_subregion_boundary(9999) is None
+
+        # Индексы границ, перечитанные из БД, отвечают так же
+        for reload, added in ((False, 1), (True, 0)):
+            if reload:
+                region_boundary_index.invalidate()
+                subregion_boundary_index.invalidate()
+            async with db_session.begin():
+                assignment = await service.assign_regions_from_footprint(zone_id)
+            assert assignment.region_ids == [china.id]
+            assert assignment.subregion_ids == [subregions["Hubei"].id]
+            # Повторная привязка ничего не добавляет
+            assert assignment.regions_added == added
+            assert assignment.subregions_added == added
+        async with db_session.begin():
+            assert await service.assign_regions_from_footprint("UNKNOWN_ZONE") is None
+            assert await service.assign_regions_from_footprint("B") is None
+
+        async with db_session.begin():
+            regions = await service.get_region_list_by_id(zone_id)
+        assert sorted(region.name_region for region in regions) == [
+            "China",
+            "New Zeland",
+            "Russia",
+            "USA",
+        ]
+        (region,) = [region for region in regions if region.id == china.id]
+        assert [subregion.name_subregion for subregion in region.subregion_list] == [
+            "Hubei"
+        ]
+
 
 class TestDelete:
     @pytest.mark.asyncio
@@ -465,6 +674,10 @@ class TestDelete:
             coverage_zone_list = await service.get_coverage_zones(PaginationBase())
         for zone in coverage_zone_list:
             assert await service.delete_coverage_zone(zone.id)
+        # Контуры удаляются вместе с зонами
+        coverage_index.invalidate()
+        async with db_session.begin():
+            assert await service.get_coverage_zones_in_box(-180, -90, 180, 90) == []
 
     async def test_check_count_coverage_zone_3(self, db_session):
         service = create_coverage_zone_service(
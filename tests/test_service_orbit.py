@@ -0,0 +1,288 @@
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sgp4.api import Satrec, jday
+
+from pathlib import Path
+
+from app.core import InvalidTLEError, settings
+from app.orbit import ElementSetReader
+from app.service import (
+    create_orbit_service,
+    create_satellite_service,
+    create_country_service,
+)
+from app.schemas import (
+    CountryCreate,
+    SatelliteCreate,
+    TLELines,
+    OrbitalElementsBase,
+    ElementSetFormat,
+    GroundStation,
+    PassPredictionRequest,
+    ConjunctionScreeningRequest,
+)
+from tests.test_data import orbit_satellite_test_data, tle_test_data
+
+epoch = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+ELEMENT_SETS_DIR = Path(__file__).parent / "test" / "element_sets"
+
+
+class TestOrbit:
+    @pytest.mark.asyncio
+    async def test_create_satellites(self, db_session):
+        country_service = create_country_service(db_session)
+        service = create_satellite_service(db_session)
+        async with db_session.begin():
+            country = await country_service.create_country(
+                CountryCreate(abbreviation="OR", full_name="Орбита")
+            )
+            assert country is not None
+        for satellite_data in orbit_satellite_test_data:
+            async with db_session.begin():
+                assert await service.create_satellite_base(
+                    SatelliteCreate(**satellite_data, country_id=country.id)
+                )
+
+    @pytest.mark.asyncio
+    async def test_set_elements_from_tle(self, db_session):
+        service = create_orbit_service(db_session)
+        for satellite_data, (line1, line2) in zip(
+            orbit_satellite_test_data, tle_test_data
+        ):
+            code = satellite_data["international_code"]
+            async with db_session.begin():
+                assert await service.get_elements(code) is None
+                elements = await service.set_elements_from_tle(
+                    code, TLELines(line1=line1, line2=line2)
+                )
+                assert elements is not None
+                assert elements.international_code == code
+        async with db_session.begin():
+            elements = await service.get_elements("1998-067A")
+            assert elements.inclination == pytest.approx(51.6416)
+            assert elements.mean_motion == pytest.approx(15.72125391)
+            assert await service.get_elements("UNKNOWN") is None
+
+    @pytest.mark.asyncio
+    async def test_set_elements_invalid(self, db_session):
+        service = create_orbit_service(db_session)
+        line1, line2 = tle_test_data[1]
+        async with db_session.begin():
+            with pytest.raises(InvalidTLEError):
+                await service.set_elements_from_tle(
+                    "1998-067A", TLELines(line1=line1, line2=line2)
+                )
+            with pytest.raises(InvalidTLEError):
+                await service.set_elements_from_tle(
+                    "2005-041A", TLELines(line1=line1[:-1] + "1", line2=line2)
+                )
+            assert (
+                await service.set_elements_from_tle(
+                    "UNKNOWN", TLELines(line1=line1, line2=line2)
+                )
+                is None
+            )
+
+    @pytest.mark.asyncio
+    async def test_ingest_element_sets(self, db_session):
+        service = create_orbit_service(db_session)
+        satellite_service = create_satellite_service(db_session)
+        country_service = create_country_service(db_session)
+        async with db_session.begin():
+            country = await country_service.get_by_abbreviation("OR")
+        async with db_session.begin():
+            assert await satellite_service.create_satellite_base(
+                SatelliteCreate(
+                    international_code="2017-073A",
+                    name_satellite="NOAA 20",
+                    norad_id=43013,
+                    launch_date=date(2017, 11, 18),
+                    country_id=country.id,
+                )
+            )
+        batch_size = settings.ORBIT_INGEST_BATCH_SIZE
+        settings.ORBIT_INGEST_BATCH_SIZE = 2
+        try:
+            with open(ELEMENT_SETS_DIR / "elements.json", "rb") as stream:
+                report = await service.ingest_element_sets(
+                    ElementSetReader(stream, ElementSetFormat.OMM_JSON)
+                )
+        finally:
+            settings.ORBIT_INGEST_BATCH_SIZE = batch_size
+        assert report.received == 3
+        assert report.invalid == 1
+        assert report.unmatched == 0
+        assert report.skipped == 2
+        assert report.upserted == 1
+        assert report.records_per_second > 0
+        elements = await service.get_elements("2017-073A")
+        assert elements.inclination == pytest.approx(98.72)
+
+        with open(ELEMENT_SETS_DIR / "elements.xml", "rb") as stream:
+            report = await service.ingest_element_sets(
+                ElementSetReader(stream, ElementSetFormat.OMM_XML)
+            )
+        assert (report.received, report.skipped, report.upserted) == (3, 3, 0)
+        await db_session.commit()
+        async with db_session.begin():
+            assert await satellite_service.delete_satellite("2017-073A")
+
+    @pytest.mark.asyncio
+    async def test_catalog_positions(self, db_session):
+        service = create_orbit_service(db_session)
+        jd, fr = jday(epoch.year, epoch.month, epoch.day, epoch.hour, 0, 0)
+        async with db_session.begin():
+            for _ in range(2):
+                catalog = await service.get_catalog_positions(epoch)
+                assert catalog.epoch == epoch
+                assert [item.international_code for item in catalog.items] == [
+                    "1998-067A",
+                    "2005-041A",
+                ]
+                for item, (line1, line2) in zip(catalog.items, tle_test_data):
+                    assert item.error is None
+                    _, position, velocity = Satrec.twoline2rv(line1, line2).sgp4(jd, fr)
+                    assert np.allclose(item.position, position, atol=1e-6)
+                    assert np.allclose(item.velocity, velocity, atol=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_predict_passes(self, db_session):
+        service = create_orbit_service(db_session)
+        async with db_session.begin():
+            iss, unknown = await service.predict_passes(
+                PassPredictionRequest(
+                    station=GroundStation(latitude=55.75, longitude=37.62),
+                    start=datetime(2008, 9, 20, 12, 0),
+                    duration_hours=24,
+                    international_codes=["1998-067A", "UNKNOWN"],
+                )
+            )
+            assert iss.international_code == "1998-067A"
+            assert iss.visible and not iss.geostationary
+            assert iss.look_angle is None
+            assert len(iss.passes) == 3
+            for satellite_pass in iss.passes:
+                assert (
+                    satellite_pass.rise.time
+                    < satellite_pass.culmination.time
+                    < satellite_pass.set.time
+                )
+                assert satellite_pass.rise.elevation == pytest.approx(10, abs=0.1)
+                assert satellite_pass.culmination.elevation > 10
+            assert unknown.international_code == "UNKNOWN"
+            assert unknown.error == "Orbital elements not found"
+            assert not unknown.visible
+
+            # Геостационарный спутник над Тихим океаном виден из Гонолулу
+            # весь интервал и не виден из Москвы
+            for station, visible in (
+                (GroundStation(latitude=21.31, longitude=-157.86), True),
+                (GroundStation(latitude=55.75, longitude=37.62), False),
+            ):
+                (geo,) = await service.predict_passes(
+                    PassPredictionRequest(
+                        station=station,
+                        start=epoch,
+                        international_codes=["2005-041A"],
+                    )
+                )
+                assert geo.geostationary
+                assert geo.visible is visible
+                assert geo.look_angle.time == epoch
+                assert (geo.look_angle.elevation > 10) is visible
+                if visible:
+                    (satellite_pass,) = geo.passes
+                    assert satellite_pass.rise is None and satellite_pass.set is None
+                    assert satellite_pass.culmination.time < epoch + timedelta(days=1)
+
+    @pytest.mark.asyncio
+    async def test_screen_conjunctions(self, db_session):
+        service = create_orbit_service(db_session)
+        satellite_service = create_satellite_service(db_session)
+        country_service = create_country_service(db_session)
+        # Копия МКС с другим наклонением: орбиты пересекаются в узлах,
+        # и спутники проходят их одновременно дважды за виток
+        async with db_session.begin():
+            country = await country_service.get_by_abbreviation("OR")
+            elements = await service.get_elements("1998-067A")
+        async with db_session.begin():
+            assert await satellite_service.create_satellite_base(
+                SatelliteCreate(
+                    international_code="1998-067B",
+                    name_satellite="ISS copy",
+                    norad_id=25545,
+                    launch_date=date(1998, 11, 20),
+                    country_id=country.id,
+                )
+            )
+        async with db_session.begin():
+            assert await service.set_elements(
+                "1998-067B",
+                OrbitalElementsBase(
+                    **elements.model_dump(
+                        exclude={"international_code", "inclination"}
+                    ),
+                    inclination=elements.inclination + 0.5,
+                ),
+            )
+        # Сервис сам фиксирует чтение элементов до расчета и результаты после
+        report = await service.screen_conjunctions(
+            ConjunctionScreeningRequest(
+                start=datetime(2008, 9, 20, 12, 0), days=0.125, threshold_km=10
+            )
+        )
+        assert report.satellites == 3
+        # GEO-спутник отсеян по диапазону высот
+        assert report.screened == 2
+        assert report.conjunctions >= 3
+
+        async with db_session.begin():
+            conjunctions = await service.get_conjunctions("1998-067A")
+            assert len(conjunctions) == report.conjunctions
+            assert conjunctions == await service.get_conjunctions("1998-067B")
+            for conjunction in conjunctions:
+                assert conjunction.international_code == "1998-067A"
+                assert conjunction.other_international_code == "1998-067B"
+                assert conjunction.miss_distance_km < 5
+                assert report.start <= conjunction.tca <= report.end
+            # Узлы проходятся через половину периода обращения
+            half_period = timedelta(days=0.5 / elements.mean_motion)
+            for previous, current in zip(conjunctions, conjunctions[1:]):
+                assert abs((current.tca - previous.tca) - half_period) < timedelta(
+                    minutes=1
+                )
+            assert await service.get_conjunctions("2005-041A") == []
+            assert await service.get_conjunctions("B") is None
+
+        # Сближения со спутником, удаленным за время скрининга, не сохраняются
+        async with db_session.begin():
+            row = conjunctions[0].model_dump()
+            assert (
+                await service.conjunction_repository.replace_all(
+                    [row, dict(row, other_international_code="2000-000X")]
+                )
+                == 1
+            )
+
+        async with db_session.begin():
+            assert await satellite_service.delete_satellite("1998-067B")
+        async with db_session.begin():
+            assert await service.get_conjunctions("1998-067A") == []
+
+    @pytest.mark.asyncio
+    async def test_delete_satellites(self, db_session):
+        service = create_satellite_service(db_session)
+        orbit_service = create_orbit_service(db_session)
+        country_service = create_country_service(db_session)
+        for satellite_data in orbit_satellite_test_data:
+            async with db_session.begin():
+                assert await service.delete_satellite(
+                    satellite_data["international_code"]
+                )
+        async with db_session.begin():
+            catalog = await orbit_service.get_catalog_positions(epoch)
+            assert catalog.items == []
+            country = await country_service.get_by_abbreviation("OR")
+            assert await country_service.delete_country(country.id)
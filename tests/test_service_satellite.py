@@ -5,7 +5,12 @@ from tests.test_data import (
     satellite_characteristic_test_date,
     satellite_characteristic_test_date_1,
 )
-from app.service import create_satellite_service, create_country_service
+from app.service import (
+    create_satellite_service,
+    create_country_service,
+    satellite_cache,
+    geo_slot_index,
+)
 from app.schemas import (
     PaginationBase,
     CountryCreate,
@@ -13,6 +18,9 @@ from app.schemas import (
     SatelliteCharacteristicCreate,
     SatelliteUpdate,
     SatelliteCharacteristicUpdate,
+    SatelliteBulkCreate,
+    BulkItemStatus,
+    TerminalLookAngleRequest,
 )
 
 
@@ -262,6 +270,88 @@ class TestUpdate:
             assert sat_char_db.manufacturer == sat_char.get("manufacturer")
             assert sat_char_db.model == update_data.get("model")
 
+    @pytest.mark.asyncio
+    async def test_geo_slots(self, db_session):
+        service = create_satellite_service(db_session)
+        code_1 = satellite_characteristic_test_date[0].get("international_code")
+        code_2 = satellite_characteristic_test_date[1].get("international_code")
+        geo_slot_index.invalidate()
+        async with db_session.begin():
+            slots = await service.get_satellites_in_longitude_range(100, 150)
+            assert [slot.international_code for slot in slots] == [code_1]
+            slots = await service.get_satellites_in_longitude_range(170, -170)
+            assert [slot.international_code for slot in slots] == [code_2]
+            slots = await service.get_nearest_satellites(-175, 5)
+            assert [slot.international_code for slot in slots] == [code_2, code_1]
+            assert slots[0].distance == pytest.approx(13.9)
+
+            # Терминалы на экваторе под каждым из спутников
+            look_angles = await service.get_terminal_look_angles(
+                TerminalLookAngleRequest(
+                    latitudes=[0, 0],
+                    longitudes=[112.1, 171.1],
+                    international_codes=[code_1, "UNKNOWN", code_2, code_1],
+                )
+            )
+            assert look_angles.international_codes == [code_1, code_2]
+            assert look_angles.satellite_longitudes == [112.1, 171.1]
+            assert look_angles.not_found == ["UNKNOWN"]
+            assert look_angles.elevation[0][0] == look_angles.elevation[1][1] == 90
+            assert look_angles.range_km[0][0] == pytest.approx(35786.03, abs=0.01)
+            assert look_angles.elevation[0][1] < 90
+        assert not geo_slot_index.is_stale()
+
+        async with db_session.begin():
+            assert await service.update_satellite_characteristic(
+                code_1, SatelliteCharacteristicUpdate(longitude=-179.5)
+            )
+        async with db_session.begin():
+            slots = await service.get_satellites_in_longitude_range(170, -170)
+            assert [slot.longitude for slot in slots] == [171.1, -179.5]
+            assert await service.update_satellite_characteristic(
+                code_1,
+                SatelliteCharacteristicUpdate(
+                    longitude=satellite_characteristic_test_date[0].get("longitude")
+                ),
+            )
+        assert not geo_slot_index.is_stale()
+
+    @pytest.mark.asyncio
+    async def test_complete_info_cache(self, db_session):
+        service = create_satellite_service(db_session)
+        international_code = satellite_characteristic_test_date[0].get(
+            "international_code"
+        )
+        async with db_session.begin():
+            await satellite_cache.delete(international_code)
+            misses = satellite_cache.get_stats().misses
+            sat_data = await service.get_satellite_complete_info(international_code)
+            assert sat_data is not None
+            assert satellite_cache.get_stats().misses == misses + 1
+            hits = satellite_cache.get_stats().hits
+            assert await service.get_satellite_complete_info(international_code) == (
+                sat_data
+            )
+            assert satellite_cache.get_stats().hits == hits + 1
+
+            update_data = {"rocket": "Proton-M"}
+            assert await service.update_satellite_characteristic(
+                international_code, SatelliteCharacteristicUpdate(**update_data)
+            )
+        async with db_session.begin():
+            sat_data = await service.get_satellite_complete_info(international_code)
+            assert sat_data.rocket == update_data.get("rocket")
+            update_data = {"name_satellite": "Viking 2"}
+            assert await service.update_satellite(
+                international_code, SatelliteUpdate(**update_data)
+            )
+        async with db_session.begin():
+            sat_data = await service.get_satellite_complete_info(international_code)
+            assert sat_data.name_satellite == update_data.get("name_satellite")
+            assert await service.delete_characteristic(international_code)
+        async with db_session.begin():
+            assert await service.get_satellite_complete_info(international_code) is None
+
 
 class TestDelete:
     @pytest.mark.asyncio
@@ -276,6 +366,63 @@ class TestDelete:
         async with db_session.begin():
             assert len(await service.get_satellites(PaginationBase())) != 0
 
+    @pytest.mark.asyncio
+    async def test_create_satellites_bulk(self, db_session):
+        service = create_satellite_service(db_session)
+        async with db_session.begin():
+            country_id = (
+                await create_country_service(db_session).get_countries(PaginationBase())
+            )[0].id
+            existing = (await service.get_satellites(PaginationBase()))[0]
+
+        def bulk_item(
+            code: str, number: int, characteristic_code: str = None, **satellite_fields
+        ) -> dict:
+            satellite = {
+                "international_code": code,
+                "name_satellite": f"Bulk-{number}",
+                "norad_id": 900000 + number,
+                "launch_date": "2020-01-01",
+                "country_id": country_id,
+                **satellite_fields,
+            }
+            characteristic = dict(
+                satellite_characteristic_test_date[0],
+                international_code=characteristic_code or code,
+            )
+            return {"satellite": satellite, "characteristic": characteristic}
+
+        items = [
+            bulk_item("BULK-0001", 1),
+            bulk_item("BULK-0002", 2),
+            bulk_item(existing.international_code, 3),
+            bulk_item("BULK-0001", 4),
+            bulk_item("BULK-0005", 5, country_id=987654),
+            bulk_item("BULK-0006", 6, characteristic_code="BULK-0007"),
+        ]
+        async with db_session.begin():
+            results = await service.create_satellites_bulk(
+                SatelliteBulkCreate(items=items)
+            )
+        assert [result.status for result in results] == [
+            BulkItemStatus.CREATED,
+            BulkItemStatus.CREATED,
+            BulkItemStatus.CONFLICT,
+            BulkItemStatus.CONFLICT,
+            BulkItemStatus.INVALID,
+            BulkItemStatus.INVALID,
+        ]
+        assert [result.international_code for result in results][:2] == [
+            "BULK-0001",
+            "BULK-0002",
+        ]
+        async with db_session.begin():
+            satellite = await service.get_satellite_complete_info("BULK-0002")
+            assert satellite is not None
+            assert satellite.name_satellite == "Bulk-2"
+            assert satellite.rocket == satellite_characteristic_test_date[0]["rocket"]
+            assert await service.get_satellite_by_id("BULK-0005") is None
+
     @pytest.mark.asyncio
     async def test_delete_satellite(self, db_session):
         service = create_satellite_service(db_session)
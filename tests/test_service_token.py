@@ -1,3 +1,4 @@
+import jwt
 import pytest
 from app.service import verify_password
 from app.service import create_token_service, create_user_service
@@ -155,6 +156,37 @@ class TestTokenService:
             assert not await service.delete_refresh_token("fhhehcd.eihwohg")
             assert not await service.delete_refresh_token(invalid_refresh_token)
 
+    @pytest.mark.asyncio
+    async def test_get_token_by_jti(self, db_session):
+        async with db_session.begin():
+            service = create_token_service(db_session)
+            user_service = create_user_service(db_session)
+            user_in_db = await user_service.get_user_by_email(user_data.get("email"))
+            user_id = Object_ID(id=user_in_db.id)
+            refresh_token = (
+                await service.create_refresh_token({}, user_id)
+            ).refresh_token
+            payload = jwt.decode(
+                refresh_token,
+                settings.REFRESH_TOKEN_SECRET_KEY,
+                algorithms=[settings.ALGORITHM],
+            )
+            token_db = await service.repository.get_refresh_token_by_jti(
+                payload.get("jti")
+            )
+            assert token_db is not None
+            assert token_db.user_id == user_in_db.id
+            assert await service.repository.get_refresh_token_by_jti("unknown") is None
+
+            other_payload = dict(payload, sub=str(user_in_db.id + 1))
+            assert await service._get_token(refresh_token, other_payload) is None
+            assert await service._get_token(refresh_token, payload) == token_db
+            assert await service.delete_refresh_token(refresh_token)
+            assert (
+                await service.repository.get_refresh_token_by_jti(payload.get("jti"))
+                is None
+            )
+
     @pytest.mark.asyncio
     async def test_delete(self, db_session):
         async with db_session.begin():
@@ -1,6 +1,13 @@
+import asyncio
 import pytest
 
-from app.service import verify_password
+from app.service import (
+    verify_password,
+    get_hash_async,
+    verify_password_async,
+    password_hasher,
+    user_status_cache,
+)
 from app.service import create_user_service
 from app.schemas import (
     UserCreate,
@@ -10,8 +17,11 @@ from app.schemas import (
     AuthRequest,
     UserUpdate,
     UserPassword,
+    Object_ID,
 )
+from app.db import TokenRepository
 from app.core import (
+    entity_counters,
     settings,
     AdminPasswordRequiredError,
     InvalidPasswordError,
@@ -221,3 +231,72 @@ class TestUserService:
         assert user.name == "Dima"
         assert user.role == UserRole.USER
         assert user.email == "dimasik12092@mail.ru"
+
+    async def test_user_auth_status_cache(self, db_session):
+        service = create_user_service(db_session)
+        user_create = UserCreate(**user_data)
+        assert await service.create_user(user_create=user_create, admin_password=None)
+        user_id = await service._get_user_id_by_email(user_data.get("email"))
+        user_status = await service.get_user_auth_status(user_id)
+        assert user_status.exists
+        assert user_status.role == UserRole.USER.value
+        hits = user_status_cache.hits
+        assert await service.get_user_auth_status(user_id) == user_status
+        assert user_status_cache.hits == hits + 1
+
+        auth_request = AuthRequest(
+            password=user_data.get("password"), email=user_data.get("email")
+        )
+        assert await service.update_user_data(UserUpdate(name="Oleg"), auth_request)
+        assert user_status_cache.get(user_id.id) is None
+        assert (await service.get_user_auth_status(user_id)).exists
+
+        assert await service.delete_user(user_data.get("email"))
+        assert user_status_cache.get(user_id.id) is None
+        assert not (await service.get_user_auth_status(user_id)).exists
+
+    async def test_delete_user_counters(self, db_session):
+        service = create_user_service(db_session)
+        user_create = UserCreate(**user_data)
+        assert await service.create_user(user_create=user_create, admin_password=None)
+        await db_session.commit()
+        entity_counters.invalidate()
+        count = await service.repository.get_count()
+        await TokenRepository(db_session).get_count()
+        await db_session.commit()
+        assert entity_counters.get("refresh_tokens") is not None
+
+        assert await service.delete_user(user_data.get("email"))
+        assert entity_counters.get("user") == count - 1
+        # Токены удалены каскадом в БД, их счетчик сверяется заново
+        assert entity_counters.get("refresh_tokens") is None
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_pool():
+    hashed_password = await get_hash_async("Password_123")
+    assert verify_password("Password_123", hashed_password)
+    number_of_checks = password_hasher.max_workers * 2
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    results = await asyncio.gather(
+        *(
+            verify_password_async("Password_123", hashed_password)
+            for _ in range(number_of_checks)
+        )
+    )
+    ticker_task.cancel()
+    assert all(results)
+    assert ticks > number_of_checks
+    stats = password_hasher.get_stats()
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth >= number_of_checks - password_hasher.max_workers
+    assert stats.completed >= number_of_checks + 1